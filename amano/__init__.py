@@ -1,4 +1,7 @@
+from .async_table import AsyncTable
 from .attribute import Attribute, AttributeType
+from .capacity import CapacityLedger, CapacityUsage, capacity_scope
+from .cursor import AsyncCursor, Page
 from .index import (
     GlobalSecondaryIndex,
     Index,
@@ -7,8 +10,11 @@ from .index import (
     PrimaryKey,
 )
 from .item import AttributeMapping, Item
-from .table import Cursor, Table
+from .pool import ClientPool
+from .table import Cursor, MissingKey, Table
 from .table_schema import TableSchema
+from .transaction import async_transact_get, transact_get
+from .transport import AsyncClientTransport, AsyncTransport, ThreadPoolTransport
 
 __all__ = [
     "Attribute",
@@ -16,11 +22,24 @@ __all__ = [
     "Item",
     "AttributeMapping",
     "Table",
+    "ClientPool",
     "Cursor",
+    "Page",
+    "MissingKey",
     "Index",
     "TableSchema",
     "PrimaryKey",
     "GlobalSecondaryIndex",
     "LocalSecondaryIndex",
     "NamedIndex",
+    "transact_get",
+    "AsyncTable",
+    "AsyncCursor",
+    "AsyncTransport",
+    "ThreadPoolTransport",
+    "AsyncClientTransport",
+    "async_transact_get",
+    "CapacityLedger",
+    "CapacityUsage",
+    "capacity_scope",
 ]
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError, ParamValidationError
+
+from .attribute import Attribute
+from .base_table import BaseTable, I, KeyExpression
+from .batch import AsyncBatchWriter
+from .capacity import Operation
+from .condition import Condition
+from .constants import (
+    BATCH_GET_ITEM_LIMIT,
+    BATCH_MAX_RETRIES,
+    TRANSACTION_MAX_RETRIES,
+)
+from .cursor import AsyncCursor
+from .errors import DeleteItemError, PutItemError, ReadError, UpdateItemError
+from .index import Index
+from .item import ItemState, get_item_state
+from .transaction import AsyncTransaction
+from .transport import AsyncTransport
+from .utils import MissingKey, backoff_delay, chunks, key_identity
+
+
+class AsyncTable(BaseTable[I]):
+    """
+    Asynchronous version of a table, which sends requests through
+    an async transport, e.g. `ThreadPoolTransport` over a botocore client.
+
+    Table metadata is retrieved when the table is awaited (or `load` is
+    called), e.g. `tracks = await AsyncTable[Track](transport, "tracks")`.
+    Awaitable operations load it on the first use as well.
+    """
+
+    def __init__(self, transport: AsyncTransport, table_name: str):
+        super().__init__(table_name)
+        self._transport = transport
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def transport(self) -> AsyncTransport:
+        return self._transport
+
+    async def load(self) -> AsyncTable[I]:
+        """
+        Retrieves table metadata with `DescribeTable`, only once.
+
+        :return: the table itself
+        :raises ValueError: when the table does not exist
+        """
+        if self._table_meta:
+            return self
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._table_meta:
+                return self
+            try:
+                response = await self._transport.request(
+                    "describe_table", TableName=self._table_name
+                )
+            except ClientError as error:
+                raise ValueError(
+                    f"Table with name {self._table_name} was not found"
+                ) from error
+            self._load_table_meta(response)
+
+        return self
+
+    def __await__(self) -> Generator[Any, None, AsyncTable[I]]:
+        return self.load().__await__()
+
+    def scan(
+        self,
+        condition=None,
+        limit: int = 0,
+        use_index: Union[Index, str] = None,
+        consistent_read: bool = False,
+        start_token: str = None,
+    ) -> AsyncCursor[I]:
+        self._ensure_loaded()
+        return AsyncCursor(
+            self._item_class,
+            self._build_scan_query(
+                condition, limit, use_index, consistent_read
+            ),
+            partial(self._transport.request, "scan"),
+            start_token,
+            ledger=self._capacity,
+        )
+
+    def query(
+        self,
+        key_condition,
+        filter_condition=None,
+        limit: int = 0,
+        use_index: Union[Index, str] = None,
+        consistent_read: bool = False,
+        start_token: str = None,
+    ) -> AsyncCursor[I]:
+        self._ensure_loaded()
+        return AsyncCursor(
+            self._item_class,
+            self._build_query(
+                key_condition,
+                filter_condition,
+                limit,
+                use_index,
+                consistent_read,
+            ),
+            partial(self._transport.request, "query"),
+            start_token,
+            ledger=self._capacity,
+        )
+
+    async def save(self, item: I, condition: Condition = None) -> bool:
+        item_state = get_item_state(item)
+        if item_state == ItemState.NEW:
+            return await self.put(item, condition)
+
+        if item_state == ItemState.DIRTY:
+            return await self.update(item, condition)
+
+        return False
+
+    async def put(self, item: I, condition: Condition = None) -> bool:
+        """
+        Creates or overrides item in a table for the same PK.
+
+        :param item: an item to be stored
+        :param condition: an optional condition on which to put
+        :return: `True` on success or `False` on condition failure
+        :raises amano.errors.PuItemError: when validation or client fails
+        """
+        await self.load()
+        try:
+            result = await self._transport.request(
+                "put_item",
+                **self._build_put_query(item, condition),
+                ReturnConsumedCapacity="INDEXES",
+            )
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            if error.get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise PutItemError.for_client_error(error["Message"]) from e
+        except ParamValidationError as e:
+            raise PutItemError.for_validation_error(item, str(e)) from e
+
+        return self._complete_write(Operation.PUT_ITEM, item, result)
+
+    async def update(self, item: I, condition: Condition = None) -> bool:
+        await self.load()
+        item_state = get_item_state(item)
+        if item_state == ItemState.CLEAN:
+            return False
+
+        if item_state == ItemState.NEW:
+            raise UpdateItemError.for_new_item(item)
+
+        try:
+            result = await self._transport.request(
+                "update_item",
+                **self._build_update_query(item, condition),
+                ReturnConsumedCapacity="INDEXES",
+            )
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            if error.get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise UpdateItemError.for_client_error(error["Message"]) from e
+
+        return self._complete_write(Operation.UPDATE_ITEM, item, result)
+
+    async def delete(self, item: I, condition: Condition = None) -> bool:
+        await self.load()
+        try:
+            result = await self._transport.request(
+                "delete_item",
+                **self._build_delete_query(item, condition),
+                ReturnConsumedCapacity="INDEXES",
+            )
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            if error.get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise DeleteItemError.for_client_error(error["Message"]) from e
+        except ParamValidationError as e:
+            raise DeleteItemError.for_validation_error(item, str(e)) from e
+
+        return self._complete_write(Operation.DELETE_ITEM, item, result)
+
+    async def get(self, *keys: Any, consistent_read: bool = False) -> I:
+        await self.load()
+        key_query, query = self._build_get_query(keys, consistent_read)
+        try:
+            result = await self._transport.request("get_item", **query)
+        except ClientError as e:
+            raise ReadError.for_client_error(
+                e.response['Error']['Message']
+            ) from e
+
+        return self._complete_get(key_query, result)
+
+    async def batch_get(
+        self,
+        keys: Iterable[Union[Any, Tuple[Any, ...]]],
+        consistent_read: bool = False,
+        fields: Iterable[Union[str, Attribute]] = None,
+        on_missing: MissingKey = MissingKey.SKIP,
+        max_retries: int = BATCH_MAX_RETRIES,
+    ) -> List[Optional[I]]:
+        """
+        Retrieves multiple items by their primary keys with `BatchGetItem`,
+        chunks of keys are requested concurrently.
+
+        :return: items in the order of passed keys
+        :raises amano.errors.ReadError: when client fails or retries
+            are exhausted
+        """
+        await self.load()
+        key_queries, key_expressions = self._build_batch_get_keys(keys)
+        projection = self._build_projection(fields)
+        chunk_records = await asyncio.gather(
+            *[
+                self._batch_get_chunk(
+                    keys_chunk, projection, consistent_read, max_retries
+                )
+                for keys_chunk in chunks(key_expressions, BATCH_GET_ITEM_LIMIT)
+            ]
+        )
+        records: Dict[Tuple, Dict[str, Any]] = {}
+        for chunk in chunk_records:
+            for record in chunk:
+                records[key_identity(self._key_from_record(record))] = record
+
+        return self._collect_batch_get(key_queries, records, on_missing)
+
+    def batch_writer(
+        self, max_retries: int = BATCH_MAX_RETRIES
+    ) -> AsyncBatchWriter[I]:
+        """
+        Creates an asynchronous context manager which buffers put and
+        delete operations and writes them with `BatchWriteItem`.
+
+        :param max_retries: how many times `UnprocessedItems` are retried
+        :return: batch writer, flushed when the context is left
+        """
+        self._ensure_loaded()
+        return AsyncBatchWriter(self, max_retries)
+
+    def transaction(
+        self, max_retries: int = TRANSACTION_MAX_RETRIES
+    ) -> AsyncTransaction[I]:
+        """
+        Creates an asynchronous unit of work, which writes recorded
+        actions with a single `TransactWriteItems` call when the context
+        is left.
+
+        :param max_retries: how many times a transaction canceled
+            due to a conflict is retried
+        :return: transaction, executed when the context is left
+        """
+        self._ensure_loaded()
+        return AsyncTransaction(self, max_retries)
+
+    async def _batch_get_chunk(
+        self,
+        keys: List[KeyExpression],
+        projection: str,
+        consistent_read: bool,
+        max_retries: int,
+    ) -> List[Dict[str, Any]]:
+        request: Dict[str, Any] = {
+            "Keys": keys,
+            "ProjectionExpression": projection,
+            "ConsistentRead": consistent_read,
+        }
+        records: List[Dict[str, Any]] = []
+        attempt = 0
+        while True:
+            try:
+                result = await self._transport.request(
+                    "batch_get_item",
+                    RequestItems={self._table_name: request},
+                    ReturnConsumedCapacity="INDEXES",
+                )
+            except ClientError as e:
+                raise ReadError.for_client_error(
+                    e.response['Error']['Message']
+                ) from e
+            self._capacity.record(
+                Operation.BATCH_GET_ITEM, result.get("ConsumedCapacity")
+            )
+            records.extend(
+                result.get("Responses", {}).get(self._table_name, [])
+            )
+
+            unprocessed = result.get("UnprocessedKeys", {}).get(
+                self._table_name
+            )
+            if not unprocessed or not unprocessed.get("Keys"):
+                return records
+            if attempt >= max_retries:
+                raise ReadError.for_unprocessed_keys(len(unprocessed["Keys"]))
+
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+            request = {**request, "Keys": unprocessed["Keys"]}
+
+    def _ensure_loaded(self) -> None:
+        if not self._table_meta:
+            raise RuntimeError(
+                f"Metadata of the table `{self._table_name}` is not loaded, "
+                f"await the table or its `load` method first."
+            )
@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+import re
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef
+
+from .attribute import Attribute
+from .base_attribute import serialize_value
+from .capacity import CapacityLedger, Operation
+from .condition import Condition
+from .constants import (
+    ATTRIBUTE_NAME,
+    CONDITION_FUNCTION_CONTAINS,
+    CONDITION_LOGICAL_OR,
+    GLOBAL_SECONDARY_INDEXES,
+    INDEX_NAME,
+    KEY_SCHEMA,
+    KEY_TYPE,
+    KEY_TYPE_HASH,
+    LOCAL_SECONDARY_INDEXES,
+    PROJECTION,
+    PROVISIONED_THROUGHPUT,
+    SELECT_SPECIFIC_ATTRIBUTES,
+)
+from .errors import ItemNotFoundError, QueryError
+from .index import (
+    GlobalSecondaryIndex,
+    Index,
+    LocalSecondaryIndex,
+    NamedIndex,
+    PrimaryKey,
+    Projection,
+    ProvisionedThroughput,
+)
+from .item import Item, commit, diff, extract, hydrate
+from .utils import MissingKey, key_identity
+
+KeyExpression = Dict[str, AttributeValueTypeDef]
+
+I = TypeVar("I", bound=Item)
+
+
+# whole words only, so placeholders like `:name_kORx1` are not matched
+_UNSUPPORTED_KEY_OPERATORS = re.compile(
+    rf"\b(?:{CONDITION_LOGICAL_OR}|{CONDITION_FUNCTION_CONTAINS})\b"
+)
+
+
+class BaseTable(Generic[I]):
+    """
+    Table metadata and request building shared by synchronous
+    and asynchronous tables, which only differ in how requests are sent.
+    """
+
+    __item_class__: Type[I]
+
+    def __init__(self, table_name: str):
+        if not hasattr(self, "__item_class__"):
+            raise TypeError(
+                f"{self.__class__} must be parametrized with a "
+                f"subtype of {Item.__module__}.{Item.__qualname__}"
+            )
+
+        # computed eagerly, so a table shared by many threads
+        # is read-only after construction
+        self._item_class: Type[I] = getattr(self, "__item_class__")
+        self._attributes = [
+            attribute.name
+            for attribute in self._item_class.__schema__.values()  # type: ignore
+        ]
+        self._projection = ", ".join(self._attributes)
+        self._table_name = table_name
+        self._table_meta: Dict[str, Any] = {}
+        self._indexes: Dict[str, Index] = {}
+        self._capacity = CapacityLedger()
+
+    def _load_table_meta(self, response: Dict[str, Any]) -> None:
+        try:
+            self._table_meta = response["Table"]
+        except KeyError as error:
+            raise ValueError(
+                f"There was an error while retrieving "
+                f"`{self._table_name}` information."
+            ) from error
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        self._build_primary_key()
+        self._build_gsis()
+        self._build_lsis()
+
+    @property
+    def partition_key(self) -> Attribute:
+        return self._indexes[PrimaryKey.NAME].partition_key
+
+    @property
+    def sort_key(self) -> Optional[Attribute]:
+        return self._indexes[PrimaryKey.NAME].sort_key
+
+    @property
+    def capacity(self) -> CapacityLedger:
+        """
+        Capacity consumed by all operations made through this table.
+        """
+        return self._capacity
+
+    def _build_primary_key(self) -> None:
+        try:
+            index_attributes = self._get_key_attributes(
+                self._table_meta[KEY_SCHEMA]
+            )
+        except KeyError as error:
+            raise AttributeError(
+                f"Table `{self.table_name}` defines table key "
+                f"`{error}`, which was not found in the item class "
+                f"`{self._item_class}`"
+            ) from error
+        self._indexes[PrimaryKey.NAME] = PrimaryKey(**index_attributes)
+
+    def _get_key_attributes(self, key_schema) -> Dict[str, Attribute]:
+        item_schema = self._item_class.__schema__
+        index_attributes = {}
+        for attribute_definition in key_schema:
+            attribute = item_schema.find_by_name(
+                attribute_definition[ATTRIBUTE_NAME]
+            )
+            key_type = (
+                "partition_key"
+                if attribute_definition[KEY_TYPE] == KEY_TYPE_HASH
+                else "sort_key"
+            )
+            index_attributes[key_type] = attribute
+
+        return index_attributes
+
+    def _build_gsis(self) -> None:
+        if GLOBAL_SECONDARY_INDEXES not in self._table_meta:
+            return
+        for index_schema in self._table_meta[GLOBAL_SECONDARY_INDEXES]:
+            key_schema = index_schema[KEY_SCHEMA]
+            try:
+                key_attributes = self._get_key_attributes(key_schema)
+            except KeyError:
+                continue
+
+            gsi_index = GlobalSecondaryIndex(
+                index_schema[INDEX_NAME], **key_attributes
+            )
+            gsi_index.projection = Projection.from_dict(
+                index_schema[PROJECTION]
+            )
+            gsi_index.provisioned_throughput = ProvisionedThroughput.from_dict(
+                index_schema[PROVISIONED_THROUGHPUT]
+            )
+            self._indexes[index_schema[INDEX_NAME]] = gsi_index
+
+    def _build_lsis(self) -> None:
+        if LOCAL_SECONDARY_INDEXES not in self._table_meta:
+            return
+        for index_schema in self._table_meta[LOCAL_SECONDARY_INDEXES]:
+            key_schema = index_schema[KEY_SCHEMA]
+            try:
+                key_attributes = self._get_key_attributes(key_schema)
+            except KeyError:
+                continue
+            lsi_index = LocalSecondaryIndex(
+                index_schema[INDEX_NAME], **key_attributes
+            )
+            lsi_index.projection = Projection.from_dict(
+                index_schema[PROJECTION]
+            )
+            self._indexes[index_schema[INDEX_NAME]] = lsi_index
+
+    def _build_scan_query(
+        self,
+        condition=None,
+        limit: int = 0,
+        use_index: Union[Index, str] = None,
+        consistent_read: bool = False,
+    ) -> Dict[str, Any]:
+        scan_params = {
+            "TableName": self._table_name,
+            "ReturnConsumedCapacity": "INDEXES",
+            "ConsistentRead": consistent_read,
+        }
+
+        if condition:
+            if not isinstance(condition, Condition):
+                raise ValueError("`condition` is not a valid condition.")
+            scan_params["FilterExpression"] = str(condition)
+            if condition.parameters:
+                scan_params["ExpressionAttributeValues"] = serialize_value(
+                    condition.parameters
+                ).get("M")
+
+        if use_index:
+            if isinstance(use_index, str):
+                if use_index not in self.indexes:
+                    raise QueryError.for_invalid_index(use_index, condition)
+                hint_index = self.indexes[use_index]
+            else:
+                hint_index = use_index
+
+            scan_params["IndexName"] = str(hint_index)
+
+        if limit:
+            scan_params["Limit"] = limit
+
+        return scan_params
+
+    def _build_query(
+        self,
+        key_condition,
+        filter_condition=None,
+        limit: int = 0,
+        use_index: Union[Index, str] = None,
+        consistent_read: bool = False,
+    ) -> Dict[str, Any]:
+        if not isinstance(key_condition, Condition):
+            raise ValueError("`key_condition` is not a valid condition.")
+        if filter_condition and not isinstance(filter_condition, Condition):
+            raise ValueError("`filter_condition` is not a valid condition.")
+
+        key_condition_expression = str(key_condition)
+        key_attributes = list(key_condition.hint)
+        if len(key_attributes) > 2:
+            raise QueryError.for_invalid_key_condition(
+                key_condition, "Too many attributes in key_condition."
+            )
+
+        if _UNSUPPORTED_KEY_OPERATORS.search(key_condition_expression):
+            raise QueryError.for_invalid_key_condition(
+                key_condition, "Detected unsupported operator."
+            )
+        key_condition_values = serialize_value(key_condition.parameters).get(
+            "M"
+        )
+        projection = self._projection
+
+        if use_index:
+            if isinstance(use_index, str):
+                if use_index not in self.indexes:
+                    raise QueryError.for_invalid_index(use_index, key_condition)
+                hint_index = self.indexes[use_index]
+            else:
+                hint_index = use_index
+        else:
+            hint_index = self._hint_index_for_attributes(key_attributes)
+
+        query = {
+            "TableName": self._table_name,
+            "Select": SELECT_SPECIFIC_ATTRIBUTES,
+            "KeyConditionExpression": key_condition_expression,
+            "ExpressionAttributeValues": key_condition_values,
+            "ProjectionExpression": projection,
+            "ReturnConsumedCapacity": "INDEXES",
+            "ConsistentRead": consistent_read,
+        }
+
+        if isinstance(hint_index, NamedIndex):
+            query["IndexName"] = hint_index.index_name
+
+        if filter_condition:
+            query["FilterExpression"] = str(filter_condition)
+            query["ExpressionAttributeValues"] = {
+                **query["ExpressionAttributeValues"],  # type: ignore
+                **serialize_value(filter_condition.parameters).get("M"),  # type: ignore
+            }
+
+        if limit:
+            query["Limit"] = limit
+
+        return query
+
+    def _build_get_query(
+        self, keys: Tuple[Any, ...], consistent_read: bool
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        key_query = self._build_key_query(keys)
+        return key_query, {
+            "TableName": self.table_name,
+            "ProjectionExpression": self._projection,
+            "Key": serialize_value(key_query)["M"],
+            "ConsistentRead": consistent_read,
+            "ReturnConsumedCapacity": "INDEXES",
+        }
+
+    def _complete_get(
+        self, key_query: Dict[str, Any], result: Dict[str, Any]
+    ) -> I:
+        self._capacity.record(
+            Operation.GET_ITEM, result.get("ConsumedCapacity")
+        )
+        if "Item" not in result:
+            raise ItemNotFoundError(
+                f"Could not retrieve item `{self._item_class}` "
+                f"matching criteria `{key_query}`",
+                key_query,
+            )
+
+        return hydrate(self._item_class, result["Item"])
+
+    def _complete_write(
+        self, operation: Operation, item: I, result: Dict[str, Any]
+    ) -> bool:
+        self._capacity.record(operation, result.get("ConsumedCapacity"))
+        success = result["ResponseMetadata"]["HTTPStatusCode"] == 200
+
+        if success:
+            commit(item)
+
+        return success
+
+    def _build_put_query(
+        self, item: I, condition: Condition = None
+    ) -> Dict[str, Any]:
+        query = {
+            "TableName": self._table_name,
+            "Item": extract(item),
+        }
+        self._apply_condition(query, condition)
+
+        return query
+
+    def _build_update_query(
+        self, item: I, condition: Condition = None
+    ) -> Dict[str, Any]:
+        (
+            update_expression,
+            expression_attribute_values,
+        ) = diff(item)
+
+        query: Dict[str, Any] = {
+            "TableName": self._table_name,
+            "Key": self._get_key_expression(item),
+            "UpdateExpression": update_expression,
+        }
+        # an expression with `REMOVE` actions only has no values
+        if expression_attribute_values:
+            query["ExpressionAttributeValues"] = serialize_value(
+                expression_attribute_values
+            ).get("M")
+        self._apply_condition(query, condition)
+
+        return query
+
+    def _build_delete_query(
+        self, item: I, condition: Condition = None
+    ) -> Dict[str, Any]:
+        query = {
+            "TableName": self._table_name,
+            "Key": self._get_key_expression(item),
+        }
+        self._apply_condition(query, condition)
+
+        return query
+
+    @staticmethod
+    def _apply_condition(
+        query: Dict[str, Any], condition: Optional[Condition]
+    ) -> None:
+        if not condition:
+            return
+
+        query["ConditionExpression"] = str(condition)
+        if condition.parameters:
+            query["ExpressionAttributeValues"] = {
+                **query.get("ExpressionAttributeValues", {}),
+                **serialize_value(condition.parameters).get("M"),  # type: ignore
+            }
+
+    def _build_batch_get_keys(
+        self, keys: Iterable[Union[Any, Tuple[Any, ...]]]
+    ) -> Tuple[List[Tuple[Tuple, Dict[str, Any]]], List[KeyExpression]]:
+        key_queries = []
+        key_expressions: Dict[Tuple, KeyExpression] = {}
+        for key in keys:
+            key_query = self._build_key_query(
+                key if isinstance(key, tuple) else (key,)
+            )
+            key_expression = serialize_value(key_query)["M"]
+            identity = key_identity(key_expression)
+            # duplicated keys are rejected by BatchGetItem
+            key_expressions[identity] = key_expression
+            key_queries.append((identity, key_query))
+
+        return key_queries, list(key_expressions.values())
+
+    def _collect_batch_get(
+        self,
+        key_queries: List[Tuple[Tuple, Dict[str, Any]]],
+        records: Dict[Tuple, Dict[str, Any]],
+        on_missing: MissingKey,
+    ) -> List[Optional[I]]:
+        result: List[Optional[I]] = []
+        for identity, key_query in key_queries:
+            if identity in records:
+                result.append(hydrate(self._item_class, records[identity]))
+                continue
+            if on_missing == MissingKey.RAISE:
+                raise ItemNotFoundError(
+                    f"Could not retrieve item `{self._item_class}` "
+                    f"matching criteria `{key_query}`",
+                    key_query,
+                )
+            if on_missing == MissingKey.RETURN_NONE:
+                result.append(None)
+
+        return result
+
+    def _build_key_query(self, keys: Tuple[Any, ...]) -> Dict[str, Any]:
+        key_query = {self.partition_key.name: keys[0]}
+        if len(keys) > 1 and self.sort_key:
+            key_query[self.sort_key.name] = keys[1]
+
+        return key_query
+
+    def _key_from_record(self, record: Dict[str, Any]) -> KeyExpression:
+        key = {self.partition_key.name: record[self.partition_key.name]}
+        if self.sort_key:
+            key[self.sort_key.name] = record[self.sort_key.name]
+
+        return key
+
+    def _build_projection(
+        self, fields: Iterable[Union[str, Attribute]] = None
+    ) -> str:
+        if fields is None:
+            return self._projection
+
+        schema = self._item_class.__schema__
+        attributes = []
+        for field in fields:
+            if isinstance(field, Attribute):
+                attributes.append(field.name)
+                continue
+            if field not in schema:
+                raise ValueError(
+                    f"Unknown field `{field}` for `{self._item_class}`."
+                )
+            attributes.append(schema[field].name)
+
+        key_attributes = [self.partition_key.name]
+        if self.sort_key:
+            key_attributes.append(self.sort_key.name)
+        for key_attribute in key_attributes:
+            if key_attribute not in attributes:
+                attributes.append(key_attribute)
+
+        return ", ".join(attributes)
+
+    def _get_key_expression(self, item: I) -> KeyExpression:
+        key_expression = {
+            self.partition_key.name: getattr(item, str(self.partition_key)),
+        }
+
+        if self.sort_key:
+            key_expression[self.sort_key.name] = getattr(
+                item, str(self.sort_key)
+            )
+
+        return serialize_value(key_expression).get("M")  # type: ignore[return-value]
+
+    @property
+    def indexes(self) -> Dict[str, Index]:
+        return self._indexes
+
+    @property
+    def table_name(self) -> str:
+        return self._table_name
+
+    @classmethod
+    def __class_getitem__(cls, item: Type[Item], schema: Any = None) -> Type:
+        if isinstance(item, TypeVar):
+            # generic subclasses, e.g. `Table(BaseTable[I])`
+            return super().__class_getitem__(item)  # type: ignore[misc]
+        if not issubclass(item, Item):
+            raise TypeError(
+                f"Expected subclass of `{Item}`, " f"got {item} instead."
+            )
+        return type(
+            f"{cls.__qualname__}[{item.__module__}.{item.__qualname__}]",
+            tuple([cls]),
+            {"__item_class__": item},
+        )
+
+    @property
+    def attributes(self) -> List[str]:
+        return self._attributes
+
+    def _hint_index_for_attributes(self, attributes: List[str]) -> Index:
+        if len(attributes) == 1:
+            for index in self.indexes.values():
+                if index.partition_key.name == attributes[0]:
+                    return index
+            raise QueryError(
+                f"No GSI index defined for `{attributes[0]}` attribute."
+            )
+
+        matched_indexes = []
+
+        for index in self.indexes.values():
+            if index.partition_key.name not in attributes or (
+                index.sort_key and index.sort_key.name not in attributes
+            ):
+                continue
+
+            # partition key was on a first place in condition,
+            # so we assume the best index here
+            if attributes[0] == index.partition_key.name:
+                return index
+
+            matched_indexes.append(index)
+
+        if not matched_indexes:
+            raise QueryError(
+                f"No GSI/LSI index defined for "
+                f"`{'`,`'.join(attributes)}` attributes."
+            )
+
+        # return first matched index
+        return matched_indexes[0]
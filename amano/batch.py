@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from time import sleep
+from typing import TYPE_CHECKING, Any, Dict, Generic, Mapping, Tuple
+
+from botocore.exceptions import ClientError, ParamValidationError
+
+from .capacity import Operation
+from .constants import BATCH_MAX_RETRIES, BATCH_WRITE_ITEM_LIMIT
+from .errors import WriteError
+from .item import I, commit, extract
+from .utils import backoff_delay, key_identity
+
+if TYPE_CHECKING:
+    from .async_table import AsyncTable
+    from .base_table import BaseTable
+    from .table import Table
+
+_WriteRequest = Tuple[Dict[str, Any], I]
+
+
+class BaseBatchWriter(Generic[I]):
+    """
+    Buffer of put and delete operations shared by synchronous and
+    asynchronous batch writers.
+    """
+
+    def __init__(
+        self, table: BaseTable[I], max_retries: int = BATCH_MAX_RETRIES
+    ):
+        self._table = table
+        self._max_retries = max_retries
+        self._buffer: Dict[Tuple, _WriteRequest] = {}
+
+    def _append_put(self, item: I) -> None:
+        self._validate_item(item)
+        self._append(
+            self._table._get_key_expression(item),
+            {"PutRequest": {"Item": extract(item)}},
+            item,
+        )
+
+    def _append_delete(self, item: I) -> None:
+        self._validate_item(item)
+        key_expression = self._table._get_key_expression(item)
+        self._append(
+            key_expression,
+            {"DeleteRequest": {"Key": key_expression}},
+            item,
+        )
+
+    def _append(
+        self, key_expression: Dict[str, Any], request: Dict[str, Any], item: I
+    ) -> None:
+        # DynamoDB rejects batches with many operations on the same key,
+        # so the last operation wins.
+        identity = key_identity(key_expression)
+        self._buffer.pop(identity, None)
+        self._buffer[identity] = (request, item)
+
+    @property
+    def _is_full(self) -> bool:
+        return len(self._buffer) >= BATCH_WRITE_ITEM_LIMIT
+
+    def _next_chunk(self) -> Dict[Tuple, _WriteRequest]:
+        return dict(islice(self._buffer.items(), BATCH_WRITE_ITEM_LIMIT))
+
+    def _build_request(
+        self, chunk: Dict[Tuple, _WriteRequest]
+    ) -> Dict[str, Any]:
+        return {
+            "RequestItems": {
+                self._table.table_name: [
+                    request for request, _ in chunk.values()
+                ]
+            },
+            "ReturnConsumedCapacity": "INDEXES",
+        }
+
+    def _complete_chunk(
+        self, chunk: Dict[Tuple, _WriteRequest], result: Dict[str, Any]
+    ) -> Dict[Tuple, _WriteRequest]:
+        """
+        Commits persisted items and returns the unprocessed part
+        of the chunk.
+        """
+        self._table.capacity.record(
+            Operation.BATCH_WRITE_ITEM, result.get("ConsumedCapacity")
+        )
+        unprocessed = [
+            self._request_identity(request)
+            for request in result.get("UnprocessedItems", {}).get(
+                self._table.table_name, []
+            )
+        ]
+        for identity, (_, item) in chunk.items():
+            if identity not in unprocessed:
+                del self._buffer[identity]
+                commit(item)
+
+        return {identity: chunk[identity] for identity in unprocessed}
+
+    def _request_identity(self, request: Mapping[str, Any]) -> Tuple:
+        if "PutRequest" in request:
+            return key_identity(
+                self._table._key_from_record(request["PutRequest"]["Item"])
+            )
+
+        return key_identity(request["DeleteRequest"]["Key"])
+
+    def _validate_item(self, item: I) -> None:
+        if not isinstance(item, self._table._item_class):
+            raise ValueError(
+                f"Could not write item of type `{type(item)}`, "
+                f"expected instance of `{self._table._item_class}` instead."
+            )
+
+
+class BatchWriter(BaseBatchWriter[I]):
+    """
+    Buffers put and delete operations and sends them
+    with `BatchWriteItem` in chunks of 25 requests.
+
+    Operations stay buffered until they are persisted, so a failed
+    `flush` can be retried. Leaving the context flushes the buffer
+    even if an exception was raised, as chunks sent before
+    are already written.
+    """
+
+    _table: Table[I]
+
+    def put(self, item: I) -> None:
+        self._append_put(item)
+        if self._is_full:
+            self.flush()
+
+    def delete(self, item: I) -> None:
+        self._append_delete(item)
+        if self._is_full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all buffered operations.
+
+        :raises amano.errors.WriteError: when client fails or
+            unprocessed items are left after all retries
+        """
+        while self._buffer:
+            self._write_chunk(self._next_chunk())
+
+    def _write_chunk(self, chunk: Dict[Tuple, _WriteRequest]) -> None:
+        attempt = 0
+        while True:
+            try:
+                result = self._table.client.batch_write_item(
+                    **self._build_request(chunk)
+                )
+            except ClientError as e:
+                raise WriteError.for_client_error(
+                    e.response["Error"]["Message"]
+                ) from e
+            except ParamValidationError as e:
+                raise WriteError.for_client_error(str(e)) from e
+
+            chunk = self._complete_chunk(chunk, result)  # type: ignore[arg-type]
+            if not chunk:
+                return
+            if attempt >= self._max_retries:
+                raise WriteError.for_unprocessed_items(len(chunk))
+
+            sleep(backoff_delay(attempt))
+            attempt += 1
+
+    def __enter__(self) -> BatchWriter[I]:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
+
+
+class AsyncBatchWriter(BaseBatchWriter[I]):
+    """
+    Asynchronous version of a batch writer, used with `async with`.
+    A put or a delete which fills the buffer awaits its flush.
+    """
+
+    _table: AsyncTable[I]
+
+    async def put(self, item: I) -> None:
+        self._append_put(item)
+        if self._is_full:
+            await self.flush()
+
+    async def delete(self, item: I) -> None:
+        self._append_delete(item)
+        if self._is_full:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Writes all buffered operations.
+
+        :raises amano.errors.WriteError: when client fails or
+            unprocessed items are left after all retries
+        """
+        while self._buffer:
+            await self._write_chunk(self._next_chunk())
+
+    async def _write_chunk(self, chunk: Dict[Tuple, _WriteRequest]) -> None:
+        attempt = 0
+        while True:
+            try:
+                result = await self._table.transport.request(
+                    "batch_write_item", **self._build_request(chunk)
+                )
+            except ClientError as e:
+                raise WriteError.for_client_error(
+                    e.response["Error"]["Message"]
+                ) from e
+            except ParamValidationError as e:
+                raise WriteError.for_client_error(str(e)) from e
+
+            chunk = self._complete_chunk(chunk, result)
+            if not chunk:
+                return
+            if attempt >= self._max_retries:
+                raise WriteError.for_unprocessed_items(len(chunk))
+
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    async def __aenter__(self) -> AsyncBatchWriter[I]:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.flush()
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .utils import StringEnum
+
+
+class Operation(StringEnum):
+    GET_ITEM = "GetItem"
+    PUT_ITEM = "PutItem"
+    UPDATE_ITEM = "UpdateItem"
+    DELETE_ITEM = "DeleteItem"
+    QUERY = "Query"
+    SCAN = "Scan"
+    BATCH_GET_ITEM = "BatchGetItem"
+    BATCH_WRITE_ITEM = "BatchWriteItem"
+    TRANSACT_GET_ITEMS = "TransactGetItems"
+    TRANSACT_WRITE_ITEMS = "TransactWriteItems"
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+_READ_OPERATIONS = (
+    Operation.GET_ITEM,
+    Operation.QUERY,
+    Operation.SCAN,
+    Operation.BATCH_GET_ITEM,
+    Operation.TRANSACT_GET_ITEMS,
+)
+
+# (operation, table name, index name or `None` for the table itself)
+_EntryKey = Tuple[Operation, str, Optional[str]]
+
+
+@dataclass
+class CapacityUsage:
+    read: float = 0.0
+    write: float = 0.0
+
+    def __add__(self, other: CapacityUsage) -> CapacityUsage:
+        return CapacityUsage(self.read + other.read, self.write + other.write)
+
+
+_active_scopes: ContextVar[Tuple[CapacityLedger, ...]] = ContextVar(
+    "amano_capacity_scopes", default=()
+)
+
+
+class CapacityLedger:
+    """
+    Accumulates capacity units reported by DynamoDB in `ConsumedCapacity`,
+    per operation, table and index.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._entries: Dict[_EntryKey, CapacityUsage] = {}
+
+    def record(
+        self,
+        operation: Operation,
+        consumed_capacity: Any,
+        scopes: Optional[Tuple[CapacityLedger, ...]] = None,
+    ) -> None:
+        """
+        Records `ConsumedCapacity` of a response, which is a single
+        mapping or a list of mappings for multi-table operations.
+
+        :param operation: operation which consumed the capacity
+        :param consumed_capacity: `ConsumedCapacity` of the response
+        :param scopes: capacity scopes which receive the record as well,
+            defaults to scopes active in the current context
+        """
+        if not consumed_capacity:
+            return
+        if isinstance(consumed_capacity, Mapping):
+            consumed_capacity = [consumed_capacity]
+        if scopes is None:
+            scopes = current_scopes()
+
+        entries = list(_parse_entries(operation, consumed_capacity))
+        for ledger in (self, *scopes):
+            ledger._add(entries)
+
+    @property
+    def total(self) -> CapacityUsage:
+        return self._sum(lambda key: True)
+
+    def by_operation(self) -> Dict[str, CapacityUsage]:
+        return self._group(lambda key: str(key[0]))
+
+    def by_table(self) -> Dict[str, CapacityUsage]:
+        """
+        Capacity per table, including capacity consumed by its indexes.
+        """
+        return self._group(lambda key: key[1])
+
+    def by_index(self) -> Dict[Tuple[str, str], CapacityUsage]:
+        return self._group(
+            lambda key: (key[1], key[2]), lambda key: key[2] is not None
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries = {}
+
+    def _add(self, entries: Iterable[Tuple[_EntryKey, CapacityUsage]]) -> None:
+        with self._lock:
+            for key, usage in entries:
+                self._entries[key] = (
+                    self._entries.get(key, CapacityUsage()) + usage
+                )
+
+    def _sum(self, predicate) -> CapacityUsage:
+        with self._lock:
+            result = CapacityUsage()
+            for key, usage in self._entries.items():
+                if predicate(key):
+                    result += usage
+            return result
+
+    def _group(
+        self, key_of, predicate=lambda key: True
+    ) -> Dict[Any, CapacityUsage]:
+        with self._lock:
+            result: Dict[Any, CapacityUsage] = {}
+            for key, usage in self._entries.items():
+                if not predicate(key):
+                    continue
+                group = key_of(key)
+                result[group] = result.get(group, CapacityUsage()) + usage
+            return result
+
+
+@contextmanager
+def capacity_scope() -> Iterator[CapacityLedger]:
+    """
+    Collects capacity consumed by all tables within the context,
+    e.g. while handling a single request. Scopes are bound to the current
+    thread or asyncio task and can be nested.
+    """
+    ledger = CapacityLedger()
+    token = _active_scopes.set((*_active_scopes.get(), ledger))
+    try:
+        yield ledger
+    finally:
+        _active_scopes.reset(token)
+
+
+def current_scopes() -> Tuple[CapacityLedger, ...]:
+    """
+    Returns capacity scopes active in the current context, so work done
+    on behalf of it in other threads can be recorded in them too.
+    """
+    return _active_scopes.get()
+
+
+def _parse_entries(
+    operation: Operation, consumed_capacity: Iterable[Mapping[str, Any]]
+) -> Iterator[Tuple[_EntryKey, CapacityUsage]]:
+    for capacity in consumed_capacity:
+        table_name = capacity.get("TableName", "")
+        indexes: Dict[Optional[str], Mapping[str, Any]] = {
+            **capacity.get("LocalSecondaryIndexes", {}),
+            **capacity.get("GlobalSecondaryIndexes", {}),
+        }
+        if indexes or "Table" in capacity:
+            indexes[None] = capacity.get("Table", {})
+        else:
+            # capacity returned without a breakdown belongs to the table
+            indexes[None] = capacity
+
+        for index_name, units in indexes.items():
+            yield (operation, table_name, index_name), _to_usage(
+                operation, units
+            )
+
+
+def _to_usage(operation: Operation, units: Mapping[str, Any]) -> CapacityUsage:
+    if "ReadCapacityUnits" in units or "WriteCapacityUnits" in units:
+        return CapacityUsage(
+            units.get("ReadCapacityUnits", 0.0),
+            units.get("WriteCapacityUnits", 0.0),
+        )
+    if operation in _READ_OPERATIONS:
+        return CapacityUsage(read=units.get("CapacityUnits", 0.0))
+
+    return CapacityUsage(write=units.get("CapacityUnits", 0.0))
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from textwrap import indent
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+from boto3.dynamodb.types import DYNAMODB_CONTEXT
+
+from .attribute import Attribute
+from .base_attribute import (
+    AttributeType,
+    AttributeValue,
+    deserialize_value,
+    serialize_value,
+)
+from .constants import TYPE_BOOLEAN, TYPE_NUMBER, TYPE_STRING
+from .undefined import ABSENT
+
+Hydrator = Callable[[Dict[str, AttributeValue]], Any]
+Extractor = Callable[[Any], Dict[str, AttributeValue]]
+Decoder = Callable[[AttributeValue], Any]
+RowDecoder = Callable[[Dict[str, AttributeValue]], Any]
+
+# Types decoded straight from the wire value, without the attribute's
+# strategy. Every codec gives the same result as deserializing the value
+# and passing it to `Attribute.hydrate`.
+_INLINE_CODECS: Dict[Any, Tuple[str, str]] = {
+    str: (TYPE_STRING, "{}"),
+    bool: (TYPE_BOOLEAN, "{}"),
+    int: (TYPE_NUMBER, "decode_int({})"),
+    float: (TYPE_NUMBER, "float({})"),
+    Decimal: (TYPE_NUMBER, "decode_decimal({})"),
+}
+
+_DECODE_TEMPLATE = """\
+    value = record.get({name!r})
+    if value is not None:
+        raw = value.get({type_tag!r})
+        if raw is not None:
+            {store_codec}
+        else:
+            {store_fallback}"""
+
+_FALLBACK_TEMPLATE = """\
+    value = record.get({name!r})
+    if value is not None:
+        {store_fallback}"""
+
+_DECODER_TEMPLATE = """\
+def decode_{index}(value):
+    raw = value.get({type_tag!r})
+    if raw is not None:
+        return {codec}
+    return fallback_{index}(value)"""
+
+# Types encoded straight to the wire value, when the value is exactly
+# of the annotated type. Every codec gives the same result as passing
+# the value to `Attribute.extract` and serializing it.
+_INLINE_ENCODERS: Dict[Any, str] = {
+    str: "{{'S': {}}}",
+    bool: "{{'BOOL': {}}}",
+    int: "{{'N': encode_number({})}}",
+    float: "{{'N': encode_number(Decimal(str({})))}}",
+}
+
+_ENCODE_TEMPLATE = """\
+    value = {read}
+    if value is missing:
+        value = getattr(item, {field!r})
+    if value.__class__ is type_{index}:
+        result[{name!r}] = {codec}
+    else:
+        result[{name!r}] = fallback_{index}(value)"""
+
+_FALLBACK_ENCODE_TEMPLATE = """\
+    value = {read}
+    if value is missing:
+        value = getattr(item, {field!r})
+    result[{name!r}] = fallback_{index}(value)"""
+
+# Lazy items copy values which were never decoded from the raw record
+_LAZY_ENCODE_TEMPLATE = """\
+    if {field!r} not in state and {name!r} in raw:
+        result[{name!r}] = raw[{name!r}]
+    else:
+{encode}"""
+
+
+def encode_number(value: Any) -> str:
+    number = str(DYNAMODB_CONTEXT.create_decimal(value))
+    if number in ("Infinity", "NaN"):
+        raise TypeError("Infinity and NaN not supported")
+    return number
+
+
+def decode_decimal(value: str) -> Decimal:
+    return DYNAMODB_CONTEXT.create_decimal(value)
+
+
+def decode_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return int(decode_decimal(value))
+
+
+def compile_hydrator(
+    item_class: type,
+    schema: Mapping[str, Attribute],
+    finish: Callable[[Any], None],
+) -> Hydrator:
+    """
+    Generates a function which builds an instance of `item_class`
+    from a DynamoDB record (`{"name": {"S": "Bob"}}`) in a single pass.
+
+    Wire type tag and codec of every attribute are resolved once, here,
+    values of an unexpected type fall back to `TypeDeserializer`.
+    Attribute values are written directly to the instance state,
+    `finish` is called with the instance afterwards.
+    """
+    compact = getattr(item_class, "__compact__", False)
+    members = getattr(item_class, "__members__", ())
+    namespace: Dict[str, Any] = {
+        "cls": item_class,
+        "new": item_class.__new__,
+        "finish": finish,
+        "decode_int": decode_int,
+        "decode_decimal": decode_decimal,
+    }
+    lines: List[str] = [
+        "def hydrate(record):",
+        "    instance = new(cls)",
+    ]
+    if not compact:
+        lines.append("    state = instance.__dict__")
+    for index, (field, attribute) in enumerate(schema.items()):
+        store = f"state[{field!r}] = {{}}"
+        if compact:
+            # compact items keep every value in a slot of its own
+            namespace[f"store_{index}"] = members[index].__set__
+            store = f"store_{index}(instance, {{}})"
+        lines.append(_decode_block(attribute, index, store, namespace))
+    lines.append("    finish(instance)")
+    lines.append("    return instance")
+
+    exec("\n".join(lines), namespace)  # nosec
+    hydrator = namespace["hydrate"]
+    hydrator.__qualname__ = f"hydrate_{item_class.__qualname__}"
+
+    return hydrator
+
+
+def compile_lazy_hydrator(
+    item_class: type, finish: Callable[[Any], None]
+) -> Hydrator:
+    """
+    Creates a function which builds an instance of `item_class` keeping
+    the DynamoDB record as it is, attributes are decoded when accessed.
+    """
+    new: Callable[..., Any] = item_class.__new__
+
+    def hydrate(record: Dict[str, AttributeValue]) -> Any:
+        instance = new(item_class)
+        instance.__dict__["__raw__"] = record
+        finish(instance)
+        return instance
+
+    hydrate.__qualname__ = f"hydrate_{item_class.__qualname__}"
+
+    return hydrate
+
+
+def compile_decoders(schema: Mapping[str, Attribute]) -> Dict[str, Decoder]:
+    """
+    Generates a function for every attribute in the schema, which
+    decodes a single DynamoDB value (`{"S": "Bob"}`) the same way
+    `compile_hydrator` does.
+    """
+    namespace: Dict[str, Any] = {
+        "decode_int": decode_int,
+        "decode_decimal": decode_decimal,
+    }
+    decoders: Dict[str, Decoder] = {}
+    for index, (field, attribute) in enumerate(schema.items()):
+        namespace[f"fallback_{index}"] = _fallback(attribute)
+        type_tag, codec = _resolve_codec(attribute, index, namespace)
+        if not type_tag:
+            decoders[field] = namespace[f"fallback_{index}"]
+            continue
+        source = _DECODER_TEMPLATE.format(
+            index=index, type_tag=type_tag, codec=codec.format("raw")
+        )
+        exec(source, namespace)  # nosec
+        decoders[field] = namespace[f"decode_{index}"]
+
+    return decoders
+
+
+def compile_row_decoder(
+    attributes: Sequence[Attribute], as_tuple: bool = False
+) -> RowDecoder:
+    """
+    Generates a function which decodes a DynamoDB record to plain
+    python values of the given attributes, without creating an item.
+
+    Rows are dicts keyed by attribute names, attributes missing in
+    the record are skipped. With `as_tuple`, rows are tuples ordered
+    as `attributes`, with `None` for missing attributes.
+    """
+    namespace: Dict[str, Any] = {
+        "decode_int": decode_int,
+        "decode_decimal": decode_decimal,
+    }
+    lines: List[str] = [
+        "def decode_row(record):",
+        f"    state = [None] * {len(attributes)}"
+        if as_tuple
+        else "    state = {}",
+    ]
+    for index, attribute in enumerate(attributes):
+        key = index if as_tuple else attribute.name
+        lines.append(
+            _decode_block(attribute, index, f"state[{key!r}] = {{}}", namespace)
+        )
+    lines.append("    return tuple(state)" if as_tuple else "    return state")
+
+    exec("\n".join(lines), namespace)  # nosec
+
+    return namespace["decode_row"]
+
+
+def compile_extractor(
+    item_class: type, schema: Mapping[str, Attribute]
+) -> Extractor:
+    """
+    Generates a function which serializes an instance of `item_class`
+    to a DynamoDB record, reading values directly from its state.
+
+    Values of str, bool, int and float attributes are encoded inline,
+    all other values are extracted by their attribute's strategy and
+    serialized with `TypeSerializer`. Values of lazy items which were
+    never decoded are copied from the raw record.
+    """
+    compact = getattr(item_class, "__compact__", False)
+    members = getattr(item_class, "__members__", ())
+    lazy = getattr(item_class, "__lazy__", False)
+    namespace: Dict[str, Any] = {
+        "missing": ABSENT,
+        "encode_number": encode_number,
+        "Decimal": Decimal,
+    }
+    lines: List[str] = ["def extract(item):", "    result = {}"]
+    if not compact:
+        lines.append("    state = item.__dict__")
+    if lazy:
+        lines.append("    raw = state.get('__raw__') or {}")
+    for index, (field, attribute) in enumerate(schema.items()):
+        attribute_type = attribute.__attribute_type__  # type: ignore
+        namespace[f"fallback_{index}"] = _extract_fallback(attribute)
+        namespace[f"type_{index}"] = attribute_type
+        read = f"state.get({field!r}, missing)"
+        if compact:
+            namespace[f"load_{index}"] = members[index].__get__
+            read = f"load_{index}(item)"
+        codec = _INLINE_ENCODERS.get(attribute_type, "")
+        template = _ENCODE_TEMPLATE if codec else _FALLBACK_ENCODE_TEMPLATE
+        encode = template.format(
+            name=attribute.name,
+            field=field,
+            index=index,
+            read=read,
+            codec=codec.format("value"),
+        )
+        if lazy:
+            encode = _LAZY_ENCODE_TEMPLATE.format(
+                name=attribute.name, field=field, encode=indent(encode, "    ")
+            )
+        lines.append(encode)
+    lines.append("    return result")
+
+    exec("\n".join(lines), namespace)  # nosec
+    extractor = namespace["extract"]
+    extractor.__qualname__ = f"extract_{item_class.__qualname__}"
+
+    return extractor
+
+
+def _decode_block(
+    attribute: Attribute, index: int, store: str, namespace: Dict[str, Any]
+) -> str:
+    # `store` is a statement writing the `{}` placeholder to the state
+    namespace[f"fallback_{index}"] = _fallback(attribute)
+    type_tag, codec = _resolve_codec(attribute, index, namespace)
+    template = _DECODE_TEMPLATE if type_tag else _FALLBACK_TEMPLATE
+
+    return template.format(
+        name=attribute.name,
+        type_tag=type_tag,
+        store_codec=store.format(codec.format("raw")),
+        store_fallback=store.format(f"fallback_{index}(value)"),
+    )
+
+
+def _resolve_codec(
+    attribute: Attribute, index: int, namespace: Dict[str, Any]
+) -> Tuple[str, str]:
+    attribute_type = attribute.__attribute_type__  # type: ignore
+    if attribute_type in _INLINE_CODECS:
+        return _INLINE_CODECS[attribute_type]
+
+    # e.g. datetime, serialized as a string and parsed by its strategy
+    if attribute.type == AttributeType.STRING:
+        namespace[f"hydrate_{index}"] = attribute.hydrate
+        return TYPE_STRING, f"hydrate_{index}({{}})"
+
+    if attribute.type == AttributeType.NUMBER:
+        namespace[f"hydrate_{index}"] = attribute.hydrate
+        return TYPE_NUMBER, f"hydrate_{index}(decode_decimal({{}}))"
+
+    return "", ""
+
+
+def _extract_fallback(attribute: Attribute) -> Callable[[Any], AttributeValue]:
+    extract = attribute.extract
+
+    def _extract(value: Any) -> AttributeValue:
+        return serialize_value(extract(value))
+
+    return _extract
+
+
+def _fallback(attribute: Attribute) -> Callable[[AttributeValue], Any]:
+    hydrate = attribute.hydrate
+
+    def _hydrate(value: AttributeValue) -> Any:
+        return hydrate(deserialize_value(value))
+
+    return _hydrate
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from array import array
+from decimal import Decimal
+from typing import Any, Callable, Collection, Dict, Iterable, List, Type
+
+from .attribute import Attribute
+from .base_attribute import AttributeType, AttributeValue
+from .codec import Decoder, compile_decoders, decode_int
+from .constants import TYPE_NULL
+
+Record = Dict[str, AttributeValue]
+
+# typecodes of numbers kept in arrays, 64-bit integers and doubles
+_INT_TYPECODE = "q"
+_FLOAT_TYPECODE = "d"
+_CODE_TYPECODE = "q"
+
+
+class Column:
+    """
+    Values of a single attribute, in the order of records. `mask` holds
+    `1` for every record without the attribute, or with a `NULL` value,
+    and `0` otherwise.
+    """
+
+    def __init__(self, attribute: Attribute, decode: Decoder):
+        self.attribute = attribute
+        self.name = attribute.name
+        self.mask = bytearray()
+        self.values: Any = []
+        self._decode = decode
+
+    def extend(self, records: Iterable[Record]) -> None:
+        name = self.name
+        decode = self._decode
+        append = self.values.append
+        mask = self.mask.append
+        for record in records:
+            value = record.get(name)
+            decoded = (
+                None if value is None or TYPE_NULL in value else decode(value)
+            )
+            append(decoded)
+            mask(decoded is None)
+
+    def to_list(self) -> List[Any]:
+        return [self[index] for index in range(len(self))]
+
+    def __getitem__(self, index: int) -> Any:
+        if self.mask[index]:
+            return None
+
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.name}", {len(self)} rows)'
+
+
+class NumberColumn(Column):
+    """
+    Number values kept in a typed `array`, `q` (64-bit integers) for
+    `int` attributes and `d` (doubles) otherwise. Missing values are
+    stored as `0` and marked in the mask. The array supports the buffer
+    protocol, so it can be wrapped without copying, e.g. with
+    `numpy.frombuffer`. Integers which do not fit in 64 bits turn
+    `values` into a list.
+    """
+
+    def __init__(self, attribute: Attribute, decode: Decoder):
+        super().__init__(attribute, decode)
+        is_int = attribute.__attribute_type__ is int  # type: ignore
+        self.values = array(_INT_TYPECODE if is_int else _FLOAT_TYPECODE)
+        self._convert: Callable[[Any], Any] = int if is_int else float
+        self._parse: Callable[[str], Any] = float
+        if is_int:
+            self._parse = decode_int
+
+    def extend(self, records: Iterable[Record]) -> None:
+        name = self.name
+        decode = self._decode
+        convert = self._convert
+        parse = self._parse
+        append = self.values.append
+        mask = self.mask.append
+        for record in records:
+            value = record.get(name)
+            if value is None or TYPE_NULL in value:
+                append(0)
+                mask(1)
+                continue
+            raw = value.get("N")
+            number = parse(raw) if raw is not None else convert(decode(value))
+            try:
+                append(number)
+            except OverflowError:
+                self.values = list(self.values)
+                append = self.values.append
+                append(number)
+            mask(0)
+
+
+class CategoricalColumn(Column):
+    """
+    Values encoded as codes kept in an `array`, which point to unique
+    values in `categories`. Missing values have `-1` code.
+    """
+
+    def __init__(self, attribute: Attribute, decode: Decoder):
+        super().__init__(attribute, decode)
+        self.values = array(_CODE_TYPECODE)
+        self.categories: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def extend(self, records: Iterable[Record]) -> None:
+        name = self.name
+        decode = self._decode
+        codes = self._codes
+        categories = self.categories
+        append = self.values.append
+        mask = self.mask.append
+        for record in records:
+            value = record.get(name)
+            decoded = (
+                None if value is None or TYPE_NULL in value else decode(value)
+            )
+            if decoded is None:
+                append(-1)
+                mask(1)
+                continue
+            code = codes.get(decoded)
+            if code is None:
+                code = codes[decoded] = len(categories)
+                categories.append(decoded)
+            append(code)
+            mask(0)
+
+    def __getitem__(self, index: int) -> Any:
+        if self.mask[index]:
+            return None
+
+        return self.categories[self.values[index]]
+
+
+class Columns:
+    """
+    Builds a column for every attribute from pages of records. Columns
+    are keyed by attribute names.
+
+    :param attributes: attributes to build columns for
+    :param categorical: names of attributes kept as categorical codes
+    :param decoders: decoders keyed by attribute names, as returned by
+        `decoders_for`, compiled when omitted
+    :param exact_decimals: keep `Decimal` values in lists, as they are,
+        instead of converting them to doubles
+    """
+
+    def __init__(
+        self,
+        attributes: List[Attribute],
+        categorical: Collection[str] = (),
+        decoders: Dict[str, Decoder] = None,
+        exact_decimals: bool = False,
+    ):
+        if decoders is None:
+            decoders = decoders_for(attributes)
+        self.columns: Dict[str, Column] = {
+            attribute.name: _column_class(
+                attribute, categorical, exact_decimals
+            )(attribute, decoders[attribute.name])
+            for attribute in attributes
+        }
+
+    def extend(self, records: List[Record]) -> None:
+        for column in self.columns.values():
+            column.extend(records)
+
+
+def decoders_for(attributes: List[Attribute]) -> Dict[str, Decoder]:
+    """
+    Compiles decoders of the attributes, so they can be shared by
+    many instances of `Columns`.
+    """
+    return compile_decoders(
+        {attribute.name: attribute for attribute in attributes}
+    )
+
+
+def _column_class(
+    attribute: Attribute, categorical: Collection[str], exact_decimals: bool
+) -> Type[Column]:
+    if attribute.name in categorical:
+        return CategoricalColumn
+
+    attribute_type = attribute.__attribute_type__  # type: ignore
+    if exact_decimals and attribute_type is Decimal:
+        return Column
+    if attribute.type == AttributeType.NUMBER and attribute_type in (
+        int,
+        float,
+        Decimal,
+    ):
+        return NumberColumn
+
+    return Column
@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 import string
 from abc import ABC
+from itertools import count
 from typing import Any, Dict, List, Set, Union
 
 from .base_attribute import (
@@ -21,16 +22,16 @@ from .constants import (
 )
 from .utils import StringEnum
 
-_COUNTER = 0
+# `next` on `itertools.count` is atomic, unlike incrementing a global,
+# so conditions built in many threads never share a placeholder
+_COUNTER = count(1)
 
 
 def _param_suffix() -> str:
-    global _COUNTER
-    _COUNTER += 1
     return (
         "_"
         + "".join(random.choices(string.ascii_letters, k=4))  # nosec
-        + str(_COUNTER)
+        + str(next(_COUNTER))
     )
 
 
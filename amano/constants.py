@@ -96,6 +96,29 @@ SELECT_TYPES = (
     SELECT_SPECIFIC_ATTRIBUTES,
 )
 
+# Batch operations
+BATCH_GET_ITEM_LIMIT = 100
+BATCH_WRITE_ITEM_LIMIT = 25
+BATCH_MAX_RETRIES = 8
+COALESCE_WINDOW = 0.002
+
+# Cursor rows
+ROWS_DICT = "dict"
+ROWS_TUPLE = "tuple"
+
+# Background threads
+SEGMENT_THREAD_NAME_PREFIX = "amano-segment"
+PREFETCH_THREAD_NAME = "amano-prefetch"
+
+# Items
+ITEM_HISTORY_DEPTH = 1
+
+# Transactions
+TRANSACT_ITEMS_LIMIT = 100
+TRANSACTION_MAX_RETRIES = 3
+TRANSACTION_CANCELED = "TransactionCanceledException"
+TRANSACTION_CONFLICT = "TransactionConflict"
+
 # Table Fields
 BILLING_MODE = "BillingMode"
 ATTRIBUTE_DEFINITIONS = "AttributeDefinitions"
@@ -1,83 +1,645 @@
-from typing import Any, Callable, Dict, Generic, Iterator, List, Type, Union
+from itertools import islice
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import ReferenceType, ref
 
+from .attribute import Attribute
 from .base_attribute import AttributeValue
-from .errors import QueryError
-from .item import I, hydrate
+from .capacity import CapacityLedger, Operation, current_scopes
+from .codec import RowDecoder
+from .columns import Column, Columns
+from .constants import PREFETCH_THREAD_NAME, ROWS_DICT, ROWS_TUPLE, SELECT_COUNT
+from .errors import CursorError, QueryError
+from .item import I, _resolve_attributes, hydrate, row_decoder
+from .pagination import decode_token, encode_token
 
+Record = Dict[str, AttributeValue]
+Row = Union[I, Dict[str, Any], Tuple[Any, ...]]
+
+C = TypeVar("C", bound="BaseCursor")
+
+_PAGES_DONE = object()
+_QUEUE_TIMEOUT = 0.1
+
+
+class Page(Generic[I]):
+    """
+    Single page of query or scan results with its metadata. Items are
+    hydrated lazily, when the page is iterated.
+    """
 
-class Cursor(Generic[I]):
     def __init__(
-        self, item_class: Type[I], query: Dict[str, Any], executor: Callable
+        self,
+        item_class: Type[I],
+        records: List[Record],
+        count: int,
+        scanned_count: int,
+        last_evaluated_key: Optional[Record],
+        consumed_capacity: float,
+    ):
+        self._item_class = item_class
+        self.records = records
+        self.count = count
+        self.scanned_count = scanned_count
+        self.last_evaluated_key = last_evaluated_key
+        self.consumed_capacity = consumed_capacity
+
+    def __iter__(self) -> Iterator[I]:
+        for record in self.records:
+            yield hydrate(self._item_class, record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class BaseCursor(Generic[I]):
+    """
+    Pagination state shared by synchronous and asynchronous cursors.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[I],
+        query: Dict[str, Any],
+        executor: Callable,
+        start_token: Optional[str] = None,
+        ledger: Optional[CapacityLedger] = None,
     ):
         self._executor = executor
         self._query = query
         self.hydrate = True
+        self._decode_row: Optional[RowDecoder] = None
         self._item_class = item_class
-        self._fetched_records: List[Dict[str, AttributeValue]] = []
-        self._current_index = 0
         self._exhausted = False
+        self._consumed = False
         self._last_evaluated_key: Dict[str, AttributeValue] = {}
         self._consumed_capacity: float = 0
+        self._scanned_count = 0
+        self._next_key: Optional[Record] = None
+        self._ledger = ledger
+        self._scopes = current_scopes()
+        self._operation = (
+            Operation.QUERY
+            if "KeyConditionExpression" in query
+            else Operation.SCAN
+        )
+        if start_token:
+            self._last_evaluated_key = decode_token(start_token, query)
+            self._next_key = self._last_evaluated_key
 
-    def __iter__(self) -> Iterator[Union[I, Dict[str, Any]]]:
-        self._current_index = 0
-        if not self._fetched_records:
-            self._fetch()
-
-        items_count = len(self._fetched_records)
-        while self._current_index < items_count:
-            item_data = self._fetched_records[self._current_index]
-            if self.hydrate:
-                yield hydrate(self._item_class, item_data)  # type: ignore
-            else:
-                yield item_data
-
-            self._current_index += 1
-
-            if self._current_index >= items_count and not self._exhausted:
-                self._fetch()
-                items_count = len(self._fetched_records)
-
-    def fetch(self, items=0) -> List[Union[Dict[str, Any], I]]:
-        self._current_index = 0
-        fetched_items = []
-        fetched_length = 0
-        for item in self:
-            fetched_items.append(item)
-            fetched_length += 1
-            if items and fetched_length >= items:
-                break
+    def rows(
+        self: C,
+        mode: str,
+        fields: Iterable[Union[str, Attribute]] = None,
+    ) -> C:
+        """
+        Returns plain python values instead of items, so no item is
+        created for a record. With `"dict"` mode every row is a dict
+        of attribute names and values, with `"tuple"` mode every row
+        is a tuple of values ordered as `fields`.
+
+        :param mode: `"dict"` or `"tuple"`
+        :param fields: fields or attributes to decode, all when omitted
+        :return: the cursor
+        :raises ValueError: when mode or a field is not known
+        """
+        if mode not in (ROWS_DICT, ROWS_TUPLE):
+            raise ValueError(
+                f"Unsupported rows mode `{mode}`, expected "
+                f"`{ROWS_DICT}` or `{ROWS_TUPLE}`."
+            )
+        self._decode_row = row_decoder(
+            self._item_class, fields, mode == ROWS_TUPLE
+        )
+
+        return self
+
+    def _create_columns(
+        self,
+        fields: Optional[Iterable[Union[str, Attribute]]],
+        categorical: Iterable[Union[str, Attribute]],
+    ) -> Columns:
+        return Columns(
+            _resolve_attributes(self._item_class, fields),
+            [
+                attribute.name
+                for attribute in _resolve_attributes(
+                    self._item_class, categorical
+                )
+            ],
+        )
+
+    def _convert(self, record: Record) -> Row[I]:
+        if self._decode_row is not None:
+            return self._decode_row(record)
+
+        if self.hydrate:
+            return hydrate(self._item_class, record)  # type: ignore
+
+        return record
+
+    def _page_query(self) -> Dict[str, Any]:
+        if self._last_evaluated_key:
+            return {
+                **self._query,
+                "ExclusiveStartKey": self._last_evaluated_key,
+            }
+
+        return self._query
+
+    def _build_page(self, result: Dict[str, Any]) -> Page[I]:
+        consumed_capacity = self._record_capacity(result)
+        self._consumed_capacity += consumed_capacity
+        if "LastEvaluatedKey" in result:
+            self._last_evaluated_key = result["LastEvaluatedKey"]
+        else:
+            self._exhausted = True
+
+        return Page(
+            self._item_class,
+            result["Items"],
+            result["Count"],
+            result.get("ScannedCount", result["Count"]),
+            result.get("LastEvaluatedKey"),
+            consumed_capacity,
+        )
+
+    def _record_capacity(self, result: Dict[str, Any]) -> float:
+        consumed_capacity = result.get("ConsumedCapacity", {})
+        if self._ledger is not None:
+            self._ledger.record(
+                self._operation, consumed_capacity, self._scopes
+            )
+
+        return consumed_capacity.get("CapacityUnits", 0.0)
+
+    def _count_query(self) -> Dict[str, Any]:
+        query = {
+            key: value
+            for key, value in self._query.items()
+            if key not in ("ProjectionExpression", "Limit")
+        }
+        query["Select"] = SELECT_COUNT
+
+        return query
+
+    @property
+    def scanned_count(self) -> int:
+        """
+        Number of items evaluated by the last `count` call, before
+        a filter was applied.
+        """
+        return self._scanned_count
+
+    @property
+    def next_token(self) -> Optional[str]:
+        """
+        URL-safe token pointing right after the last consumed page,
+        or `None` when there are no more pages. Items of the page which
+        were not consumed yet are not included in the resumed result.
+        """
+        if not self._next_key:
+            return None
+
+        return encode_token(self._next_key, self._query)
+
+    @property
+    def consumed_capacity(self) -> float:
+        """
+        Capacity units consumed by all pages fetched so far, including
+        capacity consumed by indexes.
+        """
+        return self._consumed_capacity
+
+
+class Cursor(BaseCursor[I]):
+    """
+    Iterates over results of a query or a scan, page by page.
+
+    By default, a cursor is streamed; only the current page is kept in
+    memory and the cursor can be consumed only once. Set `stream` to
+    `False` to keep all fetched records and allow re-iterating.
+
+    With `prefetch` set, up to that many next pages are requested on
+    a background thread while the current page is being consumed.
+
+    `next_token` resumes the result after the last consumed page in
+    another cursor created for the same query with `start_token`.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[I],
+        query: Dict[str, Any],
+        executor: Callable,
+        stream: bool = True,
+        prefetch: int = 0,
+        start_token: Optional[str] = None,
+        ledger: Optional[CapacityLedger] = None,
+    ):
+        super().__init__(item_class, query, executor, start_token, ledger)
+        self.stream = stream
+        self.prefetch = prefetch
+        self._fetched_pages: List[Page[I]] = []
+        # the running iteration is referenced weakly, so an abandoned
+        # iterator is closed, and its background work stopped, once it
+        # is collected, e.g. when a loop is left with `break` or raise
+        self._stream_iterator: Optional[ReferenceType[Generator]] = None
+        self._page_iterator: Optional[Generator] = None
+
+    def __iter__(self) -> Iterator[Row[I]]:
+        if not self.stream:
+            return self._iter_items(self._iter_buffered_pages())
+
+        iterator = self._iter_items(self.pages())
+        self._stream_iterator = ref(iterator)
+
+        return iterator
+
+    def pages(self) -> Iterator[Page[I]]:
+        """
+        Iterates over pages of the result instead of single items.
+        Pages follow the same rules as items; a streamed cursor can be
+        consumed only once.
+
+        :return: iterator over pages
+        :raises amano.errors.CursorError: when the streamed cursor
+            was already consumed
+        """
+        if not self.stream:
+            return self._iter_buffered_pages()
+
+        if self._consumed:
+            raise CursorError.for_consumed_stream()
+        self._consumed = True
+        pages = self._iter_consumed_pages()
+        self._stream_iterator = ref(pages)
+
+        return pages
+
+    def fetch(self, items=0) -> List[Row[I]]:
+        """
+        Fetches items from the beginning of the result. A streamed
+        cursor is consumed by this call and closed afterwards, so
+        the remaining pages are never retrieved.
+
+        :param items: maximum number of items, all items when `0`
+        :return: list of items
+        :raises amano.errors.CursorError: when the streamed cursor
+            was already consumed
+        """
+        if not self.stream:
+            return list(islice(iter(self), items or None))
+
+        try:
+            return list(islice(iter(self), items or None))
+        finally:
+            self.close()
+
+    def to_columns(
+        self,
+        fields: Iterable[Union[str, Attribute]] = None,
+        categorical: Iterable[Union[str, Attribute]] = (),
+    ) -> Dict[str, Column]:
+        """
+        Decodes all pages of the result into columns, one for every
+        attribute, without creating items. Number attributes are kept
+        in typed arrays, other attributes in lists, and attributes
+        passed in `categorical` as codes of unique values.
+
+        :param fields: fields or attributes to decode, all when omitted
+        :param categorical: fields or attributes kept as codes
+        :return: columns keyed by attribute names
+        :raises amano.errors.CursorError: when the streamed cursor
+            was already consumed
+        """
+        columns = self._create_columns(fields, categorical)
+        for page in self.pages():
+            columns.extend(page.records)
+
+        return columns.columns
+
+    def close(self) -> None:
+        """
+        Stops the iteration, no more pages are retrieved afterwards.
+        """
+        iterator = None
+        if self._stream_iterator is not None:
+            iterator = self._stream_iterator()
+        if iterator is not None:
+            iterator.close()
+        self._stream_iterator = None
+        if self._page_iterator is not None:
+            self._page_iterator.close()
+            self._page_iterator = None
+        self._exhausted = True
+
+    def _iter_items(
+        self, pages: Iterator[Page[I]]
+    ) -> Generator[Row[I], None, None]:
+        try:
+            for page in pages:
+                for record in page.records:
+                    yield self._convert(record)
+        finally:
+            pages.close()  # type: ignore[attr-defined]
+
+    def _iter_buffered_pages(self) -> Generator[Page[I], None, None]:
+        if self._page_iterator is None and not self._exhausted:
+            self._page_iterator = self._iter_consumed_pages()
 
-        self._current_index = 0
-        return fetched_items
+        index = 0
+        while True:
+            while index < len(self._fetched_pages):
+                yield self._fetched_pages[index]
+                index += 1
+
+            if self._page_iterator is None:
+                return
+            page = next(self._page_iterator, None)
+            if page is None:
+                return
+            self._fetched_pages.append(page)
+
+    def _iter_consumed_pages(self) -> Generator[Page[I], None, None]:
+        # pages may be prefetched, so the key is taken from the page
+        # which was handed to the consumer
+        pages = self._iter_pages()
+        try:
+            for page in pages:
+                self._next_key = page.last_evaluated_key
+                yield page
+        finally:
+            pages.close()
+
+    def _iter_pages(self) -> Generator[Page[I], None, None]:
+        if not self.prefetch:
+            while not self._exhausted:
+                yield self._fetch_page()
+            return
 
-    def _fetch(self) -> None:
         if self._exhausted:
             return
+        results: Queue = Queue(maxsize=self.prefetch)
+        stop = Event()
+        # the thread does not reference this cursor, so an abandoned
+        # cursor is collected and closing its iterator stops the thread
+        Thread(
+            target=_prefetch_results,
+            args=(self._executor, self._page_query(), results, stop),
+            name=PREFETCH_THREAD_NAME,
+            daemon=True,
+        ).start()
+        try:
+            for result in _consume_pages(results, stop, 1):
+                yield self._build_page(result)
+        except QueryError:
+            self._exhausted = True
+            raise
 
+    def _fetch_page(self) -> Page[I]:
         try:
-            result = self._executor(**self._query)
-            self._consumed_capacity = result["ConsumedCapacity"]["Table"][
-                "CapacityUnits"
-            ]
+            result = self._executor(**self._page_query())
         except Exception as error:
-            self._fetched_records = []
             self._exhausted = True
             raise QueryError.for_client_error(str(error)) from error
-        if "LastEvaluatedKey" in result:
-            self._last_evaluated_key = result["LastEvaluatedKey"]
-            self._query["ExclusiveStartKey"] = result["LastEvaluatedKey"]
-        else:
-            self._exhausted = True
 
-        self._fetched_records = self._fetched_records + result["Items"]
+        return self._build_page(result)
 
     def count(self) -> int:
+        """
+        Counts all items matching the query with `Select=COUNT`, so
+        items are neither transferred nor hydrated. Counting is done
+        in a separate pass, so it does not consume the cursor.
+
+        :return: number of matching items
+        """
+        query = self._count_query()
+        count = 0
+        scanned_count = 0
+        while True:
+            try:
+                result = self._executor(**query)
+            except Exception as error:
+                raise QueryError.for_client_error(str(error)) from error
+            self._record_capacity(result)
+            count += result["Count"]
+            scanned_count += result.get("ScannedCount", 0)
+            if "LastEvaluatedKey" not in result:
+                break
+            query["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+        self._scanned_count = scanned_count
+
+        return count
+
+
+class AsyncCursor(BaseCursor[I]):
+    """
+    Asynchronous version of a cursor, iterated with `async for`. Pages
+    are requested through an awaitable executor, e.g. an async transport.
+
+    An asynchronous cursor is always streamed and can be consumed once.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[I],
+        query: Dict[str, Any],
+        executor: Callable[..., Awaitable[Dict[str, Any]]],
+        start_token: Optional[str] = None,
+        ledger: Optional[CapacityLedger] = None,
+    ):
+        super().__init__(item_class, query, executor, start_token, ledger)
+
+    def __aiter__(self) -> AsyncIterator[Row[I]]:
+        return self._iter_items(self.pages())
+
+    def pages(self) -> AsyncIterator[Page[I]]:
+        """
+        Iterates over pages of the result instead of single items.
+
+        :return: asynchronous iterator over pages
+        :raises amano.errors.CursorError: when the cursor was already
+            consumed
+        """
+        if self._consumed:
+            raise CursorError.for_consumed_stream()
+        self._consumed = True
+
+        return self._iter_pages()
+
+    async def fetch(self, items=0) -> List[Row[I]]:
+        """
+        Fetches items from the beginning of the result and closes
+        the cursor, so the remaining pages are never retrieved.
+
+        :param items: maximum number of items, all items when `0`
+        :return: list of items
+        :raises amano.errors.CursorError: when the cursor was already
+            consumed
+        """
+        result: List[Row[I]] = []
+        iterator = self._iter_items(self.pages())
+        try:
+            async for item in iterator:
+                result.append(item)
+                if len(result) == items:
+                    break
+        finally:
+            await iterator.aclose()
+            self.close()
+
+        return result
+
+    async def to_columns(
+        self,
+        fields: Iterable[Union[str, Attribute]] = None,
+        categorical: Iterable[Union[str, Attribute]] = (),
+    ) -> Dict[str, Column]:
+        """
+        Decodes all pages of the result into columns, one for every
+        attribute, without creating items.
+
+        :param fields: fields or attributes to decode, all when omitted
+        :param categorical: fields or attributes kept as codes
+        :return: columns keyed by attribute names
+        :raises amano.errors.CursorError: when the cursor was already
+            consumed
+        """
+        columns = self._create_columns(fields, categorical)
+        async for page in self.pages():
+            columns.extend(page.records)
+
+        return columns.columns
+
+    def close(self) -> None:
+        """
+        Stops the iteration, no more pages are retrieved afterwards.
+        """
+        self._exhausted = True
+
+    async def count(self) -> int:
+        """
+        Counts all items matching the query with `Select=COUNT`,
+        without consuming the cursor.
+
+        :return: number of matching items
+        """
+        query = self._count_query()
+        count = 0
+        scanned_count = 0
+        while True:
+            try:
+                result = await self._executor(**query)
+            except Exception as error:
+                raise QueryError.for_client_error(str(error)) from error
+            self._record_capacity(result)
+            count += result["Count"]
+            scanned_count += result.get("ScannedCount", 0)
+            if "LastEvaluatedKey" not in result:
+                break
+            query["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+        self._scanned_count = scanned_count
+
+        return count
+
+    async def _iter_items(
+        self, pages: AsyncIterator[Page[I]]
+    ) -> AsyncGenerator[Row[I], None]:
+        try:
+            async for page in pages:
+                for record in page.records:
+                    yield self._convert(record)
+        finally:
+            await pages.aclose()  # type: ignore[attr-defined]
+
+    async def _iter_pages(self) -> AsyncGenerator[Page[I], None]:
         while not self._exhausted:
-            self._fetch()
+            try:
+                result = await self._executor(**self._page_query())
+            except Exception as error:
+                self._exhausted = True
+                raise QueryError.for_client_error(str(error)) from error
+            page = self._build_page(result)
+            self._next_key = page.last_evaluated_key
+            yield page
 
-        return len(self._fetched_records)
 
-    @property
-    def consumed_capacity(self) -> float:
-        return self._consumed_capacity
+def _put_page(pages: Queue, value: Any, stop: Event) -> None:
+    while not stop.is_set():
+        try:
+            pages.put(value, timeout=_QUEUE_TIMEOUT)
+            return
+        except Full:
+            continue
+
+
+def _prefetch_results(
+    executor: Callable,
+    query: Dict[str, Any],
+    results: Queue,
+    stop: Event,
+) -> None:
+    """
+    Requests consecutive pages of a query and puts raw results into
+    the queue, until the last page is fetched or `stop` is set.
+    """
+    try:
+        while not stop.is_set():
+            try:
+                result = executor(**query)
+            except Exception as error:
+                raise QueryError.for_client_error(str(error)) from error
+            _put_page(results, result, stop)
+            if "LastEvaluatedKey" not in result:
+                break
+            query = {**query, "ExclusiveStartKey": result["LastEvaluatedKey"]}
+    except Exception as error:
+        _put_page(results, error, stop)
+    _put_page(results, _PAGES_DONE, stop)
+
+
+def _consume_pages(
+    pages: Queue, stop: Event, producers: int
+) -> Generator[Any, None, None]:
+    """
+    Yields pages, or raw results, put into the queue by background
+    producers until all of them are done. Errors raised by producers are re-raised here, and
+    closing the generator stops the producers.
+    """
+    try:
+        finished = 0
+        while finished < producers:
+            page = pages.get()
+            if page is _PAGES_DONE:
+                finished += 1
+                continue
+            if isinstance(page, BaseException):
+                raise page
+            yield page
+    finally:
+        stop.set()
+        # unblock producers waiting for a free slot in the queue
+        while True:
+            try:
+                pages.get_nowait()
+            except Empty:
+                break
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from . import Attribute
+from .attribute import Attribute
 from .condition import Condition
 from .index import LocalSecondaryIndex
 from .item import Item
@@ -60,12 +60,39 @@ class QueryError(AmanoDBError):
         return cls(f"Used unknown or invalid index `{index}` in query.")
 
 
+class CursorError(QueryError):
+    @classmethod
+    def for_consumed_stream(cls) -> CursorError:
+        return cls(
+            "Streamed cursor can be iterated only once, "
+            "use `stream=False` to keep fetched items and re-iterate them."
+        )
+
+    @classmethod
+    def for_invalid_token(cls, reason: str) -> CursorError:
+        return cls(f"Could not resume cursor from a token, {reason}.")
+
+    @classmethod
+    def for_unsupported_token(cls) -> CursorError:
+        return cls("Parallel scan cannot be resumed from a token.")
+
+
 class ReadError(AmanoDBError):
-    pass
+    @classmethod
+    def for_unprocessed_keys(cls, keys_count: int) -> ReadError:
+        return cls(
+            f"Could not retrieve {keys_count} key(s), retries were exhausted "
+            f"while processing `UnprocessedKeys`."
+        )
 
 
 class WriteError(AmanoDBError):
-    pass
+    @classmethod
+    def for_unprocessed_items(cls, items_count: int) -> WriteError:
+        return cls(
+            f"Could not write {items_count} item(s), retries were exhausted "
+            f"while processing `UnprocessedItems`."
+        )
 
 
 class ItemNotFoundError(ReadError):
@@ -96,3 +123,38 @@ class DeleteItemError(WriteError):
             f"Could not validate item {item}. "
             f"Validation failed with message: {message}"
         )
+
+
+class TransactionError(WriteError):
+    @classmethod
+    def for_too_many_actions(cls, actions_count: int) -> TransactionError:
+        return cls(
+            f"Transaction contains {actions_count} actions, "
+            f"DynamoDB supports up to 100 actions in a single transaction."
+        )
+
+
+class TransactionCanceledError(TransactionError):
+    def __init__(self, message: str, reasons: List[Dict[str, Any]]):
+        self.reasons = reasons
+        super().__init__(message)
+
+    @classmethod
+    def for_reasons(
+        cls, reasons: List[Dict[str, Any]]
+    ) -> TransactionCanceledError:
+        codes = ", ".join(reason.get("Code", "None") for reason in reasons)
+        return cls(f"Transaction was canceled, reasons: [{codes}].", reasons)
+
+
+class ExportError(AmanoDBError):
+    @classmethod
+    def for_missing_dependency(cls, package: str) -> ExportError:
+        return cls(
+            f"Export requires `{package}` package, "
+            f"install it with `pip install {package}`."
+        )
+
+    @classmethod
+    def for_invalid_value(cls, name: str, error: Exception) -> ExportError:
+        return cls(f"Cannot export value of `{name}` attribute: {error}")
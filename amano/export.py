@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from decimal import Decimal
+from os import makedirs, path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type, Union
+
+from .attribute import Attribute
+from .columns import Column, Columns, decoders_for
+from .cursor import Cursor, Record
+from .errors import ExportError
+from .item import Item, _resolve_attributes
+from .parallel import ParallelCursor
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore[assignment]
+
+# Arrow types of attributes by their annotation, `Decimal` values are
+# exported as decimal128, values of other types (lists, maps, sets) are
+# exported as JSON strings
+_ARROW_TYPES: Dict[Any, Callable[[], Any]] = {
+    str: lambda: pyarrow.string(),
+    int: lambda: pyarrow.int64(),
+    float: lambda: pyarrow.float64(),
+    bool: lambda: pyarrow.bool_(),
+    bytes: lambda: pyarrow.binary(),
+    datetime: lambda: pyarrow.timestamp("us"),
+    date: lambda: pyarrow.date32(),
+    time: lambda: pyarrow.time64("us"),
+}
+
+SEGMENT_FILE_NAME = "segment-{segment:04d}.parquet"
+
+# DynamoDB numbers have up to 38 significant digits
+DECIMAL_PRECISION = 38
+DECIMAL_SCALE = 18
+
+
+def arrow_schema(
+    item_class: Type[Item],
+    fields: Iterable[Union[str, Attribute]] = None,
+    decimal_scale: int = DECIMAL_SCALE,
+) -> Any:
+    """
+    Derives an Arrow schema from the item class' schema, with a nullable
+    field for every attribute, named as the attribute.
+
+    :param fields: fields or attributes to export, all when omitted
+    :param decimal_scale: digits after the decimal point of `Decimal`
+        attributes, exported as `decimal128(38, decimal_scale)`
+    :return: `pyarrow.Schema`
+    :raises amano.errors.ExportError: when pyarrow is not installed
+    """
+    _require_pyarrow()
+    return _arrow_schema(_resolve_attributes(item_class, fields), decimal_scale)
+
+
+class ArrowSink:
+    """
+    Converts pages of DynamoDB records to Arrow record batches, one
+    batch per page, so only a single page is decoded at a time.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[Item],
+        fields: Iterable[Union[str, Attribute]] = None,
+        decimal_scale: int = DECIMAL_SCALE,
+    ):
+        _require_pyarrow()
+        self._attributes = _resolve_attributes(item_class, fields)
+        self._decoders = decoders_for(self._attributes)
+        self.schema = _arrow_schema(self._attributes, decimal_scale)
+
+    def batch(self, records: List[Record]) -> Any:
+        """
+        :raises amano.errors.ExportError: when a value does not fit in
+            its Arrow type, e.g. a `Decimal` with more digits than
+            `decimal_scale` after the decimal point
+        """
+        columns = Columns(
+            self._attributes, decoders=self._decoders, exact_decimals=True
+        )
+        columns.extend(records)
+
+        return pyarrow.record_batch(
+            [
+                _arrow_array(column, field.type)
+                for column, field in zip(columns.columns.values(), self.schema)
+            ],
+            schema=self.schema,
+        )
+
+    def batches(self, cursor: Cursor) -> Iterator[Any]:
+        """
+        Streams pages of the cursor as record batches. Empty pages,
+        e.g. filtered out entirely, are skipped.
+        """
+        for page in cursor.pages():
+            if page.records:
+                yield self.batch(page.records)
+
+
+class ParquetSink(ArrowSink):
+    """
+    Writes pages of DynamoDB records to a Parquet file, every page
+    is written as a separate row group.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[Item],
+        file_path: str,
+        fields: Iterable[Union[str, Attribute]] = None,
+        decimal_scale: int = DECIMAL_SCALE,
+        **options: Any,
+    ):
+        super().__init__(item_class, fields, decimal_scale)
+        self.path = file_path
+        self.rows = 0
+        self._writer = pyarrow.parquet.ParquetWriter(
+            file_path, self.schema, **options
+        )
+
+    def write(self, records: List[Record]) -> None:
+        if not records:
+            return
+        batch = self.batch(records)
+        self._writer.write_table(pyarrow.Table.from_batches([batch]))
+        self.rows += batch.num_rows
+
+    def write_cursor(self, cursor: Cursor) -> int:
+        for page in cursor.pages():
+            self.write(page.records)
+
+        return self.rows
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> ParquetSink:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def export_parquet(
+    cursor: Cursor,
+    file_path: str,
+    fields: Iterable[Union[str, Attribute]] = None,
+    decimal_scale: int = DECIMAL_SCALE,
+    **options: Any,
+) -> int:
+    """
+    Streams all pages of a cursor to a single Parquet file, memory
+    usage is bounded by the size of a page.
+
+    :param fields: fields or attributes to export, all when omitted
+    :param decimal_scale: digits after the decimal point of `Decimal`
+        attributes, exported as `decimal128(38, decimal_scale)`
+    :param options: passed to `pyarrow.parquet.ParquetWriter`
+    :return: number of exported items
+    :raises amano.errors.ExportError: when pyarrow is not installed,
+        or a value does not fit in its Arrow type
+    """
+    with ParquetSink(
+        cursor._item_class, file_path, fields, decimal_scale, **options
+    ) as sink:
+        return sink.write_cursor(cursor)
+
+
+def export_segments(
+    cursor: ParallelCursor,
+    directory: str,
+    fields: Iterable[Union[str, Attribute]] = None,
+    decimal_scale: int = DECIMAL_SCALE,
+    **options: Any,
+) -> List[str]:
+    """
+    Exports every segment of a parallel scan to its own Parquet file,
+    `segment-0000.parquet` and so on. Segments are exported in a thread
+    pool of cursor's `max_workers` threads.
+
+    :param fields: fields or attributes to export, all when omitted
+    :param decimal_scale: digits after the decimal point of `Decimal`
+        attributes, exported as `decimal128(38, decimal_scale)`
+    :param options: passed to `pyarrow.parquet.ParquetWriter`
+    :return: paths of written files, ordered by segment
+    :raises amano.errors.ExportError: when pyarrow is not installed,
+        or a value does not fit in its Arrow type
+    """
+    _require_pyarrow()
+    makedirs(directory, exist_ok=True)
+    fields = None if fields is None else list(fields)
+    cursors = cursor._segment_cursors()
+    paths = [
+        path.join(directory, SEGMENT_FILE_NAME.format(segment=segment))
+        for segment in range(len(cursors))
+    ]
+
+    def _export(segment: int) -> None:
+        export_parquet(
+            cursors[segment], paths[segment], fields, decimal_scale, **options
+        )
+
+    with ThreadPoolExecutor(max_workers=cursor._max_workers) as pool:
+        list(pool.map(_export, range(len(cursors))))
+
+    return paths
+
+
+def _arrow_schema(attributes: List[Attribute], decimal_scale: int) -> Any:
+    return pyarrow.schema(
+        [
+            pyarrow.field(attribute.name, _arrow_type(attribute, decimal_scale))
+            for attribute in attributes
+        ]
+    )
+
+
+def _arrow_type(attribute: Attribute, decimal_scale: int) -> Any:
+    attribute_type = attribute.__attribute_type__  # type: ignore
+    if attribute_type is Decimal:
+        return pyarrow.decimal128(DECIMAL_PRECISION, decimal_scale)
+    if attribute_type in _ARROW_TYPES:
+        return _ARROW_TYPES[attribute_type]()
+
+    return pyarrow.string()
+
+
+def _arrow_array(column: Column, arrow_type: Any) -> Any:
+    try:
+        return pyarrow.array(_column_values(column), type=arrow_type)
+    except pyarrow.ArrowInvalid as error:
+        raise ExportError.for_invalid_value(column.name, error) from error
+
+
+def _column_values(column: Column) -> List[Any]:
+    attribute_type = column.attribute.__attribute_type__  # type: ignore
+    values = column.to_list()
+    if attribute_type in _ARROW_TYPES or attribute_type is Decimal:
+        return values
+
+    return [
+        None if value is None else _to_json(column.attribute, value)
+        for value in values
+    ]
+
+
+def _to_json(attribute: Attribute, value: Any) -> str:
+    return json.dumps(attribute.extract(value), default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, Decimal):
+        return float(value)
+
+    return str(value)
+
+
+def _require_pyarrow() -> None:
+    if pyarrow is None:
+        raise ExportError.for_missing_dependency("pyarrow")
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import Field, dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
 from inspect import isclass
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
+    Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -19,8 +25,20 @@ from typing import (
 from amano.attribute import Attribute
 
 from .attributemapping import AttributeMapping, AttributeMappingStrategy
-from .base_attribute import AttributeValue, deserialize_value, serialize_value
-from .undefined import UNDEFINED
+from .base_attribute import AttributeValue
+from .codec import (
+    Decoder,
+    Extractor,
+    Hydrator,
+    RowDecoder,
+    compile_decoders,
+    compile_extractor,
+    compile_hydrator,
+    compile_lazy_hydrator,
+    compile_row_decoder,
+)
+from .constants import ITEM_HISTORY_DEPTH
+from .undefined import ABSENT, UNDEFINED
 
 
 @dataclass
@@ -107,11 +125,128 @@ def _create_init(base_init: Union[Callable, None]) -> Callable:
             parameters = _build_input_parameters(item, args, kwargs)
             for name, value in parameters.items():
                 setattr(item, name, value)
-        item.__log__ = []
+        _clear_changes(item)
 
     return _init_item
 
 
+def _new_item(cls, *args, **kwargs) -> Item:
+    # every instance, including hydrated and unpickled ones, gets its own
+    # change log before any attribute is set
+    instance = object.__new__(cls)
+    object.__setattr__(instance, "__log__", [])
+    return instance
+
+
+def _compact_new(cls, *args, **kwargs) -> Item:
+    instance = object.__new__(cls)
+    for member in cls.__members__:
+        member.__set__(instance, ABSENT)
+    object.__setattr__(instance, "__dirty__", 0)
+    object.__setattr__(instance, "__snapshot__", None)
+    object.__setattr__(instance, "__version__", 0)
+    return instance
+
+
+def _compact_getattribute(self: Item, key: str) -> Any:
+    if key.startswith("_") or key.isupper():
+        return object.__getattribute__(self, key)
+
+    position = self.__positions__.get(key)
+    if position is None:
+        return object.__getattribute__(self, key)
+
+    value = self.__members__[position].__get__(self)
+    if value is not ABSENT:
+        return value
+
+    default_value = self.__schema__[key].default_value
+    if default_value != UNDEFINED:
+        return default_value
+
+    raise AttributeError(
+        f"Instance of `{self.__class__}` has no attribute `{key}`"
+    )
+
+
+def _compact_setattr(self: Item, key: str, value: Any) -> None:
+    position = self.__positions__.get(key)
+    if position is None:
+        return object.__setattr__(self, key, value)
+
+    if isinstance(value, Attribute):
+        value = value.default_value
+
+    _compact_snapshot(self, position)
+    self.__members__[position].__set__(self, value)
+
+
+def _compact_delattr(self: Item, key: str) -> None:
+    position = self.__positions__[key]
+    member = self.__members__[position]
+    if member.__get__(self) is ABSENT:
+        return
+    _compact_snapshot(self, position)
+    member.__set__(self, ABSENT)
+
+
+def _compact_snapshot(item: Item, position: int) -> None:
+    # the committed value is kept when a position is changed first time
+    if item.__dirty__ & (1 << position):
+        return
+    if item.__snapshot__ is None:
+        item.__snapshot__ = {}
+    item.__snapshot__[position] = item.__members__[position].__get__(item)
+    item.__dirty__ |= 1 << position
+
+
+def _lazy_getattribute(self: Item, key: str) -> Any:
+    if not (key.startswith("_") or key.isupper()):
+        _lazy_decode(self, key)
+    return Item.__getattribute__(self, key)
+
+
+def _lazy_setattr(self: Item, key: str, value: Any) -> None:
+    # the committed value is decoded first, so it can be snapshotted
+    _lazy_decode(self, key)
+    Item.__setattr__(self, key, value)
+
+
+def _lazy_delattr(self: Item, key: str) -> None:
+    _lazy_decode(self, key)
+    raw = self.__dict__.get("__raw__")
+    attribute = self.__schema__.get(key)
+    if raw and attribute is not None and attribute.name in raw:
+        # the record may be shared, so a copy without the value is kept
+        self.__dict__["__raw__"] = {
+            name: value for name, value in raw.items() if name != attribute.name
+        }
+    Item.__delattr__(self, key)
+
+
+def _lazy_decode(item: Item, key: str) -> None:
+    # values are decoded from the raw record once, on the first access
+    state = item.__dict__
+    raw = state.get("__raw__")
+    if not raw or key in state:
+        return
+    attribute = item.__schema__.get(key)
+    if attribute is None or attribute.name not in raw:
+        return
+    state[key] = _lazy_decoders(type(item))[key](raw[attribute.name])
+
+
+def _lazy_decoders(what: Type[Item]) -> Dict[str, Decoder]:
+    # decoders are compiled on the first access, not by `hydrate`, so
+    # unpickled and copied items can be decoded too
+    decoders = what.__dict__.get("__decoders__")
+    if decoders is None:
+        decoders = compile_decoders(what.__schema__)
+        setattr(what, "__decoders__", decoders)
+
+    return decoders
+
+
 class ItemMeta(type):
     def __new__(cls, what, bases, body: dict, **meta) -> ItemMeta:
         class_module = body.get("__module__")
@@ -127,6 +262,18 @@ class ItemMeta(type):
         )
 
         body["__init__"] = _create_init(body.get("__init__"))
+        if "history" in meta:
+            body["__history__"] = ItemMeta._get_history(meta)
+        compact = meta.get("compact", any(_is_compact(base) for base in bases))
+        lazy = meta.get("lazy", any(_is_lazy(base) for base in bases))
+        if compact and lazy:
+            raise TypeError("Item class cannot be both compact and lazy.")
+        if compact:
+            body = {**body, **ItemMeta._create_compact_body(bases, schema)}
+        elif "__new__" not in body:
+            body["__new__"] = _new_item
+        if lazy:
+            body = {**body, **ItemMeta._create_lazy_body()}
 
         new_class = type.__new__(
             cls,
@@ -134,17 +281,59 @@ class ItemMeta(type):
             bases,
             {
                 **body,
-                **{
-                    "__schema__": schema,
-                    "__log__": [],
-                    "__commits__": [],
-                },
+                "__schema__": schema,
                 **schema,
             },
         )
 
+        if compact:
+            members = tuple(
+                getattr(new_class, _slot_name(position))
+                for position in range(len(schema))
+            )
+            setattr(new_class, "__members__", members)
+
         return new_class
 
+    @staticmethod
+    def _create_compact_body(bases, schema: ItemSchema) -> Dict[str, Any]:
+        # every value is kept in its own slot, named after its position
+        # in the schema, changed positions are marked in the `__dirty__`
+        # bitmask; slots of compact bases are reused by subclasses
+        inherited = max(
+            (len(base.__schema__) for base in bases if _is_compact(base)),
+            default=-1,
+        )
+        slots: Tuple[str, ...] = tuple(
+            _slot_name(position)
+            for position in range(max(inherited, 0), len(schema))
+        )
+        if inherited < 0:
+            slots = ("__dirty__", "__snapshot__", "__version__") + slots
+
+        return {
+            "__slots__": slots,
+            "__compact__": True,
+            "__positions__": {
+                field: index for index, field in enumerate(schema)
+            },
+            "__new__": _compact_new,
+            "__getattribute__": _compact_getattribute,
+            "__setattr__": _compact_setattr,
+            "__delattr__": _compact_delattr,
+        }
+
+    @staticmethod
+    def _create_lazy_body() -> Dict[str, Any]:
+        # hydrated items keep the raw record in `__raw__`, attributes
+        # are decoded from it when they are accessed first time
+        return {
+            "__lazy__": True,
+            "__getattribute__": _lazy_getattribute,
+            "__setattr__": _lazy_setattr,
+            "__delattr__": _lazy_delattr,
+        }
+
     @staticmethod
     def _create_schema(all_annotations, mapping, body) -> ItemSchema:
         schema = {}
@@ -171,6 +360,15 @@ class ItemMeta(type):
 
         return Attribute[attr_type](attr_name, lambda: field)  # type: ignore
 
+    @staticmethod
+    def _get_history(meta) -> int:
+        history = meta["history"]
+        if not isinstance(history, int) or history < 0:
+            raise ValueError(
+                f"history must be a non-negative int, `{history}` passed instead."
+            )
+        return history
+
     @staticmethod
     def _get_mapping(meta) -> AttributeMappingStrategy:
         mapping = AttributeMapping.PASS_THROUGH
@@ -212,9 +410,19 @@ class ItemMeta(type):
 
 
 class Item(metaclass=ItemMeta):
+    __slots__ = ()
     __log__: List[AttributeChange]
     __schema__: ItemSchema
-    __commits__: List[Commit]
+    __commits__: Sequence[Commit] = ()
+    __history__ = ITEM_HISTORY_DEPTH
+    __version__ = 0
+    __compact__ = False
+    __lazy__ = False
+    __decoders__: Dict[str, Decoder]
+    __positions__: Dict[str, int]
+    __members__: Tuple[Any, ...]
+    __dirty__: int
+    __snapshot__: Optional[Dict[Any, Any]]
 
     def __getattribute__(self, key: str) -> Any:
         if key.startswith("_") or key.isupper():
@@ -249,6 +457,7 @@ class Item(metaclass=ItemMeta):
             )
 
         self.__log__.append(log_item)
+        _snapshot(self, key)
 
         if isinstance(value, Attribute):
             value = value.default_value
@@ -262,64 +471,165 @@ class Item(metaclass=ItemMeta):
             self.__schema__[key], AttributeChange.Type.UNSET, None
         )
         self.__log__.append(log_item)
+        _snapshot(self, key)
         del self.__dict__[key]
 
 
 I = TypeVar("I", bound=Item)
 
 
+def _is_compact(base: type) -> bool:
+    return getattr(base, "__compact__", False)
+
+
+def _slot_name(position: int) -> str:
+    return f"_value_{position}"
+
+
+def _is_lazy(base: type) -> bool:
+    return getattr(base, "__lazy__", False)
+
+
+# Values of these types are compared with a snapshot, values of other
+# types may be changed in place, so they are changed once assigned
+_IMMUTABLE_TYPES = frozenset(
+    [str, int, float, bool, Decimal, bytes, date, datetime, time, type(None)]
+)
+
+
+def _snapshot(item: Item, key: str) -> None:
+    # the committed value is kept when an attribute is changed first time
+    state = item.__dict__
+    snapshot = state.get("__snapshot__")
+    if snapshot is None:
+        snapshot = state["__snapshot__"] = {}
+    if key not in snapshot:
+        snapshot[key] = state.get(key, ABSENT)
+
+
+def _clear_changes(item: Item) -> None:
+    if item.__compact__:
+        item.__dirty__ = 0
+        item.__snapshot__ = None
+    else:
+        item.__log__.clear()
+        item.__dict__.pop("__snapshot__", None)
+
+
+def _has_changes(item: Item) -> bool:
+    return any(True for _ in _changes(item))
+
+
+def _is_changed(committed: Any, current: Any) -> bool:
+    if committed is ABSENT or current is ABSENT:
+        return committed is not current
+
+    return not (
+        type(current) is type(committed)
+        and type(current) in _IMMUTABLE_TYPES
+        and current == committed
+    )
+
+
+def _changes(item: Item) -> Iterator[AttributeChange]:
+    """
+    Compares changed attributes with their last committed values,
+    yields a single change for every attribute which differs.
+    """
+    if item.__compact__:
+        snapshot = item.__snapshot__ or {}
+        members = item.__members__
+        changed = [
+            (attribute, snapshot[position], members[position].__get__(item))
+            for position, attribute in enumerate(item.__schema__.values())
+            if position in snapshot
+        ]
+    else:
+        snapshot = item.__dict__.get("__snapshot__") or {}
+        state = item.__dict__
+        changed = [
+            (item.__schema__[key], committed, state.get(key, ABSENT))
+            for key, committed in snapshot.items()
+        ]
+
+    for attribute, committed, current in changed:
+        if not _is_changed(committed, current):
+            continue
+        if current is ABSENT:
+            change_type = AttributeChange.Type.UNSET
+        elif committed is ABSENT:
+            change_type = AttributeChange.Type.SET
+        else:
+            change_type = AttributeChange.Type.CHANGE
+        yield AttributeChange(
+            attribute,
+            change_type,
+            None if current is ABSENT else current,
+        )
+
+
 def commit(item: Item) -> None:
-    changes = Commit()
-    for entry in item.__log__:
-        changes.append(entry)
+    """
+    Marks item's changes as synchronized with the database. Only
+    `__history__` latest commits are kept by the item.
+    """
+    if item.__history__ and not item.__compact__:
+        _record_commit(item)
+        item.__log__ = []
+    _clear_changes(item)
+    item.__version__ += 1
+
 
-    item.__log__.clear()
-    item.__commits__.append(changes)
+def _record_commit(item: Item) -> None:
+    changes = Commit()
+    changes.log = item.__log__
+    commits = item.__dict__.get("__commits__")
+    if commits is None:
+        commits = deque(maxlen=item.__history__)
+        item.__commits__ = commits
+    commits.append(changes)
 
 
 def diff(item: Item) -> Diff:
+    """
+    Builds an update expression with a single `SET` or `REMOVE` action
+    for every attribute which differs from its last committed value.
+    """
     set_fields = []
-    delete_fields = []
+    remove_fields = []
     attribute_values = {}
 
-    for change in item.__log__:
-        if change.type in (
-            AttributeChange.Type.CHANGE,
-            AttributeChange.Type.SET,
-        ):
-            set_fields.append(change.attribute.name)
-            attribute_values[
-                ":" + change.attribute.name
-            ] = change.attribute.extract(change.value)
-            continue
+    for change in _changes(item):
+        name = change.attribute.name
         if change.type is AttributeChange.Type.UNSET:
-            delete_fields.append(change.attribute.name)
+            remove_fields.append(name)
+            continue
+        set_fields.append(f"{name} = :{name}")
+        attribute_values[":" + name] = change.attribute.extract(change.value)
 
     update_expression = ""
     if set_fields:
-        set_fields_expression = ','.join(
-            [field_name + ' = :' + field_name for field_name in set_fields]
-        )
-        update_expression = f"SET {set_fields_expression} "
-    if delete_fields:
-        update_expression += (
-            f"DELETE {','.join([field_name for field_name in set_fields])} "
-        )
+        update_expression = f"SET {','.join(set_fields)} "
+    if remove_fields:
+        update_expression += f"REMOVE {','.join(remove_fields)} "
 
     return update_expression, attribute_values
 
 
-def hydrate(what: Type[I], value: Dict[str, Any]) -> I:
-    value = deserialize_value({"M": value})
-    return from_dict(what, value)
+def hydrate(what: Type[I], value: Dict[str, AttributeValue]) -> I:
+    """
+    Creates a clean item from a DynamoDB record. The decoding function
+    is generated for every item class on the first use.
+    """
+    hydrator = what.__dict__.get("__hydrator__")
+    if hydrator is None:
+        hydrator = _compile_hydrator(what)
+
+    return hydrator(value)
 
 
 def from_dict(what: Type[I], value: Dict[str, Any]) -> I:
-    if not issubclass(what, Item):
-        raise TypeError(
-            f"Could not hydrate class {what.__qualname__}. expected "
-            f"a subtype of {Item.__qualname__} class."
-        )
+    _validate_item_class(what)
     instance = what.__new__(what)
     for field, attribute in what.__schema__.items():
         if attribute.name not in value:
@@ -330,8 +640,96 @@ def from_dict(what: Type[I], value: Dict[str, Any]) -> I:
     return instance
 
 
+def _compile_hydrator(what: Type[I]) -> Hydrator:
+    _validate_item_class(what)
+    if what.__lazy__:
+        hydrator = compile_lazy_hydrator(what, _mark_clean)
+    else:
+        hydrator = compile_hydrator(what, what.__schema__, _mark_clean)
+    setattr(what, "__hydrator__", hydrator)
+
+    return hydrator
+
+
+def row_decoder(
+    what: Type[Item],
+    fields: Iterable[Union[str, Attribute]] = None,
+    as_tuple: bool = False,
+) -> RowDecoder:
+    """
+    Returns a function which decodes DynamoDB records of `what` to
+    plain dicts or tuples of python values. The function is generated
+    once for every class and selection of fields.
+
+    :param fields: fields or attributes to decode, all when omitted
+    :param as_tuple: decode to tuples ordered as `fields`
+    :raises ValueError: when an unknown field is passed
+    """
+    attributes = _resolve_attributes(what, fields)
+    key = (tuple(attribute.name for attribute in attributes), as_tuple)
+    decoders = what.__dict__.get("__row_decoders__")
+    if decoders is None:
+        decoders = {}
+        setattr(what, "__row_decoders__", decoders)
+    if key not in decoders:
+        decoders[key] = compile_row_decoder(attributes, as_tuple)
+
+    return decoders[key]
+
+
+def _resolve_attributes(
+    what: Type[Item], fields: Optional[Iterable[Union[str, Attribute]]]
+) -> List[Attribute]:
+    if fields is None:
+        return list(what.__schema__.values())
+
+    attributes = []
+    for field in fields:
+        if isinstance(field, Attribute):
+            attributes.append(field)
+            continue
+        if field not in what.__schema__:
+            raise ValueError(f"Unknown field `{field}` for `{what}`.")
+        attributes.append(what.__schema__[field])
+
+    return attributes
+
+
+def _mark_clean(item: Item) -> None:
+    # freshly loaded items have nothing to commit, so they are marked
+    # clean without recording changes or commits
+    if item.__compact__:
+        item.__version__ = 1
+    else:
+        item.__dict__["__version__"] = 1
+
+
+def _validate_item_class(what: type) -> None:
+    if not isclass(what) or not issubclass(what, Item):
+        raise TypeError(
+            f"Could not hydrate class {what.__qualname__}. expected "
+            f"a subtype of {Item.__qualname__} class."
+        )
+
+
 def extract(value: Item) -> Dict[str, AttributeValue]:
-    return serialize_value(as_dict(value)).get("M")
+    """
+    Serializes an item to a DynamoDB record. The encoding function
+    is generated for every item class on the first use.
+    """
+    item_class = value.__class__
+    extractor = item_class.__dict__.get("__extractor__")
+    if extractor is None:
+        extractor = _compile_extractor(item_class)
+
+    return extractor(value)
+
+
+def _compile_extractor(what: Type[Item]) -> Extractor:
+    extractor = compile_extractor(what, what.__schema__)
+    setattr(what, "__extractor__", extractor)
+
+    return extractor
 
 
 def as_dict(value: Item) -> Dict[str, Any]:
@@ -343,10 +741,7 @@ def as_dict(value: Item) -> Dict[str, Any]:
 
 
 def get_item_state(value: Item) -> ItemState:
-    if not value.__log__ and len(value.__commits__) >= 1:
-        return ItemState.CLEAN
-
-    if not value.__commits__ and not value.__log__:
-        return ItemState.NEW
+    if _has_changes(value):
+        return ItemState.DIRTY
 
-    return ItemState.DIRTY
+    return ItemState.CLEAN if value.__version__ else ItemState.NEW
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from functools import partial
+from threading import Lock
+from time import sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .base_attribute import serialize_value
+from .constants import BATCH_GET_ITEM_LIMIT, COALESCE_WINDOW
+from .errors import ItemNotFoundError
+from .item import I
+from .utils import MissingKey, key_identity
+
+if TYPE_CHECKING:
+    from .table import Table
+
+_PendingGet = Tuple[Tuple[Any, ...], Dict[str, Any], Any]
+
+
+class _Batch:
+    def __init__(self, consistent_read: bool):
+        self.consistent_read = consistent_read
+        # every get has its own future, so callers requesting the same
+        # key receive separate items; keys are deduplicated by batch_get
+        self.gets: List[_PendingGet] = []
+        self.identities: Set[Tuple] = set()
+
+    def add(self, identity: Tuple, get: _PendingGet) -> None:
+        self.identities.add(identity)
+        self.gets.append(get)
+
+    def __len__(self) -> int:
+        return len(self.identities)
+
+
+class GetLoader(Generic[I]):
+    """
+    Coalesces independent `get` calls issued within a short time window
+    (or a single event loop iteration) into `BatchGetItem` requests.
+    """
+
+    def __init__(
+        self,
+        table: Table[I],
+        window: float = COALESCE_WINDOW,
+        max_batch_size: int = BATCH_GET_ITEM_LIMIT,
+    ):
+        self._table = table
+        self._window = window
+        self._max_batch_size = min(max_batch_size, BATCH_GET_ITEM_LIMIT)
+        self._lock = Lock()
+        self._batches: Dict[bool, _Batch] = {}
+        self._async_batches: Dict[Tuple[int, bool], _Batch] = {}
+        self._async_tasks: Set[asyncio.Task] = set()
+
+    def load(self, *keys: Any, consistent_read: bool = False) -> I:
+        """
+        Retrieves an item by its primary key, waiting for the current
+        time window to collect other gets first.
+
+        :raises amano.errors.ItemNotFoundError: when item does not exist
+        """
+        identity, key_query = self._identify(keys)
+        with self._lock:
+            batch = self._batches.get(consistent_read)
+            leader = batch is None
+            if batch is None:
+                batch = self._batches[consistent_read] = _Batch(consistent_read)
+            future: Future = Future()
+            batch.add(identity, (keys, key_query, future))
+            full = len(batch) >= self._max_batch_size
+            if full:
+                del self._batches[consistent_read]
+
+        if full:
+            self._dispatch(batch)
+        elif leader:
+            sleep(self._window)
+            with self._lock:
+                dispatch = self._batches.get(consistent_read) is batch
+                if dispatch:
+                    del self._batches[consistent_read]
+            if dispatch:
+                self._dispatch(batch)
+
+        return future.result()
+
+    def aload(self, *keys: Any, consistent_read: bool = False) -> Awaitable[I]:
+        """
+        Asynchronous version of `load`, gets issued within the same
+        event loop iteration are dispatched together in a thread pool.
+
+        :raises amano.errors.ItemNotFoundError: when item does not exist
+        """
+        loop = asyncio.get_running_loop()
+        identity, key_query = self._identify(keys)
+        batch_key = (id(loop), consistent_read)
+        batch = self._async_batches.get(batch_key)
+        if batch is None:
+            batch = self._async_batches[batch_key] = _Batch(consistent_read)
+            loop.call_soon(self._dispatch_async, loop, batch_key, batch)
+        future = loop.create_future()
+        batch.add(identity, (keys, key_query, future))
+        if len(batch) >= self._max_batch_size:
+            self._dispatch_async(loop, batch_key, batch)
+
+        return future
+
+    def _identify(self, keys: Tuple[Any, ...]) -> Tuple[Tuple, Dict[str, Any]]:
+        key_query = self._table._build_key_query(keys)
+        return key_identity(serialize_value(key_query)["M"]), key_query
+
+    def _dispatch(self, batch: _Batch) -> None:
+        pending = list(batch.gets)
+        try:
+            items = self._fetch(batch)
+        except Exception as error:
+            for _, _, future in pending:
+                future.set_exception(error)
+            return
+
+        for (_, key_query, future), item in zip(pending, items):
+            if item is None:
+                future.set_exception(self._not_found(key_query))
+            else:
+                future.set_result(item)
+
+    def _dispatch_async(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch_key: Tuple[int, bool],
+        batch: _Batch,
+    ) -> None:
+        if self._async_batches.get(batch_key) is not batch:
+            return
+        del self._async_batches[batch_key]
+        task = loop.create_task(self._resolve_async(loop, batch))
+        self._async_tasks.add(task)
+        task.add_done_callback(self._async_tasks.discard)
+
+    async def _resolve_async(
+        self, loop: asyncio.AbstractEventLoop, batch: _Batch
+    ) -> None:
+        pending = list(batch.gets)
+        try:
+            items = await loop.run_in_executor(
+                None, partial(self._fetch, batch)
+            )
+        except Exception as error:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, key_query, future), item in zip(pending, items):
+            if future.done():
+                continue
+            if item is None:
+                future.set_exception(self._not_found(key_query))
+            else:
+                future.set_result(item)
+
+    def _fetch(self, batch: _Batch) -> List[Optional[I]]:
+        return self._table.batch_get(
+            [keys for keys, _, _ in batch.gets],
+            consistent_read=batch.consistent_read,
+            on_missing=MissingKey.RETURN_NONE,
+        )
+
+    def _not_found(self, key_query: Dict[str, Any]) -> ItemNotFoundError:
+        return ItemNotFoundError(
+            f"Could not retrieve item `{self._table._item_class}` "
+            f"matching criteria `{key_query}`",
+            key_query,
+        )
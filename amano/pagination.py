@@ -0,0 +1,108 @@
+import hashlib
+import json
+import re
+from base64 import b64decode, b64encode, urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Dict
+
+from .errors import CursorError
+
+_PLACEHOLDER = re.compile(r":[A-Za-z0-9_]+")
+_FINGERPRINT_FIELDS = (
+    "TableName",
+    "IndexName",
+    "Select",
+    "ProjectionExpression",
+    "KeyConditionExpression",
+    "FilterExpression",
+    "ExpressionAttributeValues",
+    "Segment",
+    "TotalSegments",
+)
+
+
+def query_fingerprint(query: Dict[str, Any]) -> str:
+    """
+    Builds a short hash describing the shape of a query or a scan.
+    Placeholders in expressions get random names every time a condition
+    is created, so they are renamed in the order of appearance first.
+    Page size and read consistency do not change the shape.
+    """
+    values = query.get("ExpressionAttributeValues") or {}
+    names: Dict[str, str] = {}
+    expressions = " ".join(
+        query.get(field, "")
+        for field in ("KeyConditionExpression", "FilterExpression")
+    )
+    for placeholder in _PLACEHOLDER.findall(expressions):
+        if placeholder in values and placeholder not in names:
+            names[placeholder] = f":v{len(names)}"
+
+    def _rename(expression: str) -> str:
+        return _PLACEHOLDER.sub(
+            lambda match: names.get(match.group(0), match.group(0)),
+            expression,
+        )
+
+    shape: Dict[str, Any] = {
+        field: query[field] for field in _FINGERPRINT_FIELDS if field in query
+    }
+    for field in ("KeyConditionExpression", "FilterExpression"):
+        if field in shape:
+            shape[field] = _rename(shape[field])
+    if values:
+        shape["ExpressionAttributeValues"] = {
+            names.get(name, name): value for name, value in values.items()
+        }
+    encoded = json.dumps(shape, sort_keys=True, default=_encode_bytes)
+
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def encode_token(key: Dict[str, Any], query: Dict[str, Any]) -> str:
+    """
+    Encodes `LastEvaluatedKey` together with a fingerprint of the query
+    as a compact, URL-safe token.
+    """
+    payload = json.dumps(
+        {"f": query_fingerprint(query), "k": key},
+        separators=(",", ":"),
+        default=_encode_bytes,
+    )
+
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_token(token: str, query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decodes `ExclusiveStartKey` from a token created by `encode_token`.
+
+    :raises amano.errors.CursorError: when the token is malformed or
+        was created for a different query
+    """
+    try:
+        payload = json.loads(
+            urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode(),
+            object_hook=_decode_bytes,
+        )
+        fingerprint, key = payload["f"], payload["k"]
+    except (ValueError, TypeError, KeyError) as error:
+        raise CursorError.for_invalid_token(str(error)) from error
+    if fingerprint != query_fingerprint(query):
+        raise CursorError.for_invalid_token(
+            "token was created for a different query"
+        )
+
+    return key
+
+
+def _encode_bytes(value: Any) -> Dict[str, str]:
+    if isinstance(value, bytes):
+        return {"__bytes__": b64encode(value).decode()}
+    raise TypeError(f"Cannot encode `{type(value)}` in a token.")
+
+
+def _decode_bytes(value: Dict[str, Any]) -> Any:
+    if list(value.keys()) == ["__bytes__"]:
+        return b64decode(value["__bytes__"])
+
+    return value
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from queue import Queue
+from threading import Event
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from mypy_boto3_dynamodb.client import DynamoDBClient
+
+from .capacity import CapacityLedger
+from .constants import SEGMENT_THREAD_NAME_PREFIX
+from .cursor import _PAGES_DONE, Cursor, Page, _consume_pages, _put_page
+from .errors import CursorError
+from .item import I
+
+
+class ParallelCursor(Cursor[I]):
+    """
+    Cursor over a parallel scan, which reads every segment with its own
+    pagination in a thread pool and merges results into one iterator.
+    Closing the iterator early cancels the outstanding segment work.
+    """
+
+    def __init__(
+        self,
+        item_class: Type[I],
+        query: Dict[str, Any],
+        executor: Callable,
+        segments: int,
+        max_workers: Optional[int] = None,
+        stream: bool = True,
+        ledger: Optional[CapacityLedger] = None,
+    ):
+        super().__init__(item_class, query, executor, stream, ledger=ledger)
+        self._segments = segments
+        self._max_workers = max_workers or segments
+
+    def _iter_pages(self) -> Generator[Page[I], None, None]:
+        self._consumed_capacity = 0.0
+        pages: Queue = Queue(maxsize=self._segments * 2)
+        stop = Event()
+        pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=SEGMENT_THREAD_NAME_PREFIX,
+        )
+        # workers do not reference this cursor, so it can be collected,
+        # and the scan stopped, while segments are still being read
+        futures: List[Future] = [
+            pool.submit(_scan_segment, cursor, pages, stop)
+            for cursor in self._segment_cursors()
+        ]
+        try:
+            for page in _consume_pages(pages, stop, len(futures)):
+                self._consumed_capacity += page.consumed_capacity
+                yield page
+            self._exhausted = True
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    @property
+    def next_token(self) -> Optional[str]:
+        raise CursorError.for_unsupported_token()
+
+    def count(self) -> int:
+        cursors = self._segment_cursors()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            count = sum(pool.map(lambda cursor: cursor.count(), cursors))
+        self._scanned_count = sum(cursor.scanned_count for cursor in cursors)
+
+        return count
+
+    def _segment_cursors(self) -> List[Cursor[I]]:
+        cursors: List[Cursor[I]] = []
+        for segment in range(self._segments):
+            cursor = Cursor(
+                self._item_class,
+                {
+                    **self._query,
+                    "Segment": segment,
+                    "TotalSegments": self._segments,
+                },
+                self._executor,
+                ledger=self._ledger,
+            )
+            # segments are read in worker threads on behalf of this cursor
+            cursor._scopes = self._scopes
+            cursors.append(cursor)
+
+        return cursors
+
+
+def _scan_segment(cursor: Cursor, pages: Queue, stop: Event) -> None:
+    try:
+        while not stop.is_set() and not cursor._exhausted:
+            _put_page(pages, cursor._fetch_page(), stop)
+    except Exception as error:
+        _put_page(pages, error, stop)
+    _put_page(pages, _PAGES_DONE, stop)
+
+
+ClientFactory = Callable[[], DynamoDBClient]
+Reducer = Callable[[Iterable[Any]], Any]
+
+
+def process_scan(
+    item_class: Type[I],
+    query: Dict[str, Any],
+    client_factory: ClientFactory,
+    segments: int,
+    max_workers: Optional[int] = None,
+    reducer: Optional[Reducer] = None,
+) -> Iterator[Any]:
+    """
+    Scans every segment in a separate process. Each process creates
+    its own client with `client_factory`, fetches and hydrates pages
+    of a segment and sends them back one by one, so neither a worker
+    nor a message holds more than a single page of items. When
+    `reducer` is passed, it runs over the whole segment in a worker
+    and only its result is sent back.
+
+    Item class, `client_factory` and `reducer` are sent to worker
+    processes, so they must be picklable (defined at a module level).
+    """
+    pool = ProcessPoolExecutor(max_workers=max_workers or segments)
+    futures: Set[Future] = set()
+    for segment in range(segments):
+        segment_query = {**query, "Segment": segment, "TotalSegments": segments}
+        if reducer:
+            futures.add(
+                pool.submit(
+                    _reduce_segment_in_process,
+                    item_class,
+                    segment_query,
+                    client_factory,
+                    reducer,
+                )
+            )
+            continue
+        futures.add(
+            pool.submit(
+                _scan_page_in_process, item_class, segment_query, client_factory
+            )
+        )
+    try:
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if reducer:
+                    yield future.result()
+                    continue
+                items, next_query = future.result()
+                if next_query:
+                    futures.add(
+                        pool.submit(
+                            _scan_page_in_process,
+                            item_class,
+                            next_query,
+                            client_factory,
+                        )
+                    )
+                yield from items
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+_process_clients: Dict[ClientFactory, DynamoDBClient] = {}
+
+
+def _get_process_client(client_factory: ClientFactory) -> DynamoDBClient:
+    if client_factory not in _process_clients:
+        _process_clients[client_factory] = client_factory()
+
+    return _process_clients[client_factory]
+
+
+def _scan_page_in_process(
+    item_class: Type[I],
+    query: Dict[str, Any],
+    client_factory: ClientFactory,
+) -> Tuple[List[I], Optional[Dict[str, Any]]]:
+    cursor = Cursor(
+        item_class, dict(query), _get_process_client(client_factory).scan
+    )
+    items = list(cursor._fetch_page())
+    if cursor._exhausted:
+        return items, None
+
+    return items, {**query, "ExclusiveStartKey": cursor._last_evaluated_key}
+
+
+def _reduce_segment_in_process(
+    item_class: Type[I],
+    query: Dict[str, Any],
+    client_factory: ClientFactory,
+    reducer: Reducer,
+) -> Any:
+    cursor = Cursor(item_class, query, _get_process_client(client_factory).scan)
+
+    def _iter_segment() -> Iterator[I]:
+        while not cursor._exhausted:
+            yield from cursor._fetch_page()
+
+    return reducer(_iter_segment())
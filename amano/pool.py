@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Callable, List
+
+from mypy_boto3_dynamodb.client import DynamoDBClient
+
+
+class ClientPool:
+    """
+    Spreads requests over many clients, so a table shared by many
+    threads is not limited by connection pool of a single client.
+    A pool is used in place of a client, every call goes to the next
+    client in a round-robin order.
+
+    Creating botocore clients is not thread-safe, so all clients are
+    created up front, in the thread which creates the pool.
+    """
+
+    def __init__(self, client_factory: Callable[[], DynamoDBClient], size: int):
+        if size < 1:
+            raise ValueError(f"Pool size must be positive, `{size}` given.")
+        self._clients: List[DynamoDBClient] = [
+            client_factory() for _ in range(size)
+        ]
+        self._counter = count()
+
+    @property
+    def clients(self) -> List[DynamoDBClient]:
+        return list(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # `next` on `itertools.count` is atomic, no lock is needed
+        client = self._clients[next(self._counter) % len(self._clients)]
+        return getattr(client, name)
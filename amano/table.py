@@ -1,177 +1,71 @@
 from __future__ import annotations
 
-from functools import cached_property
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from os import cpu_count
+from time import sleep
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from botocore.exceptions import ClientError, ParamValidationError
 from mypy_boto3_dynamodb.client import DynamoDBClient
-from mypy_boto3_dynamodb.type_defs import AttributeValueTypeDef
 
 from .attribute import Attribute
-from .base_attribute import serialize_value
+from .base_table import BaseTable, I, KeyExpression
+from .batch import BatchWriter
+from .capacity import Operation
 from .condition import Condition
 from .constants import (
-    ATTRIBUTE_NAME,
-    CONDITION_FUNCTION_CONTAINS,
-    CONDITION_LOGICAL_OR,
-    GLOBAL_SECONDARY_INDEXES,
-    INDEX_NAME,
-    KEY_SCHEMA,
-    KEY_TYPE,
-    KEY_TYPE_HASH,
-    LOCAL_SECONDARY_INDEXES,
-    PROJECTION,
-    PROVISIONED_THROUGHPUT,
-    SELECT_SPECIFIC_ATTRIBUTES,
+    BATCH_GET_ITEM_LIMIT,
+    BATCH_MAX_RETRIES,
+    COALESCE_WINDOW,
+    TRANSACTION_MAX_RETRIES,
 )
 from .cursor import Cursor
 from .errors import (
+    CursorError,
     DeleteItemError,
-    ItemNotFoundError,
     PutItemError,
-    QueryError,
     ReadError,
     UpdateItemError,
 )
-from .index import (
-    GlobalSecondaryIndex,
-    Index,
-    LocalSecondaryIndex,
-    NamedIndex,
-    PrimaryKey,
-    Projection,
-    ProvisionedThroughput,
-)
-from .item import (
-    Item,
-    ItemState,
-    commit,
-    diff,
-    extract,
-    get_item_state,
-    hydrate,
-)
-
-KeyExpression = Dict[str, AttributeValueTypeDef]
-
-I = TypeVar("I", bound=Item)
+from .index import Index
+from .item import ItemState, get_item_state
+from .loader import GetLoader
+from .parallel import ClientFactory, ParallelCursor, Reducer, process_scan
+from .pool import ClientPool
+from .transaction import Transaction
+from .utils import MissingKey, backoff_delay, chunks, key_identity
 
 
-class Table(Generic[I]):
-    __item_class__: Type[I]
-
-    def __init__(self, db_client: DynamoDBClient, table_name: str):
-        if not hasattr(self, "__item_class__"):
-            raise TypeError(
-                f"{self.__class__} must be parametrized with a "
-                f"subtype of {Item.__module__}.{Item.__qualname__}"
-            )
-
+class Table(BaseTable[I]):
+    def __init__(
+        self,
+        db_client: Union[DynamoDBClient, ClientPool],
+        table_name: str,
+        coalesce_gets: bool = False,
+        coalesce_window: float = COALESCE_WINDOW,
+    ):
+        super().__init__(table_name)
         self._client = db_client
-        self._table_name = table_name
-        self._table_meta: Dict[str, Any] = {}
-        self._indexes: Dict[str, Index] = {}
+        self._coalesce_gets = coalesce_gets
+        self._loader = GetLoader(self, coalesce_window)
 
         self._fetch_table_meta()
-        self._build_indexes()
-
-    def _build_indexes(self) -> None:
-        self._build_primary_key()
-        self._build_gsis()
-        self._build_lsis()
-
-    @property
-    def partition_key(self) -> Attribute:
-        return self._indexes[PrimaryKey.NAME].partition_key
-
-    @property
-    def sort_key(self) -> Optional[Attribute]:
-        return self._indexes[PrimaryKey.NAME].sort_key
 
     @property
-    def client(self) -> DynamoDBClient:
+    def client(self) -> Union[DynamoDBClient, ClientPool]:
         return self._client
 
-    def _build_primary_key(self) -> None:
-        try:
-            index_attributes = self._get_key_attributes(
-                self._table_meta[KEY_SCHEMA]
-            )
-        except KeyError as error:
-            raise AttributeError(
-                f"Table `{self.table_name}` defines table key "
-                f"`{error}`, which was not found in the item class "
-                f"`{self._item_class}`"
-            ) from error
-        self._indexes[PrimaryKey.NAME] = PrimaryKey(**index_attributes)
-
-    def _get_key_attributes(self, key_schema) -> Dict[str, Attribute]:
-        item_schema = self._item_class.__schema__
-        index_attributes = {}
-        for attribute_definition in key_schema:
-            attribute = item_schema.find_by_name(
-                attribute_definition[ATTRIBUTE_NAME]
-            )
-            key_type = (
-                "partition_key"
-                if attribute_definition[KEY_TYPE] == KEY_TYPE_HASH
-                else "sort_key"
-            )
-            index_attributes[key_type] = attribute
-
-        return index_attributes
-
-    def _build_gsis(self) -> None:
-        if GLOBAL_SECONDARY_INDEXES not in self._table_meta:
-            return
-        for index_schema in self._table_meta[GLOBAL_SECONDARY_INDEXES]:
-            key_schema = index_schema[KEY_SCHEMA]
-            try:
-                key_attributes = self._get_key_attributes(key_schema)
-            except KeyError:
-                continue
-
-            gsi_index = GlobalSecondaryIndex(
-                index_schema[INDEX_NAME], **key_attributes
-            )
-            gsi_index.projection = Projection.from_dict(
-                index_schema[PROJECTION]
-            )
-            gsi_index.provisioned_throughput = ProvisionedThroughput.from_dict(
-                index_schema[PROVISIONED_THROUGHPUT]
-            )
-            self._indexes[index_schema[INDEX_NAME]] = gsi_index
-
-    def _build_lsis(self) -> None:
-        if LOCAL_SECONDARY_INDEXES not in self._table_meta:
-            return
-        for index_schema in self._table_meta[LOCAL_SECONDARY_INDEXES]:
-            key_schema = index_schema[KEY_SCHEMA]
-            try:
-                key_attributes = self._get_key_attributes(key_schema)
-            except KeyError:
-                continue
-            lsi_index = LocalSecondaryIndex(
-                index_schema[INDEX_NAME], **key_attributes
-            )
-            lsi_index.projection = Projection.from_dict(
-                index_schema[PROJECTION]
-            )
-            self._indexes[index_schema[INDEX_NAME]] = lsi_index
+    @property
+    def loader(self) -> GetLoader[I]:
+        return self._loader
 
     def _fetch_table_meta(self):
         try:
             response = self._client.describe_table(TableName=self._table_name)
-            self._table_meta = response["Table"]
         except ClientError as error:
             raise ValueError(
                 f"Table with name {self._table_name} was not found"
             ) from error
-        except KeyError as error:
-            raise ValueError(
-                f"There was an error while retrieving "
-                f"`{self._table_name}` information."
-            ) from error
+        self._load_table_meta(response)  # type: ignore[arg-type]
 
     def scan(
         self,
@@ -179,36 +73,70 @@ class Table(Generic[I]):
         limit: int = 0,
         use_index: Union[Index, str] = None,
         consistent_read: bool = False,
+        segments: int = 0,
+        max_workers: int = None,
+        stream: bool = True,
+        prefetch: int = 0,
+        start_token: str = None,
     ) -> Cursor:
-        scan_params = {
-            "TableName": self._table_name,
-            "ReturnConsumedCapacity": "INDEXES",
-            "ConsistentRead": consistent_read,
-        }
-
-        if condition:
-            if not isinstance(condition, Condition):
-                raise ValueError("`condition` is not a valid condition.")
-            scan_params["FilterExpression"] = str(condition)
-            if condition.parameters:
-                scan_params["ExpressionAttributeValues"] = serialize_value(
-                    condition.parameters
-                ).get("M")
-
-        if use_index:
-            if isinstance(use_index, str):
-                if use_index not in self.indexes:
-                    raise QueryError.for_invalid_index(use_index, condition)
-                hint_index = self.indexes[use_index]
-            else:
-                hint_index = use_index
+        scan_params = self._build_scan_query(
+            condition, limit, use_index, consistent_read
+        )
 
-            scan_params["IndexName"] = str(hint_index)
+        if segments > 1:
+            if start_token:
+                raise CursorError.for_unsupported_token()
+            return ParallelCursor(
+                self._item_class,
+                scan_params,
+                self._client.scan,
+                segments,
+                max_workers,
+                stream,
+                ledger=self._capacity,
+            )
 
-        if limit:
-            scan_params["Limit"] = limit
+        return Cursor(
+            self._item_class,
+            scan_params,
+            self._client.scan,
+            stream,
+            prefetch,
+            start_token,
+            ledger=self._capacity,
+        )
 
-        return Cursor(self._item_class, scan_params, self._client.scan)
+    def process_scan(
+        self,
+        client_factory: ClientFactory,
+        condition=None,
+        use_index: Union[Index, str] = None,
+        consistent_read: bool = False,
+        segments: int = 0,
+        max_workers: int = None,
+        reducer: Reducer = None,
+    ) -> Iterator[Any]:
+        """
+        Scans a table in parallel, where each segment is fetched and
+        hydrated in a separate process.
+
+        :param client_factory: picklable callable which creates a client
+            in a worker process
+        :param segments: number of segments, defaults to number of CPUs
+        :param max_workers: number of processes, defaults to `segments`
+        :param reducer: picklable callable which receives an iterator
+            of items from a segment; when passed, only its results are
+            sent back to the parent process
+        :return: iterator over items, or over reduced segment results
+        """
+        return process_scan(
+            self._item_class,
+            self._build_scan_query(condition, 0, use_index, consistent_read),
+            client_factory,
+            segments or cpu_count() or 1,
+            max_workers,
+            reducer,
+        )
 
     def save(self, item: I, condition: Condition = None) -> bool:
         item_state = get_item_state(item)
@@ -228,16 +156,9 @@ class Table(Generic[I]):
             )
         try:
             query = {
-                "TableName": self._table_name,
-                "Key": self._get_key_expression(item),
+                **self._build_delete_query(item, condition),
+                "ReturnConsumedCapacity": "INDEXES",
             }
-
-            if condition:
-                query["ConditionExpression"] = str(condition)
-                query["ExpressionAttributeValues"] = serialize_value(
-                    condition.parameters
-                ).get("M")
-
             result = self._client.delete_item(**query)  # type: ignore
         except ClientError as e:
             error = e.response.get("Error", {})
@@ -247,12 +168,9 @@ class Table(Generic[I]):
         except ParamValidationError as e:
             raise DeleteItemError.for_validation_error(item, str(e)) from e
 
-        success = result["ResponseMetadata"]["HTTPStatusCode"] == 200
-
-        if success:
-            commit(item)
-
-        return success
+        return self._complete_write(
+            Operation.DELETE_ITEM, item, result  # type: ignore[arg-type]
+        )
 
     def put(self, item: I, condition: Condition = None) -> bool:
         """
@@ -271,17 +189,9 @@ class Table(Generic[I]):
             )
         try:
             put_query = {
-                "TableName": self._table_name,
-                "Item": extract(item),
-                "ReturnConsumedCapacity": "TOTAL",
+                **self._build_put_query(item, condition),
+                "ReturnConsumedCapacity": "INDEXES",
             }
-            if condition:
-                put_query["ConditionExpression"] = str(condition)
-                if condition.parameters:
-                    put_query["ExpressionAttributeValues"] = serialize_value(
-                        condition.parameters
-                    ).get("M")
-
             result = self._client.put_item(**put_query)  # type: ignore
         except ClientError as e:
             error = e.response.get("Error", {})
@@ -291,12 +201,9 @@ class Table(Generic[I]):
         except ParamValidationError as e:
             raise PutItemError.for_validation_error(item, str(e)) from e
 
-        success = result["ResponseMetadata"]["HTTPStatusCode"] == 200
-
-        if success:
-            commit(item)
-
-        return success
+        return self._complete_write(
+            Operation.PUT_ITEM, item, result  # type: ignore[arg-type]
+        )
 
     def update(self, item: I, condition: Condition = None) -> bool:
         if not isinstance(item, self._item_class):
@@ -311,28 +218,10 @@ class Table(Generic[I]):
         if item_state == ItemState.NEW:
             raise UpdateItemError.for_new_item(item)
 
-        (
-            update_expression,
-            expression_attribute_values,
-        ) = diff(item)
-
-        query: Dict[str, Any] = {
-            "TableName": self._table_name,
-            "Key": self._get_key_expression(item),
-            "UpdateExpression": update_expression,
-            "ExpressionAttributeValues": serialize_value(
-                expression_attribute_values
-            ).get("M"),
+        query = {
+            **self._build_update_query(item, condition),
             "ReturnConsumedCapacity": "INDEXES",
         }
-
-        if condition:
-            query["ConditionExpression"] = str(condition)
-            if condition.parameters:
-                query["ExpressionAttributeValues"] = {
-                    **query["ExpressionAttributeValues"],
-                    **serialize_value(condition.parameters).get("M"),
-                }
         try:
             result = self._client.update_item(**query)  # type: ignore[arg-type]
         except ClientError as e:
@@ -341,12 +230,9 @@ class Table(Generic[I]):
                 return False
             raise UpdateItemError.for_client_error(error["Message"]) from e
 
-        success = result["ResponseMetadata"]["HTTPStatusCode"] == 200
-
-        if success:
-            commit(item)
-
-        return success
+        return self._complete_write(
+            Operation.UPDATE_ITEM, item, result  # type: ignore[arg-type]
+        )
 
     def query(
         self,
@@ -355,170 +241,135 @@ class Table(Generic[I]):
         limit: int = 0,
         use_index: Union[Index, str] = None,
         consistent_read: bool = False,
+        stream: bool = True,
+        prefetch: int = 0,
+        start_token: str = None,
     ) -> Cursor[I]:
-        if not isinstance(key_condition, Condition):
-            raise ValueError("`key_condition` is not a valid condition.")
-        if filter_condition and not isinstance(filter_condition, Condition):
-            raise ValueError("`filter_condition` is not a valid condition.")
-
-        key_condition_expression = str(key_condition)
-        key_attributes = list(key_condition.hint)
-        if len(key_attributes) > 2:
-            raise QueryError.for_invalid_key_condition(
-                key_condition, "Too many attributes in key_condition."
-            )
-
-        if any(
-            operator in key_condition_expression
-            for operator in [CONDITION_LOGICAL_OR, CONDITION_FUNCTION_CONTAINS]
-        ):
-            raise QueryError.for_invalid_key_condition(
-                key_condition, "Detected unsupported operator."
-            )
-        key_condition_values = serialize_value(key_condition.parameters).get(
-            "M"
+        query = self._build_query(
+            key_condition, filter_condition, limit, use_index, consistent_read
         )
-        projection = ", ".join(self.attributes)
-
-        if use_index:
-            if isinstance(use_index, str):
-                if use_index not in self.indexes:
-                    raise QueryError.for_invalid_index(use_index, key_condition)
-                hint_index = self.indexes[use_index]
-            else:
-                hint_index = use_index
-        else:
-            hint_index = self._hint_index_for_attributes(key_attributes)
 
-        query = {
-            "TableName": self._table_name,
-            "Select": SELECT_SPECIFIC_ATTRIBUTES,
-            "KeyConditionExpression": key_condition_expression,
-            "ExpressionAttributeValues": key_condition_values,
-            "ProjectionExpression": projection,
-            "ReturnConsumedCapacity": "INDEXES",
-            "ConsistentRead": consistent_read,
-        }
-
-        if isinstance(hint_index, NamedIndex):
-            query["IndexName"] = hint_index.index_name
-
-        if filter_condition:
-            query["FilterExpression"] = str(filter_condition)
-            query["ExpressionAttributeValues"] = {
-                **query["ExpressionAttributeValues"],  # type: ignore
-                **serialize_value(filter_condition.parameters).get("M"),  # type: ignore
-            }
-
-        if limit:
-            query["Limit"] = limit
-
-        return Cursor(self._item_class, query, self._client.query)
+        return Cursor(
+            self._item_class,
+            query,
+            self._client.query,
+            stream,
+            prefetch,
+            start_token,
+            ledger=self._capacity,
+        )
 
     def get(self, *keys: str, consistent_read: bool = False) -> I:
-        key_query = {self.partition_key.name: keys[0]}
-        if len(keys) > 1 and self.sort_key:
-            key_query[self.sort_key.name] = keys[1]
+        if self._coalesce_gets:
+            return self._loader.load(*keys, consistent_read=consistent_read)
 
-        key_expression = serialize_value(key_query)["M"]
-        projection = ", ".join(self.attributes)
+        key_query, query = self._build_get_query(keys, consistent_read)
         try:
-            result = self._client.get_item(
-                TableName=self.table_name,
-                ProjectionExpression=projection,
-                Key=key_expression,
-                ConsistentRead=consistent_read,
-            )
+            result = self._client.get_item(**query)
         except ClientError as e:
             raise ReadError.for_client_error(
                 e.response['Error']['Message']
             ) from e
 
-        if "Item" not in result:
-            raise ItemNotFoundError(
-                f"Could not retrieve item `{self._item_class}` "
-                f"matching criteria `{key_query}`",
-                key_query,
-            )
+        return self._complete_get(key_query, result)  # type: ignore[arg-type]
 
-        return hydrate(self._item_class, result["Item"])
+    def batch_get(
+        self,
+        keys: Iterable[Union[Any, Tuple[Any, ...]]],
+        consistent_read: bool = False,
+        fields: Iterable[Union[str, Attribute]] = None,
+        on_missing: MissingKey = MissingKey.SKIP,
+        max_retries: int = BATCH_MAX_RETRIES,
+    ) -> List[Optional[I]]:
+        """
+        Retrieves multiple items by their primary keys with `BatchGetItem`.
+
+        :param keys: partition key values or (partition key, sort key) tuples
+        :param consistent_read: whether to use strongly consistent reads
+        :param fields: limits retrieved attributes, key attributes
+            are always retrieved
+        :param on_missing: what to do when an item is not found; skip it,
+            raise `ItemNotFoundError` or put `None` in its place
+        :param max_retries: how many times `UnprocessedKeys` are retried
+        :return: items in the order of passed keys
+        :raises amano.errors.ReadError: when client fails or retries
+            are exhausted
+        """
+        key_queries, key_expressions = self._build_batch_get_keys(keys)
+        projection = self._build_projection(fields)
+        records: Dict[Tuple, Dict[str, Any]] = {}
+        for keys_chunk in chunks(key_expressions, BATCH_GET_ITEM_LIMIT):
+            for record in self._batch_get_chunk(
+                keys_chunk, projection, consistent_read, max_retries
+            ):
+                records[key_identity(self._key_from_record(record))] = record
 
-    def _get_key_expression(self, item: I) -> KeyExpression:
-        key_expression = {
-            self.partition_key.name: getattr(item, str(self.partition_key)),
-        }
+        return self._collect_batch_get(key_queries, records, on_missing)
 
-        if self.sort_key:
-            key_expression[self.sort_key.name] = getattr(
-                item, str(self.sort_key)
-            )
+    def batch_writer(
+        self, max_retries: int = BATCH_MAX_RETRIES
+    ) -> BatchWriter[I]:
+        """
+        Creates a context manager which buffers put and delete operations
+        and writes them with `BatchWriteItem`. Items are committed once
+        they are persisted.
 
-        return serialize_value(key_expression).get("M")  # type: ignore[return-value]
+        :param max_retries: how many times `UnprocessedItems` are retried
+        :return: batch writer, flushed when the context is left
+        """
+        return BatchWriter(self, max_retries)
 
-    @property
-    def indexes(self) -> Dict[str, Index]:
-        return self._indexes
+    def transaction(
+        self, max_retries: int = TRANSACTION_MAX_RETRIES
+    ) -> Transaction[I]:
+        """
+        Creates a unit of work, which writes recorded saves, deletes
+        and condition checks with a single `TransactWriteItems` call
+        when the context is left.
 
-    @property
-    def table_name(self) -> str:
-        return self._table_name
-
-    @classmethod
-    def __class_getitem__(
-        cls, item: Type[Item], schema: Any = None
-    ) -> Type[Table]:  # noqa: E501
-        if not issubclass(item, Item):
-            raise TypeError(
-                f"Expected subclass of `{Item}`, " f"got {item} instead."
-            )
-        return type(  # type: ignore
-            f"{Table.__qualname__}[{item.__module__}.{item.__qualname__}]",
-            tuple([Table]),
-            {"__item_class__": item},
-        )
+        :param max_retries: how many times a transaction canceled
+            due to a conflict is retried
+        :return: transaction, executed when the context is left
+        """
+        return Transaction(self, max_retries)
 
-    @cached_property
-    def _item_class(self) -> Type[I]:
-        if hasattr(self, "__item_class__"):
-            return getattr(self, "__item_class__")
-
-        raise AttributeError()
-
-    @cached_property
-    def attributes(self) -> List[str]:
-        return [
-            attribute.name for attribute in self._item_class.__schema__.values()  # type: ignore
-        ]
-
-    def _hint_index_for_attributes(self, attributes: List[str]) -> Index:
-        if len(attributes) == 1:
-            for index in self.indexes.values():
-                if index.partition_key.name == attributes[0]:
-                    return index
-            raise QueryError(
-                f"No GSI index defined for `{attributes[0]}` attribute."
+    def _batch_get_chunk(
+        self,
+        keys: List[KeyExpression],
+        projection: str,
+        consistent_read: bool,
+        max_retries: int,
+    ) -> Iterator[Dict[str, Any]]:
+        request: Dict[str, Any] = {
+            "Keys": keys,
+            "ProjectionExpression": projection,
+            "ConsistentRead": consistent_read,
+        }
+        attempt = 0
+        while True:
+            try:
+                result = self._client.batch_get_item(
+                    RequestItems={self._table_name: request},
+                    ReturnConsumedCapacity="INDEXES",
+                )
+            except ClientError as e:
+                raise ReadError.for_client_error(
+                    e.response['Error']['Message']
+                ) from e
+            self._capacity.record(
+                Operation.BATCH_GET_ITEM, result.get("ConsumedCapacity")
             )
 
-        matched_indexes = []
-
-        for index in self.indexes.values():
-            if index.partition_key.name not in attributes or (
-                index.sort_key and index.sort_key.name not in attributes
-            ):
-                continue
-
-            # partition key was on a first place in condition,
-            # so we assume the best index here
-            if attributes[0] == index.partition_key.name:
-                return index
-
-            matched_indexes.append(index)
+            yield from result.get("Responses", {}).get(self._table_name, [])
 
-        if not matched_indexes:
-            raise QueryError(
-                f"No GSI/LSI index defined for "
-                f"`{'`,`'.join(attributes)}` attributes."
+            unprocessed = result.get("UnprocessedKeys", {}).get(
+                self._table_name
             )
-
-        # return first matched index
-        return matched_indexes[0]
+            if not unprocessed or not unprocessed.get("Keys"):
+                return
+            if attempt >= max_retries:
+                raise ReadError.for_unprocessed_keys(len(unprocessed["Keys"]))
+
+            sleep(backoff_delay(attempt))
+            attempt += 1
+            request = {**request, "Keys": unprocessed["Keys"]}
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import asyncio
+from enum import Enum
+from time import sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from botocore.exceptions import ClientError, ParamValidationError
+
+from .base_attribute import serialize_value
+from .base_table import BaseTable
+from .capacity import Operation
+from .condition import Condition
+from .constants import (
+    TRANSACT_ITEMS_LIMIT,
+    TRANSACTION_CANCELED,
+    TRANSACTION_CONFLICT,
+    TRANSACTION_MAX_RETRIES,
+)
+from .errors import ReadError, TransactionCanceledError, TransactionError
+from .item import I, Item, ItemState, commit, get_item_state, hydrate
+from .utils import backoff_delay, chunks
+
+if TYPE_CHECKING:
+    from .async_table import AsyncTable
+    from .table import Table
+
+
+class TransactionAction(Enum):
+    PUT = "Put"
+    UPDATE = "Update"
+    DELETE = "Delete"
+    CONDITION_CHECK = "ConditionCheck"
+
+
+class BaseTransaction(Generic[I]):
+    """
+    Actions recorded by synchronous and asynchronous transactions.
+    """
+
+    def __init__(
+        self, table: BaseTable[I], max_retries: int = TRANSACTION_MAX_RETRIES
+    ):
+        self._table = table
+        self._max_retries = max_retries
+        self._actions: List[
+            Tuple[TransactionAction, I, Optional[Condition]]
+        ] = []
+
+    def save(self, item: I, condition: Condition = None) -> None:
+        self._validate_item(item)
+        item_state = get_item_state(item)
+        if item_state == ItemState.NEW:
+            self._actions.append((TransactionAction.PUT, item, condition))
+        elif item_state == ItemState.DIRTY:
+            self._actions.append((TransactionAction.UPDATE, item, condition))
+
+    def delete(self, item: I, condition: Condition = None) -> None:
+        self._validate_item(item)
+        self._actions.append((TransactionAction.DELETE, item, condition))
+
+    def check(self, item: I, condition) -> None:
+        if not isinstance(condition, Condition):
+            raise ValueError("`condition` is not a valid condition.")
+        self._validate_item(item)
+        self._actions.append(
+            (TransactionAction.CONDITION_CHECK, item, condition)
+        )
+
+    def _build_transact_items(self) -> List[Dict[str, Any]]:
+        if len(self._actions) > TRANSACT_ITEMS_LIMIT:
+            raise TransactionError.for_too_many_actions(len(self._actions))
+
+        return [
+            {action.value: self._build_query(action, item, condition)}
+            for action, item, condition in self._actions
+        ]
+
+    def _build_query(
+        self,
+        action: TransactionAction,
+        item: I,
+        condition: Optional[Condition],
+    ) -> Dict[str, Any]:
+        if action is TransactionAction.PUT:
+            return self._table._build_put_query(item, condition)
+        if action is TransactionAction.UPDATE:
+            return self._table._build_update_query(item, condition)
+
+        # condition check is a key with a condition, same as delete
+        return self._table._build_delete_query(item, condition)
+
+    def _raise_for_error(self, error: ClientError, attempt: int) -> None:
+        """
+        Raises an error unless the transaction was canceled due to
+        a conflict and can be retried.
+        """
+        details = error.response.get("Error", {})
+        if details.get("Code") != TRANSACTION_CANCELED:
+            raise TransactionError.for_client_error(
+                details.get("Message", str(error))
+            ) from error
+        reasons = error.response.get("CancellationReasons", [])
+        if not self._is_conflict(reasons) or attempt >= self._max_retries:
+            raise TransactionCanceledError.for_reasons(reasons) from error
+
+    def _complete(self, result: Dict[str, Any]) -> None:
+        self._table.capacity.record(
+            Operation.TRANSACT_WRITE_ITEMS, result.get("ConsumedCapacity")
+        )
+        for action, item, _ in self._actions:
+            if action is not TransactionAction.CONDITION_CHECK:
+                commit(item)
+        self._actions = []
+
+    @staticmethod
+    def _is_conflict(reasons: List[Dict[str, Any]]) -> bool:
+        return any(
+            reason.get("Code") == TRANSACTION_CONFLICT for reason in reasons
+        )
+
+    def _validate_item(self, item: I) -> None:
+        if not isinstance(item, self._table._item_class):
+            raise ValueError(
+                f"Could not use item of type `{type(item)}` in transaction, "
+                f"expected instance of `{self._table._item_class}` instead."
+            )
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+
+class Transaction(BaseTransaction[I]):
+    """
+    Unit of work, which records item changes and writes them all at once
+    with a single `TransactWriteItems` call.
+    """
+
+    _table: Table[I]
+
+    def execute(self) -> None:
+        """
+        Writes all recorded actions and commits the items on success.
+
+        :raises amano.errors.TransactionError: when there are too many
+            actions or client fails
+        :raises amano.errors.TransactionCanceledError: when transaction
+            was canceled, e.g. because of a failed condition
+        """
+        if not self._actions:
+            return
+
+        transact_items = self._build_transact_items()
+        attempt = 0
+        while True:
+            try:
+                result = self._table.client.transact_write_items(
+                    TransactItems=transact_items,  # type: ignore
+                    ReturnConsumedCapacity="INDEXES",
+                )
+                break
+            except ClientError as e:
+                self._raise_for_error(e, attempt)
+            except ParamValidationError as e:
+                raise TransactionError.for_client_error(str(e)) from e
+
+            sleep(backoff_delay(attempt))
+            attempt += 1
+
+        self._complete(result)  # type: ignore[arg-type]
+
+    def __enter__(self) -> Transaction[I]:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+
+
+class AsyncTransaction(BaseTransaction[I]):
+    """
+    Asynchronous version of a transaction, used with `async with`.
+    """
+
+    _table: AsyncTable[I]
+
+    async def execute(self) -> None:
+        """
+        Writes all recorded actions and commits the items on success.
+
+        :raises amano.errors.TransactionError: when there are too many
+            actions or client fails
+        :raises amano.errors.TransactionCanceledError: when transaction
+            was canceled, e.g. because of a failed condition
+        """
+        if not self._actions:
+            return
+
+        transact_items = self._build_transact_items()
+        attempt = 0
+        while True:
+            try:
+                result = await self._table.transport.request(
+                    "transact_write_items",
+                    TransactItems=transact_items,
+                    ReturnConsumedCapacity="INDEXES",
+                )
+                break
+            except ClientError as e:
+                self._raise_for_error(e, attempt)
+            except ParamValidationError as e:
+                raise TransactionError.for_client_error(str(e)) from e
+
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+        self._complete(result)
+
+    async def __aenter__(self) -> AsyncTransaction[I]:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.execute()
+
+
+def transact_get(
+    *requests: Tuple[Table, Iterable[Union[Any, Tuple[Any, ...]]]],
+    max_retries: int = TRANSACTION_MAX_RETRIES,
+) -> List[List[Optional[Item]]]:
+    """
+    Retrieves items from one or many tables with `TransactGetItems`,
+    which gives a consistent snapshot for up to 100 keys.
+
+    :param requests: pairs of a table and keys to retrieve from it
+    :param max_retries: how many times a request canceled due to
+        a conflict is retried
+    :return: list of items (or `None` for missing ones) for each pair
+    :raises amano.errors.ReadError: when client fails
+    :raises ValueError: when tables use different clients
+    """
+    if not requests:
+        return []
+
+    client = requests[0][0].client
+    for table, _ in requests:
+        if table.client is not client:
+            raise ValueError(
+                f"Table `{table.table_name}` uses a different client, "
+                f"all tables in `transact_get` must share one client."
+            )
+    gets = _build_transact_gets(requests)
+    result: List[List[Optional[Item]]] = [[] for _ in requests]
+    for gets_chunk in chunks(gets, TRANSACT_ITEMS_LIMIT):
+        attempt = 0
+        while True:
+            try:
+                chunk_result = client.transact_get_items(
+                    TransactItems=[get for _, _, get in gets_chunk],
+                    ReturnConsumedCapacity="INDEXES",
+                )
+                break
+            except ClientError as e:
+                _raise_for_read_error(e, attempt, max_retries)
+            except ParamValidationError as e:
+                raise ReadError.for_client_error(str(e)) from e
+
+            sleep(backoff_delay(attempt))
+            attempt += 1
+        _collect_transact_gets(
+            requests, gets_chunk, chunk_result, result  # type: ignore[arg-type]
+        )
+
+    return result
+
+
+async def async_transact_get(
+    *requests: Tuple[AsyncTable, Iterable[Union[Any, Tuple[Any, ...]]]],
+    max_retries: int = TRANSACTION_MAX_RETRIES,
+) -> List[List[Optional[Item]]]:
+    """
+    Asynchronous version of `transact_get` for async tables.
+
+    :raises amano.errors.ReadError: when client fails
+    :raises ValueError: when tables use different transports
+    """
+    if not requests:
+        return []
+
+    transport = requests[0][0].transport
+    for table, _ in requests:
+        if table.transport is not transport:
+            raise ValueError(
+                f"Table `{table.table_name}` uses a different transport, "
+                f"all tables in `async_transact_get` must share one transport."
+            )
+        await table.load()
+    gets = _build_transact_gets(requests)
+    result: List[List[Optional[Item]]] = [[] for _ in requests]
+    for gets_chunk in chunks(gets, TRANSACT_ITEMS_LIMIT):
+        attempt = 0
+        while True:
+            try:
+                chunk_result = await transport.request(
+                    "transact_get_items",
+                    TransactItems=[get for _, _, get in gets_chunk],
+                    ReturnConsumedCapacity="INDEXES",
+                )
+                break
+            except ClientError as e:
+                _raise_for_read_error(e, attempt, max_retries)
+            except ParamValidationError as e:
+                raise ReadError.for_client_error(str(e)) from e
+
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+        _collect_transact_gets(requests, gets_chunk, chunk_result, result)
+
+    return result
+
+
+_TransactGet = Tuple[int, BaseTable, Dict[str, Any]]
+
+
+def _build_transact_gets(
+    requests: Sequence[Tuple[BaseTable, Iterable[Union[Any, Tuple[Any, ...]]]]]
+) -> List[_TransactGet]:
+    gets = []
+    for position, (table, keys) in enumerate(requests):
+        projection = table._build_projection()
+        for key in keys:
+            key_query = table._build_key_query(
+                key if isinstance(key, tuple) else (key,)
+            )
+            gets.append(
+                (
+                    position,
+                    table,
+                    {
+                        "Get": {
+                            "TableName": table.table_name,
+                            "Key": serialize_value(key_query)["M"],
+                            "ProjectionExpression": projection,
+                        }
+                    },
+                )
+            )
+
+    return gets
+
+
+def _collect_transact_gets(
+    requests: Sequence[Tuple[BaseTable, Any]],
+    gets_chunk: List[_TransactGet],
+    chunk_result: Dict[str, Any],
+    result: List[List[Optional[Item]]],
+) -> None:
+    tables = {table.table_name: table for table, _ in requests}
+    for capacity in chunk_result.get("ConsumedCapacity", []):
+        tables[capacity["TableName"]].capacity.record(
+            Operation.TRANSACT_GET_ITEMS, capacity
+        )
+    responses = chunk_result["Responses"]
+    for (position, table, _), response in zip(gets_chunk, responses):
+        if "Item" not in response:
+            result[position].append(None)
+            continue
+        result[position].append(hydrate(table._item_class, response["Item"]))
+
+
+def _raise_for_read_error(
+    error: ClientError, attempt: int, max_retries: int
+) -> None:
+    details = error.response.get("Error", {})
+    if (
+        details.get("Code") != TRANSACTION_CANCELED
+        or not BaseTransaction._is_conflict(
+            error.response.get("CancellationReasons", [])  # type: ignore
+        )
+        or attempt >= max_retries
+    ):
+        raise ReadError.for_client_error(
+            details.get("Message", str(error))
+        ) from error
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional, Protocol
+
+from mypy_boto3_dynamodb.client import DynamoDBClient
+
+
+class AsyncTransport(Protocol):
+    """
+    Sends requests to DynamoDB without blocking the event loop.
+    Operations are named after methods of a botocore client,
+    e.g. `get_item` or `batch_write_item`.
+    """
+
+    async def request(self, operation: str, **params: Any) -> Dict[str, Any]:
+        ...
+
+
+class ThreadPoolTransport:
+    """
+    Runs requests of a synchronous botocore client in a thread pool.
+    Botocore clients are thread-safe, so one client serves all threads.
+    """
+
+    def __init__(
+        self, client: DynamoDBClient, max_workers: Optional[int] = None
+    ):
+        self._client = client
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="amano"
+        )
+
+    @property
+    def client(self) -> DynamoDBClient:
+        return self._client
+
+    async def request(self, operation: str, **params: Any) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, partial(getattr(self._client, operation), **params)
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+class AsyncClientTransport:
+    """
+    Sends requests with a natively asynchronous client, whose methods
+    are coroutines with botocore signatures, e.g. an aiobotocore client.
+    """
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    async def request(self, operation: str, **params: Any) -> Dict[str, Any]:
+        return await getattr(self._client, operation)(**params)
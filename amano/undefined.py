@@ -4,3 +4,16 @@ class _Undefined:
 
 
 UNDEFINED = _Undefined()
+
+
+class _Absent:
+    def __repr__(self):
+        return "ABSENT"
+
+    def __reduce__(self):
+        # keeps the sentinel a singleton when items are pickled
+        return "ABSENT"
+
+
+# Marks an attribute without value in compact item storage
+ABSENT = _Absent()
@@ -1,4 +1,9 @@
+import random
 from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+_T = TypeVar("_T")
 
 
 class StringEnum(Enum):
@@ -10,3 +15,34 @@ class StringEnum(Enum):
             return self.value == other
 
         return self.value == other.value
+
+
+class MissingKey(StringEnum):
+    SKIP = "skip"
+    RAISE = "raise"
+    RETURN_NONE = "none"
+
+
+def chunks(iterable: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def backoff_delay(attempt: int, base: float = 0.05, cap: float = 5.0) -> float:
+    # "full jitter" exponential backoff
+    return random.uniform(0, min(cap, base * (2**attempt)))  # nosec
+
+
+def key_identity(key: Dict[str, Any]) -> Tuple:
+    """
+    Builds hashable identity for a serialized DynamoDB key,
+    e.g. `{"pk": {"S": "a"}}` becomes `(("pk", "S", "a"),)`.
+    """
+    return tuple(
+        (name, *next(iter(value.items())))
+        for name, value in sorted(key.items())
+    )
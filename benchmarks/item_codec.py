@@ -0,0 +1,126 @@
+"""
+Compares generated item codecs with the generic path they replace:
+
+- `extract(item)` vs `serialize_value(as_dict(item))["M"]`
+- `hydrate(cls, record)` vs `from_dict(cls, deserialize_value({"M": record}))`
+- `row_decoder(cls)(record)` vs hydrating every deserialized value
+
+Run from the repository root:
+
+    python -m benchmarks.item_codec [--items 10000] [--repeat 5]
+
+The best of `repeat` runs is reported, items are generated with a fixed
+seed, so numbers are comparable between runs on the same machine.
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List
+
+from amano.base_attribute import deserialize_value, serialize_value
+from amano.item import Item, as_dict, extract, from_dict, hydrate, row_decoder
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+    track_number: int
+    duration: float
+    price: Decimal
+    explicit: bool
+    released_at: datetime
+    tags: List[str]
+
+
+def generate_tracks(count: int) -> List[Track]:
+    rng = random.Random(42)
+    genres = ["Rock", "Jazz", "Blues", "Metal", "Pop"]
+    return [
+        Track(  # type: ignore[call-arg]
+            f"Artist {rng.randrange(100)}",
+            f"Track {number}",
+            f"Album {rng.randrange(1000)}",
+            rng.choice(genres),
+            rng.randrange(1, 20),
+            round(rng.uniform(60, 600), 3),
+            Decimal(rng.randrange(99, 1999)) / 100,
+            rng.random() < 0.1,
+            datetime(2000, 1, 1) + timedelta(days=rng.randrange(8000)),
+            rng.sample(genres, 2),
+        )
+        for number in range(count)
+    ]
+
+
+def legacy_extract(item: Item) -> dict:
+    return serialize_value(as_dict(item))["M"]
+
+
+def legacy_hydrate(record: dict) -> Track:
+    return from_dict(Track, deserialize_value({"M": record}))
+
+
+def legacy_row(record: dict) -> dict:
+    values = deserialize_value({"M": record})
+    return {
+        attribute.name: attribute.hydrate(values[attribute.name])
+        for attribute in Track.__schema__.values()
+        if attribute.name in values
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tracks = generate_tracks(args.items)
+    records = [legacy_extract(track) for track in tracks]
+    assert [extract(track) for track in tracks] == records
+    assert [as_dict(hydrate(Track, record)) for record in records] == [
+        as_dict(legacy_hydrate(record)) for record in records
+    ]
+
+    decode_row = row_decoder(Track)
+    assert [decode_row(record) for record in records] == [
+        legacy_row(record) for record in records
+    ]
+    cases = [
+        (
+            "extract",
+            lambda: [legacy_extract(track) for track in tracks],
+            lambda: [extract(track) for track in tracks],
+        ),
+        (
+            "hydrate",
+            lambda: [legacy_hydrate(record) for record in records],
+            lambda: [hydrate(Track, record) for record in records],
+        ),
+        (
+            "rows",
+            lambda: [legacy_row(record) for record in records],
+            lambda: [decode_row(record) for record in records],
+        ),
+    ]
+    print(f"{args.items} items, best of {args.repeat} runs")
+    print(f"{'':<10}{'generic':>12}{'generated':>12}{'speedup':>10}")
+    for name, legacy, generated in cases:
+        legacy_time = measure(legacy, args.repeat)
+        generated_time = measure(generated, args.repeat)
+        print(
+            f"{name:<10}{legacy_time:>11.3f}s{generated_time:>11.3f}s"
+            f"{legacy_time / generated_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
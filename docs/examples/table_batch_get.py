@@ -0,0 +1,25 @@
+import boto3
+from amano import Table, Item, MissingKey
+from dataclasses import dataclass
+
+client = boto3.client("dynamodb")
+
+
+@dataclass
+class Thread(Item):
+    ForumName: str
+    Subject: str
+    Message: str
+    LastPostedBy: str
+    Replies: int = 0
+    Views: int = 0
+
+
+forum_table = Table[Thread](client, table_name="Thread")
+threads = forum_table.batch_get(
+    [
+        ("Amazon DynamoDB", "Tagging tables"),
+        ("Amazon DynamoDB", "Batch operations"),
+    ],
+    on_missing=MissingKey.RETURN_NONE,
+)
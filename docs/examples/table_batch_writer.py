@@ -0,0 +1,26 @@
+import boto3
+from amano import Table, Item
+from dataclasses import dataclass
+
+client = boto3.client("dynamodb")
+
+
+@dataclass
+class Thread(Item):
+    ForumName: str
+    Subject: str
+    Message: str
+    LastPostedBy: str
+    Replies: int = 0
+    Views: int = 0
+
+
+forum_table = Table[Thread](client, table_name="Thread")
+outdated_thread = forum_table.get("Amazon DynamoDB", "Tagging tables")
+
+with forum_table.batch_writer() as writer:
+    writer.put(
+        Thread("Amazon DynamoDB", "Batch operations", "...", "User A")
+    )
+    writer.put(Thread("Amazon DynamoDB", "Transactions", "...", "User B"))
+    writer.delete(outdated_thread)
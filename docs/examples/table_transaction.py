@@ -0,0 +1,26 @@
+import boto3
+from amano import Table, Item
+from dataclasses import dataclass
+
+client = boto3.client("dynamodb")
+
+
+@dataclass
+class Thread(Item):
+    ForumName: str
+    Subject: str
+    Message: str
+    LastPostedBy: str
+    Replies: int = 0
+    Views: int = 0
+
+
+forum_table = Table[Thread](client, table_name="Thread")
+thread = forum_table.get("Amazon DynamoDB", "Tagging tables")
+duplicate = forum_table.get("Amazon DynamoDB", "Tagging tables (2)")
+
+thread.Replies += 1
+with forum_table.transaction() as tx:
+    tx.check(thread, Thread.LastPostedBy == "User A")
+    tx.save(thread)
+    tx.delete(duplicate)
@@ -1,7 +1,11 @@
 import json
 import os
+import time
+from collections import Counter
+from functools import partial
 from os import path
-from typing import Dict, Generator, List
+from threading import Lock, Thread, enumerate as enumerate_threads
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
 import boto3
 import pytest
@@ -202,3 +206,165 @@ def default_dynamodb_client(
 
     yield dynamodb_client
     dynamodb_client.delete_table(TableName=default_table)
+
+
+class ClientProxy:
+    """
+    Wraps a DynamoDB client, records calls made through it and
+    lets tests replace chosen operations with a handler
+    accepting the wrapped client and the call's keyword arguments.
+    """
+
+    def __init__(self, client: DynamoDBClient, **handlers: Callable):
+        self._client = client
+        self._handlers = handlers
+        self._lock = Lock()
+        self.calls: Counter = Counter()
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+        if not callable(method):
+            return method
+
+        def call(**kwargs):
+            with self._lock:
+                self.calls[name] += 1
+                self.requests.append((name, kwargs))
+            if name in self._handlers:
+                return self._handlers[name](self._client, **kwargs)
+            return method(**kwargs)
+
+        return call
+
+
+@pytest.fixture
+def running_threads() -> Callable[[str], List[Thread]]:
+    def _running_threads(prefix: str, timeout: float = 2.0) -> List[Thread]:
+        # background threads are given a moment to notice they were stopped
+        deadline = time.monotonic() + timeout
+        while True:
+            threads = [
+                thread
+                for thread in enumerate_threads()
+                if thread.name.startswith(prefix)
+            ]
+            if not threads or time.monotonic() > deadline:
+                return threads
+            time.sleep(0.05)
+
+    return _running_threads
+
+
+@pytest.fixture
+def no_backoff(monkeypatch) -> None:
+    for module in ("amano.table", "amano.batch", "amano.transaction"):
+        monkeypatch.setattr(f"{module}.sleep", lambda _: None)
+
+
+@pytest.fixture
+def client_proxy(readonly_dynamodb_client) -> Callable[..., ClientProxy]:
+    return partial(ClientProxy, readonly_dynamodb_client)
+
+
+@pytest.fixture
+def default_client_proxy(
+    default_dynamodb_client,
+) -> Callable[..., ClientProxy]:
+    return partial(ClientProxy, default_dynamodb_client)
+
+
+@pytest.fixture
+def counting_client(client_proxy) -> ClientProxy:
+    return client_proxy()
+
+
+@pytest.fixture
+def unprocessed_keys_client(
+    readonly_dynamodb_client,
+) -> Callable[[int], ClientProxy]:
+    def _create(failures: int = 1) -> ClientProxy:
+        remaining = [failures]
+
+        def batch_get_item(client, RequestItems, **kwargs):
+            if remaining[0] <= 0:
+                return client.batch_get_item(
+                    RequestItems=RequestItems, **kwargs
+                )
+            remaining[0] -= 1
+            table_name, request = next(iter(RequestItems.items()))
+            keys = request["Keys"]
+            result = {"Responses": {table_name: []}}
+            if len(keys) > 1:
+                result = client.batch_get_item(
+                    RequestItems={table_name: {**request, "Keys": keys[:1]}}
+                )
+                keys = keys[1:]
+            result["UnprocessedKeys"] = {table_name: {**request, "Keys": keys}}
+            return result
+
+        return ClientProxy(
+            readonly_dynamodb_client, batch_get_item=batch_get_item
+        )
+
+    return _create
+
+
+@pytest.fixture
+def unprocessed_items_client(
+    default_dynamodb_client,
+) -> Callable[[int], ClientProxy]:
+    def _create(failures: int = 1) -> ClientProxy:
+        remaining = [failures]
+
+        def batch_write_item(client, RequestItems, **kwargs):
+            if remaining[0] <= 0:
+                return client.batch_write_item(
+                    RequestItems=RequestItems, **kwargs
+                )
+            remaining[0] -= 1
+            table_name, requests = next(iter(RequestItems.items()))
+            result = {"UnprocessedItems": {table_name: requests}}
+            if len(requests) > 1:
+                result = client.batch_write_item(
+                    RequestItems={table_name: requests[:1]}
+                )
+                result["UnprocessedItems"] = {table_name: requests[1:]}
+            return result
+
+        return ClientProxy(
+            default_dynamodb_client, batch_write_item=batch_write_item
+        )
+
+    return _create
+
+
+@pytest.fixture
+def conflicting_client(
+    default_dynamodb_client,
+) -> Callable[[int], ClientProxy]:
+    def _create(conflicts: int = 1) -> ClientProxy:
+        remaining = [conflicts]
+
+        def transact_write_items(client, TransactItems, **kwargs):
+            if remaining[0] <= 0:
+                return client.transact_write_items(
+                    TransactItems=TransactItems, **kwargs
+                )
+            remaining[0] -= 1
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "TransactionCanceledException",
+                        "Message": "Transaction cancelled",
+                    },
+                    "CancellationReasons": [{"Code": "TransactionConflict"}],
+                },
+                "TransactWriteItems",
+            )
+
+        return ClientProxy(
+            default_dynamodb_client, transact_write_items=transact_write_items
+        )
+
+    return _create
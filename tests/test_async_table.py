@@ -0,0 +1,273 @@
+import asyncio
+
+import pytest
+
+from amano import (
+    AsyncClientTransport,
+    AsyncTable,
+    Item,
+    MissingKey,
+    ThreadPoolTransport,
+    async_transact_get,
+)
+from amano.errors import CursorError, ItemNotFoundError
+from amano.item import ItemState, get_item_state
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def test_table_metadata_is_loaded_when_awaited(
+    counting_client, readonly_table
+) -> None:
+    # given
+    transport = ThreadPoolTransport(counting_client)
+    tracks = AsyncTable[Track](transport, readonly_table)
+
+    # when
+    calls_before_await = counting_client.calls["describe_table"]
+    result = asyncio.run(_await(tracks))
+
+    # then
+    assert calls_before_await == 0
+    assert result is tracks
+    assert counting_client.calls["describe_table"] == 1
+    assert tracks.partition_key.name == "artist_name"
+
+
+def test_fail_to_query_table_which_is_not_loaded(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    transport = ThreadPoolTransport(readonly_dynamodb_client)
+    tracks = AsyncTable[Track](transport, readonly_table)
+
+    # then
+    with pytest.raises(RuntimeError):
+        tracks.query(Track.artist_name == "AC/DC")
+
+
+def test_can_get_item(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    transport = ThreadPoolTransport(readonly_dynamodb_client)
+    tracks = AsyncTable[Track](transport, readonly_table)
+
+    async def get_items():
+        return await asyncio.gather(
+            tracks.get("AC/DC", "Let There Be Rock"),
+            tracks.get("AC/DC", "Unknown Track"),
+            return_exceptions=True,
+        )
+
+    # when
+    found, missing = asyncio.run(get_items())
+
+    # then
+    assert isinstance(found, Track)
+    assert found.album_name == "Let There Be Rock"
+    assert isinstance(missing, ItemNotFoundError)
+
+
+def test_can_iterate_query_with_async_for(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    transport = ThreadPoolTransport(readonly_dynamodb_client)
+
+    async def query_tracks():
+        tracks = await AsyncTable[Track](transport, readonly_table)
+        cursor = tracks.query(
+            Track.artist_name == "AC/DC",
+            Track.genre_name.startswith("R"),
+            limit=5,
+        )
+        items = [item async for item in cursor]
+        return tracks, cursor, items
+
+    # when
+    tracks, cursor, items = asyncio.run(query_tracks())
+
+    # then
+    assert len(items) == 18
+    assert all(isinstance(item, Track) for item in items)
+    assert cursor.consumed_capacity > 0
+    assert tracks.capacity.by_operation().keys() == {"Query"}
+    with pytest.raises(CursorError):
+        cursor.pages()
+
+
+def test_can_iterate_scan_pages_and_count(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    transport = ThreadPoolTransport(readonly_dynamodb_client)
+
+    async def scan_tracks():
+        tracks = await AsyncTable[Track](transport, readonly_table)
+        cursor = tracks.scan(Track.artist_name == "AC/DC", limit=30)
+        count = await cursor.count()
+        pages = [page async for page in cursor.pages()]
+        return count, pages
+
+    # when
+    count, pages = asyncio.run(scan_tracks())
+
+    # then
+    assert count == 18
+    assert len(pages) == 7
+    assert sum(len(page) for page in pages) == 18
+
+
+def test_can_resume_async_query_from_token(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    transport = ThreadPoolTransport(readonly_dynamodb_client)
+
+    async def query_in_pages():
+        tracks = await AsyncTable[Track](transport, readonly_table)
+        result = []
+        token = None
+        while True:
+            cursor = tracks.query(
+                Track.artist_name == "AC/DC", limit=5, start_token=token
+            )
+            result.extend(item.track_name for item in await cursor.fetch(5))
+            token = cursor.next_token
+            if token is None:
+                return result
+
+    # when
+    result = asyncio.run(query_in_pages())
+
+    # then
+    assert len(result) == len(set(result)) == 18
+
+
+def test_can_write_items(default_dynamodb_client, default_table) -> None:
+    # given
+    class Album(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    transport = ThreadPoolTransport(default_dynamodb_client)
+    reflection = Album("Tool", "Reflection", "Lateralus")
+    sober = Album("Tool", "Sober", "Undertow")
+
+    async def write_items():
+        tracks = AsyncTable[Album](transport, default_table)
+        await tracks.save(reflection)
+        await tracks.put(sober)
+        reflection.album_name = "Lateralus (Remastered)"
+        await tracks.save(reflection)
+        await tracks.delete(sober)
+        return await tracks.batch_get(
+            [("Tool", "Reflection"), ("Tool", "Sober")],
+            on_missing=MissingKey.RETURN_NONE,
+        )
+
+    # when
+    stored_reflection, stored_sober = asyncio.run(write_items())
+
+    # then
+    assert stored_reflection.album_name == "Lateralus (Remastered)"
+    assert stored_sober is None
+    assert get_item_state(reflection) == ItemState.CLEAN
+
+
+def test_can_write_items_in_batch(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Album(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    transport = ThreadPoolTransport(default_dynamodb_client)
+    items = [
+        Album("Tool", f"Track {number}", "Fear Inoculum")
+        for number in range(30)
+    ]
+
+    async def write_items():
+        tracks = await AsyncTable[Album](transport, default_table)
+        async with tracks.batch_writer() as batch:
+            for item in items:
+                await batch.put(item)
+        return await tracks.batch_get(
+            [(item.artist_name, item.track_name) for item in items]
+        )
+
+    # when
+    result = asyncio.run(write_items())
+
+    # then
+    assert len(result) == 30
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+
+
+def test_can_write_and_read_items_in_transaction(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Album(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    transport = ThreadPoolTransport(default_dynamodb_client)
+    items = [
+        Album("Tool", "Reflection", "Lateralus"),
+        Album("Tool", "Sober", "Undertow"),
+    ]
+
+    async def write_items():
+        tracks = await AsyncTable[Album](transport, default_table)
+        async with tracks.transaction() as tx:
+            for item in items:
+                tx.save(item)
+        return await async_transact_get(
+            (tracks, [("Tool", "Reflection"), ("Tool", "Unknown")])
+        )
+
+    # when
+    [result] = asyncio.run(write_items())
+
+    # then
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert result[0].album_name == "Lateralus"
+    assert result[1] is None
+
+
+def test_can_use_native_async_client(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    class AsyncClient:
+        def __getattr__(self, name):
+            async def _call(**params):
+                return getattr(readonly_dynamodb_client, name)(**params)
+
+            return _call
+
+    transport = AsyncClientTransport(AsyncClient())
+
+    async def get_item():
+        tracks = await AsyncTable[Track](transport, readonly_table)
+        return await tracks.get("AC/DC", "Let There Be Rock")
+
+    # when
+    result = asyncio.run(get_item())
+
+    # then
+    assert result.track_name == "Let There Be Rock"
+
+
+async def _await(table):
+    return await table
@@ -0,0 +1,141 @@
+import pytest
+
+from amano import Item, MissingKey, Table
+from amano.errors import ItemNotFoundError, ReadError
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def test_can_batch_get_items(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = tracks.batch_get(
+        [
+            ("Accept", "Restless and Wild"),
+            ("AC/DC", "For Those About To Rock (We Salute You)"),
+            ("Accept", "Balls to the Wall"),
+        ]
+    )
+
+    # then
+    assert [item.track_name for item in result] == [
+        "Restless and Wild",
+        "For Those About To Rock (We Salute You)",
+        "Balls to the Wall",
+    ]
+    assert all(isinstance(item, Track) for item in result)
+
+
+def test_can_batch_get_duplicated_keys(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = tracks.batch_get(
+        [("Accept", "Balls to the Wall"), ("Accept", "Balls to the Wall")]
+    )
+
+    # then
+    assert len(result) == 2
+    assert result[0].track_name == result[1].track_name
+
+
+def test_can_batch_get_selected_fields(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = tracks.batch_get(
+        [("Accept", "Balls to the Wall")], fields=[Track.album_name]
+    )
+
+    # then
+    assert result[0].album_name
+    assert result[0].artist_name == "Accept"
+    assert "genre_name" not in result[0].__dict__
+
+
+@pytest.mark.parametrize(
+    "on_missing,expected",
+    [(MissingKey.SKIP, [True]), (MissingKey.RETURN_NONE, [True, False])],
+)
+def test_batch_get_missing_keys(
+    readonly_dynamodb_client, readonly_table, on_missing, expected
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = tracks.batch_get(
+        [("Accept", "Balls to the Wall"), ("Accept", "Unknown Track")],
+        on_missing=on_missing,
+    )
+
+    # then
+    assert [item is not None for item in result] == expected
+
+
+def test_fail_batch_get_missing_key(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    with pytest.raises(ItemNotFoundError) as e:
+        tracks.batch_get(
+            [("Accept", "Balls to the Wall"), ("Accept", "Unknown Track")],
+            on_missing=MissingKey.RAISE,
+        )
+
+    # then
+    assert e.value.query == {
+        "artist_name": "Accept",
+        "track_name": "Unknown Track",
+    }
+
+
+def test_batch_get_retries_unprocessed_keys(
+    unprocessed_keys_client, readonly_table, no_backoff
+) -> None:
+    # given
+    client = unprocessed_keys_client()
+    tracks = Table[Track](client, readonly_table)
+
+    # when
+    result = tracks.batch_get(
+        [("Accept", "Balls to the Wall"), ("Accept", "Fast As a Shark")]
+    )
+
+    # then
+    assert client.calls["batch_get_item"] == 2
+    assert [item.track_name for item in result] == [
+        "Balls to the Wall",
+        "Fast As a Shark",
+    ]
+
+
+def test_fail_batch_get_when_retries_are_exhausted(
+    unprocessed_keys_client, readonly_table, no_backoff
+) -> None:
+    # given
+    client = unprocessed_keys_client(failures=10)
+    tracks = Table[Track](client, readonly_table)
+
+    # then
+    with pytest.raises(ReadError):
+        tracks.batch_get(
+            [("Accept", "Balls to the Wall"), ("Accept", "Fast As a Shark")],
+            max_retries=2,
+        )
@@ -0,0 +1,176 @@
+import pytest
+
+from amano import Item, MissingKey, Table
+from amano.errors import WriteError
+from amano.item import ItemState, get_item_state
+
+
+def test_can_batch_put_items(default_dynamodb_client, default_table) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    items = [Track("Tool", f"Track {i}", "Lateralus") for i in range(30)]
+
+    # when
+    with tracks.batch_writer() as writer:
+        for item in items:
+            writer.put(item)
+
+    # then
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    result = tracks.batch_get([("Tool", f"Track {i}") for i in range(30)])
+    assert len(result) == 30
+
+
+def test_can_batch_delete_items(default_dynamodb_client, default_table) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    items = [Track("Tool", f"Track {i}", "Lateralus") for i in range(3)]
+    with tracks.batch_writer() as writer:
+        for item in items:
+            writer.put(item)
+
+    # when
+    with tracks.batch_writer() as writer:
+        writer.delete(items[0])
+        writer.delete(items[1])
+
+    # then
+    result = tracks.batch_get(
+        [("Tool", f"Track {i}") for i in range(3)],
+        on_missing=MissingKey.RETURN_NONE,
+    )
+    assert [item is not None for item in result] == [False, False, True]
+
+
+def test_batch_writer_keeps_last_operation_for_the_same_key(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+
+    # when
+    with tracks.batch_writer() as writer:
+        writer.put(Track("Tool", "Reflection", "Lateralus"))
+        writer.put(Track("Tool", "Reflection", "Undertow"))
+
+    # then
+    assert tracks.get("Tool", "Reflection").album_name == "Undertow"
+
+
+def test_batch_writer_flushes_on_error(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    item = Track("Tool", "Reflection", "Lateralus")
+
+    # when
+    with pytest.raises(RuntimeError):
+        with tracks.batch_writer() as writer:
+            writer.put(item)
+            raise RuntimeError()
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert len(tracks.batch_get([("Tool", "Reflection")])) == 1
+
+
+def test_batch_writer_retries_unprocessed_items(
+    unprocessed_items_client, default_table, no_backoff
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = unprocessed_items_client()
+    tracks = Table[Track](client, default_table)
+    items = [Track("Tool", f"Track {i}", "Lateralus") for i in range(3)]
+
+    # when
+    with tracks.batch_writer() as writer:
+        for item in items:
+            writer.put(item)
+
+    # then
+    assert client.calls["batch_write_item"] == 2
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert (
+        len(tracks.batch_get([("Tool", f"Track {i}") for i in range(3)])) == 3
+    )
+
+
+def test_fail_batch_write_when_retries_are_exhausted(
+    unprocessed_items_client, default_table, no_backoff
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = unprocessed_items_client(failures=10)
+    tracks = Table[Track](client, default_table)
+    items = [Track("Tool", f"Track {i}", "Lateralus") for i in range(3)]
+
+    # when
+    with pytest.raises(WriteError):
+        with tracks.batch_writer(max_retries=2) as writer:
+            for item in items:
+                writer.put(item)
+
+    # then
+    result = tracks.batch_get(
+        [("Tool", f"Track {i}") for i in range(3)],
+        on_missing=MissingKey.RETURN_NONE,
+    )
+    assert [item is not None for item in result] == [True, True, False]
+
+
+def test_can_retry_failed_flush(
+    unprocessed_items_client, default_table, no_backoff
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = unprocessed_items_client(failures=3)
+    tracks = Table[Track](client, default_table)
+    items = [Track("Tool", f"Track {i}", "Lateralus") for i in range(3)]
+    writer = tracks.batch_writer(max_retries=1)
+    for item in items:
+        writer.put(item)
+    with pytest.raises(WriteError):
+        writer.flush()
+
+    # when
+    writer.flush()
+
+    # then
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert (
+        len(tracks.batch_get([("Tool", f"Track {i}") for i in range(3)])) == 3
+    )
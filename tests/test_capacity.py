@@ -0,0 +1,108 @@
+from amano import Item, Table
+from amano.capacity import CapacityUsage, Operation, capacity_scope
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def test_ledger_accumulates_capacity_of_all_pages(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    cursor = tracks.scan(limit=30)
+    pages = list(cursor.pages())
+
+    # when
+    total = tracks.capacity.total
+
+    # then
+    assert len(pages) == 7
+    assert total.read == sum(page.consumed_capacity for page in pages)
+    assert total.read == cursor.consumed_capacity
+    assert total.write == 0
+    assert tracks.capacity.by_operation() == {"Scan": total}
+    assert tracks.capacity.by_table() == {readonly_table: total}
+
+
+def test_ledger_breaks_capacity_down_by_index(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    list(
+        tracks.query(
+            Track.genre_name == "Rock",
+            use_index="GlobalGenreAndAlbumNameIndex",
+        )
+    )
+
+    # then
+    by_index = tracks.capacity.by_index()
+    assert list(by_index.keys()) == [
+        (readonly_table, "GlobalGenreAndAlbumNameIndex")
+    ]
+    assert by_index[(readonly_table, "GlobalGenreAndAlbumNameIndex")].read > 0
+
+
+def test_ledger_records_single_item_operations(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    track = Track("AC/DC", "Thunderstruck", "The Razors Edge", "Rock")
+
+    # when
+    tracks.put(track)
+    tracks.get("AC/DC", "Thunderstruck")
+
+    # then
+    by_operation = tracks.capacity.by_operation()
+    assert by_operation[Operation.PUT_ITEM].write > 0
+    assert by_operation[Operation.GET_ITEM].read > 0
+    assert tracks.capacity.total == (
+        by_operation[Operation.PUT_ITEM] + by_operation[Operation.GET_ITEM]
+    )
+
+
+def test_can_reset_ledger(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    list(tracks.scan())
+
+    # when
+    tracks.capacity.reset()
+
+    # then
+    assert tracks.capacity.total == CapacityUsage()
+    assert tracks.capacity.by_operation() == {}
+
+
+def test_capacity_scope_collects_capacity_within_context(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    track = next(iter(tracks.query(Track.artist_name == "AC/DC")))
+
+    # when
+    with capacity_scope() as outer:
+        with capacity_scope() as inner:
+            list(tracks.scan(limit=50, prefetch=2))
+        tracks.get(track.artist_name, track.track_name)
+
+    # then
+    assert inner.by_operation().keys() == {"Scan"}
+    assert outer.by_operation().keys() == {"Scan", "GetItem"}
+    assert outer.total.read < tracks.capacity.total.read
+    assert tracks.capacity.by_operation().keys() == {
+        "Query",
+        "Scan",
+        "GetItem",
+    }
@@ -0,0 +1,107 @@
+from array import array
+from datetime import datetime
+from decimal import Decimal
+
+from amano import Item, Table
+from amano.columns import CategoricalColumn, Column, Columns, NumberColumn
+
+RECORDS = [
+    {
+        "name": {"S": "Bob"},
+        "age": {"N": "10"},
+        "balance": {"N": "10.5"},
+        "genre": {"S": "Rock"},
+        "created_at": {"S": "2022-01-01T10:00:00"},
+    },
+    {
+        "name": {"S": "Bobik"},
+        "age": {"NULL": True},
+        "genre": {"S": "Jazz"},
+    },
+    {
+        "age": {"S": "12"},
+        "balance": {"N": "1"},
+        "genre": {"S": "Rock"},
+    },
+]
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+    track_duration: int
+
+
+def test_can_build_columns_from_records() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+        balance: Decimal
+        genre: str
+        created_at: datetime
+
+    columns = Columns(list(MyItem.__schema__.values()), categorical=["genre"])
+
+    # when
+    columns.extend(RECORDS[:2])
+    columns.extend(RECORDS[2:])
+    result = columns.columns
+
+    # then
+    assert isinstance(result["age"], NumberColumn)
+    assert result["age"].values == array("q", [10, 0, 12])
+    assert result["age"].mask == bytearray([0, 1, 0])
+    assert result["balance"].values == array("d", [10.5, 0, 1])
+    assert result["balance"].to_list() == [10.5, None, 1.0]
+    assert isinstance(result["name"], Column)
+    assert result["name"].to_list() == ["Bob", "Bobik", None]
+    assert isinstance(result["genre"], CategoricalColumn)
+    assert result["genre"].values == array("q", [0, 1, 0])
+    assert result["genre"].categories == ["Rock", "Jazz"]
+    assert result["genre"].to_list() == ["Rock", "Jazz", "Rock"]
+    assert result["created_at"][0] == datetime(2022, 1, 1, 10)
+    assert all(len(column) == 3 for column in result.values())
+
+
+def test_number_column_keeps_large_integers_in_list() -> None:
+    # given
+    class MyItem(Item):
+        age: int
+
+    columns = Columns([MyItem.age])
+
+    # when
+    columns.extend([{"age": {"N": "10"}}, {"age": {"NULL": True}}])
+    columns.extend([{"age": {"N": str(2**63)}}, {"age": {"N": "12"}}])
+    result = columns.columns["age"]
+
+    # then
+    assert result.values == [10, 0, 2**63, 12]
+    assert result.to_list() == [10, None, 2**63, 12]
+    assert result.mask == bytearray([0, 1, 0, 0])
+
+
+def test_can_fetch_query_result_as_columns(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    items = list(tracks.query(Track.artist_name == "AC/DC"))
+
+    # when
+    result = tracks.query(Track.artist_name == "AC/DC", limit=5).to_columns(
+        ["track_name", "album_name", Track.track_duration],
+        categorical=["album_name"],
+    )
+
+    # then
+    assert list(result) == ["track_name", "album_name", "track_duration"]
+    assert result["album_name"].to_list() == [item.album_name for item in items]
+    assert result["track_name"].to_list() == [item.track_name for item in items]
+    assert list(result["track_duration"].values) == [
+        item.track_duration for item in items
+    ]
+    assert not any(result["track_duration"].mask)
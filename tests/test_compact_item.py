@@ -0,0 +1,204 @@
+import pickle
+import tracemalloc
+from dataclasses import dataclass
+
+import pytest
+
+from amano import Item, Table
+from amano.item import (
+    ItemState,
+    commit,
+    diff,
+    extract,
+    from_dict,
+    get_item_state,
+    hydrate,
+)
+
+RECORD = {
+    "artist_name": {"S": "AC/DC"},
+    "track_name": {"S": "Let There Be Rock"},
+    "album_name": {"S": "Let There Be Rock"},
+    "genre_name": {"S": "Rock"},
+    "year": {"N": "1977"},
+    "rating": {"N": "4.5"},
+}
+
+
+class PickledTrack(Item, compact=True):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+    year: int
+    rating: float
+
+
+def test_compact_item_has_no_instance_dict() -> None:
+    # given
+    class Track(Item, compact=True):
+        artist_name: str
+        track_name: str
+        rating: float = 3.0
+
+    # when
+    item = Track("AC/DC", "Let There Be Rock")
+
+    # then
+    assert not hasattr(item, "__dict__")
+    assert item.artist_name == "AC/DC"
+    assert item.rating == 3.0
+    with pytest.raises(AttributeError):
+        item.unknown = "value"
+
+
+def test_compact_item_tracks_state() -> None:
+    # given
+    class Track(Item, compact=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    item = Track("AC/DC", "Let There Be Rock", "Let There Be Rock")
+
+    # then
+    assert get_item_state(item) == ItemState.NEW
+    commit(item)
+    assert get_item_state(item) == ItemState.CLEAN
+    item.album_name = "Highway to Hell"
+    assert get_item_state(item) == ItemState.DIRTY
+    commit(item)
+    del item.album_name
+    assert get_item_state(item) == ItemState.DIRTY
+    with pytest.raises(AttributeError):
+        item.album_name
+
+
+def test_compact_item_diff_matches_regular_item() -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+
+    class CompactTrack(Item, compact=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+
+    items = [
+        from_dict(cls, {"artist_name": "AC/DC", "track_name": "Rock"})
+        for cls in (Track, CompactTrack)
+    ]
+
+    # when
+    for item in items:
+        item.album_name = "Highway to Hell"
+        item.genre_name = "Rock"
+
+    # then
+    assert diff(items[0]) == diff(items[1])
+
+
+def test_can_hydrate_and_extract_compact_item() -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+        year: int
+        rating: float
+
+    class CompactTrack(Item, compact=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+        year: int
+        rating: float
+
+    # when
+    item = hydrate(CompactTrack, RECORD)
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert item.year == 1977
+    assert extract(item) == extract(hydrate(Track, RECORD)) == RECORD
+
+
+def test_can_pickle_compact_item() -> None:
+    # given
+    item = hydrate(PickledTrack, RECORD)
+    del item.rating
+
+    # when
+    result = pickle.loads(pickle.dumps(item))
+
+    # then
+    assert result.artist_name == "AC/DC"
+    assert get_item_state(result) == ItemState.DIRTY
+    assert diff(result) == diff(item)
+
+
+def test_compact_items_use_less_memory() -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+        year: int
+        rating: float
+
+    class CompactTrack(Item, compact=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+        year: int
+        rating: float
+
+    # values are shared, so only the overhead of items is measured
+    values = ("AC/DC", "Let There Be Rock", "Let There Be Rock", "Rock")
+
+    def measure(item_class):
+        item_class(*values, 1977, 4.5)
+        tracemalloc.start()
+        items = [item_class(*values, 1977, 4.5) for _ in range(1000)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(items) == 1000
+        return size
+
+    # when
+    regular_size = measure(Track)
+    compact_size = measure(CompactTrack)
+
+    # then
+    assert compact_size * 2 < regular_size
+
+
+def test_can_save_compact_item(default_dynamodb_client, default_table) -> None:
+    # given
+    @dataclass
+    class Track(Item, compact=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    my_table = Table[Track](default_dynamodb_client, default_table)
+    item = Track("Tool", "Reflection", "Lateralus")
+
+    # when
+    assert my_table.save(item)
+    item.album_name = "Lateralus (Remastered)"
+    assert my_table.save(item)
+    result = my_table.get("Tool", "Reflection")
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert result == item
+    assert get_item_state(result) == ItemState.CLEAN
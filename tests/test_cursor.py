@@ -0,0 +1,369 @@
+import time
+
+import pytest
+
+from amano import Cursor, Item, Page, Table
+from amano.constants import PREFETCH_THREAD_NAME
+from amano.errors import CursorError, QueryError
+from amano.item import as_dict
+from amano.pagination import query_fingerprint
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def test_streamed_cursor_can_be_iterated_once(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    result = tracks.scan(limit=20)
+
+    # when
+    items = list(result)
+
+    # then
+    assert len(items) == 200
+    assert result._fetched_pages == []
+    with pytest.raises(CursorError):
+        list(result)
+
+
+def test_fetch_consumes_streamed_cursor(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.scan(limit=5)
+
+    # when
+    items = result.fetch(7)
+
+    # then
+    assert len(items) == 7
+    assert counting_client.calls["scan"] == 2
+    with pytest.raises(CursorError):
+        result.fetch(7)
+    with pytest.raises(CursorError):
+        list(result)
+
+
+def test_can_close_cursor_during_iteration(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.scan(limit=5)
+    items = []
+
+    # when
+    for item in result:
+        items.append(item)
+        if len(items) == 3:
+            result.close()
+
+    # then
+    assert len(items) == 3
+    assert counting_client.calls["scan"] == 1
+
+
+def test_buffered_cursor_can_be_iterated_many_times(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.scan(limit=30, stream=False)
+
+    # when
+    first_fetch = result.fetch(5)
+    second_fetch = result.fetch(5)
+    all_items = list(result)
+
+    # then
+    assert [item.track_name for item in first_fetch] == [
+        item.track_name for item in second_fetch
+    ]
+    assert len(all_items) == len(list(result)) == 200
+    assert counting_client.calls["scan"] == 7
+
+
+def test_can_count_items_without_retrieving_them(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.query(
+        Track.artist_name == "AC/DC",
+        Track.genre_name.startswith("R"),
+        limit=5,
+    )
+
+    # when
+    count = result.count()
+
+    # then
+    assert count == 18
+    assert result.scanned_count >= count
+    requests = [
+        request for name, request in counting_client.requests if name == "query"
+    ]
+    assert requests
+    for request in requests:
+        assert request["Select"] == "COUNT"
+        assert "ProjectionExpression" not in request
+
+
+def test_can_count_parallel_scan_items(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    result = tracks.scan(Track.artist_name == "AC/DC", segments=3)
+
+    # when
+    count = result.count()
+
+    # then
+    assert count == 18
+    assert result.scanned_count == 200
+
+
+def test_can_prefetch_pages(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    result = tracks.scan(limit=20, prefetch=2)
+
+    # when
+    items = list(result)
+
+    # then
+    assert len({(item.artist_name, item.track_name) for item in items}) == 200
+
+
+def test_prefetching_is_bounded(counting_client, readonly_table) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.scan(limit=5, prefetch=2)
+
+    # when
+    iterator = iter(result)
+    next(iterator)
+    time.sleep(0.3)
+
+    # then
+    assert counting_client.calls["scan"] <= 4
+    result.close()
+
+
+def test_breaking_prefetched_loop_stops_prefetching(
+    readonly_dynamodb_client, readonly_table, running_threads
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    for _ in range(3):
+        for _ in tracks.scan(limit=5, prefetch=2):
+            break
+
+    # then
+    assert running_threads(PREFETCH_THREAD_NAME) == []
+
+
+def test_prefetching_raises_errors_on_consuming_thread(
+    client_proxy, readonly_table
+) -> None:
+    # given
+    def failing_scan(client, **kwargs):
+        if "ExclusiveStartKey" in kwargs:
+            raise RuntimeError("Connection lost")
+        return client.scan(**kwargs)
+
+    client = client_proxy(scan=failing_scan)
+    tracks = Table[Track](client, readonly_table)
+    result = tracks.scan(limit=5, prefetch=2)
+
+    # when
+    items = []
+    with pytest.raises(QueryError):
+        for item in result:
+            items.append(item)
+
+    # then
+    assert len(items) == 5
+
+
+def test_can_iterate_pages(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    result = tracks.scan(Track.artist_name == "AC/DC", limit=30)
+
+    # when
+    pages = list(result.pages())
+
+    # then
+    assert len(pages) == 7
+    assert all(isinstance(page, Page) for page in pages)
+    assert sum(page.scanned_count for page in pages) == 200
+    assert sum(page.count for page in pages) == 18
+    assert sum(len(page) for page in pages) == 18
+    assert all(page.last_evaluated_key for page in pages[:-1])
+    assert pages[-1].last_evaluated_key is None
+    assert all(isinstance(item, Track) for page in pages for item in page)
+    with pytest.raises(CursorError):
+        result.pages()
+
+
+def test_can_iterate_buffered_pages_many_times(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](counting_client, readonly_table)
+    result = tracks.scan(limit=30, stream=False)
+
+    # when
+    pages = list(result.pages())
+
+    # then
+    assert list(result.pages()) == pages
+    assert len(list(result)) == 200
+    assert counting_client.calls["scan"] == 7
+
+
+def test_can_iterate_rows_as_dicts(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    expected = [
+        as_dict(item) for item in tracks.query(Track.artist_name == "AC/DC")
+    ]
+
+    # when
+    result = list(
+        tracks.query(Track.artist_name == "AC/DC", limit=5).rows("dict")
+    )
+
+    # then
+    assert len(result) == 18
+    assert result == expected
+
+
+def test_can_iterate_rows_as_tuples(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    cursor = tracks.scan(limit=30, prefetch=2).rows(
+        "tuple", ["track_name", Track.artist_name]
+    )
+    result = cursor.fetch()
+
+    # then
+    assert len(result) == 200
+    assert all(isinstance(row, tuple) and len(row) == 2 for row in result)
+    assert ("Let There Be Rock", "AC/DC") in result
+    with pytest.raises(CursorError):
+        list(cursor)
+
+
+def test_fail_to_select_unknown_rows() -> None:
+    # given
+    cursor = Cursor(Track, {}, lambda **_: {})
+
+    # then
+    with pytest.raises(ValueError):
+        cursor.rows("list")
+    with pytest.raises(ValueError):
+        cursor.rows("tuple", ["unknown"])
+
+
+def test_can_resume_query_from_token(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    expected = [
+        item.track_name for item in tracks.query(Track.artist_name == "AC/DC")
+    ]
+
+    # when
+    result = []
+    token = None
+    while True:
+        cursor = tracks.query(
+            Track.artist_name == "AC/DC", limit=5, start_token=token
+        )
+        result.extend(item.track_name for item in cursor.fetch(5))
+        token = cursor.next_token
+        if token is None:
+            break
+
+    # then
+    assert result == expected
+
+
+def test_can_resume_scan_from_token_after_consumed_page(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    cursor = tracks.scan(limit=20, prefetch=2)
+    pages = cursor.pages()
+    first_page = next(pages)
+
+    # when
+    resumed = tracks.scan(limit=20, start_token=cursor.next_token)
+    cursor.close()
+
+    # then
+    keys = {(item.artist_name, item.track_name) for item in first_page}
+    keys.update((item.artist_name, item.track_name) for item in resumed)
+    assert len(keys) == 200
+
+
+def test_fail_to_resume_from_token_of_different_query(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    cursor = tracks.query(Track.artist_name == "AC/DC", limit=5)
+    cursor.fetch(5)
+
+    # then
+    with pytest.raises(CursorError):
+        tracks.query(
+            Track.artist_name == "Accept", start_token=cursor.next_token
+        )
+    with pytest.raises(CursorError):
+        tracks.query(Track.artist_name == "AC/DC", start_token="not-a-token")
+
+
+def test_query_fingerprint_ignores_placeholder_names() -> None:
+    # given
+    class Artist(Item):
+        artist_name: str
+
+    # when
+    first = {"TableName": "tracks", **_condition_query(Artist, "AC/DC")}
+    second = {"TableName": "tracks", **_condition_query(Artist, "AC/DC")}
+    other = {"TableName": "tracks", **_condition_query(Artist, "Accept")}
+
+    # then
+    assert first != second
+    assert query_fingerprint(first) == query_fingerprint(second)
+    assert query_fingerprint(first) != query_fingerprint(other)
+
+
+def _condition_query(item_class, value):
+    condition = item_class.artist_name.startswith(value)
+    return {
+        "KeyConditionExpression": str(condition),
+        "ExpressionAttributeValues": condition.parameters,
+    }
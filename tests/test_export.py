@@ -0,0 +1,218 @@
+from datetime import datetime
+from decimal import Decimal
+from os import path
+from typing import List
+
+import pytest
+
+from amano import Cursor, Item
+from amano.errors import ExportError
+from amano.parallel import ParallelCursor
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    track_number: int
+    price: Decimal
+    released_at: datetime
+    tags: List[str]
+
+
+def _record(number: int) -> dict:
+    record = {
+        "artist_name": {"S": "AC/DC"},
+        "track_name": {"S": f"Track {number}"},
+        "track_number": {"N": str(number)},
+        "released_at": {"S": "1977-03-21T00:00:00"},
+        "tags": {"L": [{"S": "rock"}]},
+    }
+    if number % 2:
+        record["price"] = {"N": "1.99"}
+    return record
+
+
+class FakeClient:
+    """
+    Serves scans of `records` page by page, split into segments
+    when `Segment` is passed, like DynamoDB does.
+    """
+
+    def __init__(self, records: List[dict], page_size: int = 3):
+        self.records = records
+        self.page_size = page_size
+        self.calls = 0
+
+    def scan(self, **query) -> dict:
+        self.calls += 1
+        segment = query.get("Segment", 0)
+        segments = query.get("TotalSegments", 1)
+        records = self.records[segment::segments]
+        start = int(query.get("ExclusiveStartKey", {}).get("n", {"N": 0})["N"])
+        page = records[start : start + self.page_size]
+        result = {"Items": page, "Count": len(page)}
+        if start + self.page_size < len(records):
+            result["LastEvaluatedKey"] = {"n": {"N": start + self.page_size}}
+        return result
+
+
+def test_can_derive_arrow_schema() -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    from amano.export import arrow_schema
+
+    # when
+    schema = arrow_schema(Track)
+
+    # then
+    assert schema.names == [
+        "artist_name",
+        "track_name",
+        "track_number",
+        "price",
+        "released_at",
+        "tags",
+    ]
+    assert schema.field("track_number").type == pyarrow.int64()
+    assert schema.field("price").type == pyarrow.decimal128(38, 18)
+    assert schema.field("released_at").type == pyarrow.timestamp("us")
+    assert schema.field("tags").type == pyarrow.string()
+    assert arrow_schema(Track, ["track_name", Track.price]).names == [
+        "track_name",
+        "price",
+    ]
+
+
+def test_can_stream_cursor_as_record_batches() -> None:
+    pytest.importorskip("pyarrow")
+    from amano.export import ArrowSink
+
+    # given
+    client = FakeClient([_record(number) for number in range(7)])
+    cursor = Cursor(Track, {}, client.scan)
+
+    # when
+    batches = list(ArrowSink(Track).batches(cursor))
+
+    # then
+    assert [batch.num_rows for batch in batches] == [3, 3, 1]
+    rows = batches[0].to_pylist()
+    assert rows[0]["track_number"] == 0
+    assert rows[0]["price"] is None
+    assert rows[1]["price"] == Decimal("1.99")
+    assert rows[0]["released_at"] == datetime(1977, 3, 21)
+    assert rows[0]["tags"] == '["rock"]'
+
+
+def test_can_export_decimals_with_scale() -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    from amano.export import ArrowSink
+
+    # given
+    sink = ArrowSink(Track, ["price"], decimal_scale=2)
+    records = [{"price": {"N": "12345678901234567890.12"}}, {}]
+
+    # when
+    batch = sink.batch(records)
+
+    # then
+    assert batch.schema.field("price").type == pyarrow.decimal128(38, 2)
+    assert batch.column(0).to_pylist() == [
+        Decimal("12345678901234567890.12"),
+        None,
+    ]
+
+
+def test_fail_to_export_decimal_exceeding_scale() -> None:
+    pytest.importorskip("pyarrow")
+    from amano.export import ArrowSink
+
+    # given
+    sink = ArrowSink(Track, ["price"], decimal_scale=2)
+
+    # then
+    with pytest.raises(ExportError):
+        sink.batch([{"price": {"N": "1.999"}}])
+
+
+def test_arrow_sink_compiles_decoders_once(monkeypatch) -> None:
+    pytest.importorskip("pyarrow")
+    import amano.columns
+    from amano.export import ArrowSink
+
+    # given
+    compiled = []
+    compile_decoders = amano.columns.compile_decoders
+
+    def _compile_decoders(schema):
+        compiled.append(schema)
+        return compile_decoders(schema)
+
+    monkeypatch.setattr(amano.columns, "compile_decoders", _compile_decoders)
+    client = FakeClient([_record(number) for number in range(7)])
+
+    # when
+    batches = list(ArrowSink(Track).batches(Cursor(Track, {}, client.scan)))
+
+    # then
+    assert len(batches) == 3
+    assert len(compiled) == 1
+
+
+def test_can_export_cursor_to_parquet(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    from amano.export import export_parquet
+
+    # given
+    client = FakeClient([_record(number) for number in range(7)])
+    file_path = str(tmp_path / "tracks.parquet")
+
+    # when
+    rows = export_parquet(Cursor(Track, {}, client.scan), file_path)
+
+    # then
+    result = pyarrow.parquet.ParquetFile(file_path)
+    assert rows == 7
+    assert result.metadata.num_rows == 7
+    assert result.metadata.num_row_groups == 3
+    assert result.read().column("track_name").to_pylist() == [
+        f"Track {number}" for number in range(7)
+    ]
+
+
+def test_can_export_parallel_scan_segments(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    from amano.export import export_segments
+
+    # given
+    client = FakeClient([_record(number) for number in range(10)])
+    cursor = ParallelCursor(Track, {}, client.scan, segments=3)
+
+    # when
+    paths = export_segments(cursor, str(tmp_path / "export"), ["track_number"])
+
+    # then
+    assert [path.basename(file_path) for file_path in paths] == [
+        "segment-0000.parquet",
+        "segment-0001.parquet",
+        "segment-0002.parquet",
+    ]
+    numbers = [
+        pyarrow.parquet.read_table(file_path).column(0).to_pylist()
+        for file_path in paths
+    ]
+    assert numbers == [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+
+
+def test_fail_to_export_without_pyarrow(monkeypatch) -> None:
+    # given
+    import amano.export
+
+    monkeypatch.setattr(amano.export, "pyarrow", None)
+
+    # then
+    with pytest.raises(ExportError):
+        amano.export.arrow_schema(Track)
@@ -2,6 +2,7 @@ import pytest
 
 from amano import Item, Table
 from amano.errors import AmanoDBError, ItemNotFoundError
+from amano.item import ItemState, get_item_state
 
 
 def test_get_item(readonly_dynamodb_client, readonly_table) -> None:
@@ -42,3 +43,29 @@ def test_fail_get_unexisting_item(
         "artist_name": "AC/DC",
         "track_name": "Let There Be No Rock",
     }
+
+
+def test_read_items_are_clean_without_commits(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    items = [
+        my_table.get("AC/DC", "Let There Be Rock"),
+        *my_table.batch_get([("AC/DC", "Let There Be Rock")]),
+        *my_table.query(Track.artist_name == "AC/DC"),
+    ]
+
+    # then
+    assert len(items) == 20
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert all(item.__log__ == [] for item in items)
+    assert all(len(item.__commits__) == 0 for item in items)
+    assert get_item_state(Track("AC/DC", "Rock", "Rock")) == ItemState.NEW
@@ -1,20 +1,25 @@
 from dataclasses import dataclass, field
-from typing import List
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Set
 
 import pytest
 
 from amano import AttributeMapping
 from amano.attribute import Attribute, AttributeType
+from amano.base_attribute import deserialize_value, serialize_value
 from amano.item import (
     AttributeChange,
     Item,
     ItemState,
     as_dict,
     commit,
+    diff,
     extract,
     from_dict,
     get_item_state,
     hydrate,
+    row_decoder,
 )
 
 
@@ -145,6 +150,145 @@ def test_can_hydrate_item_with_mapping_strategy() -> None:
     assert item.age == 10
 
 
+def test_hydrated_item_matches_item_created_from_dict() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+        height: float
+        balance: Decimal
+        active: bool
+        created_at: datetime
+        tags: Set[str]
+        scores: List[int]
+        extra: Dict[str, str]
+
+    record = {
+        "name": {"S": "Bobik"},
+        "age": {"N": "10"},
+        "height": {"N": "1.75"},
+        "balance": {"N": "100.25"},
+        "active": {"BOOL": False},
+        "created_at": {"S": "2022-01-01T10:00:00"},
+        "tags": {"SS": ["a", "b"]},
+        "scores": {"L": [{"N": "1"}, {"N": "2"}]},
+        "extra": {"M": {"key": {"S": "value"}}},
+        "unknown": {"S": "ignored"},
+    }
+
+    # when
+    item = hydrate(MyItem, record)
+
+    # then
+    assert as_dict(item) == as_dict(
+        from_dict(MyItem, deserialize_value({"M": record}))
+    )
+    assert item.age == 10 and isinstance(item.age, int)
+    assert item.height == 1.75
+    assert item.balance == Decimal("100.25")
+    assert item.active is False
+    assert item.created_at == datetime(2022, 1, 1, 10)
+    assert item.tags == {"a", "b"}
+    assert "unknown" not in item.__dict__
+    assert get_item_state(item) == ItemState.CLEAN
+
+
+def test_hydrated_item_is_clean_without_commits() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+
+    # when
+    item = hydrate(MyItem, {"name": {"S": "Bobik"}, "age": {"N": "10"}})
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert item.__log__ == []
+    assert len(item.__commits__) == 0
+    assert get_item_state(MyItem("Bob", 10)) == ItemState.NEW
+    item.age = 11
+    assert get_item_state(item) == ItemState.DIRTY
+
+
+def test_hydrate_falls_back_on_unexpected_attribute_type() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+
+    # when
+    item = hydrate(MyItem, {"name": {"N": "12"}, "age": {"N": "10.5"}})
+
+    # then
+    assert item.name == "12"
+    assert item.age == 10
+
+
+def test_hydrator_is_built_once_per_item_class() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+
+    class MyChildItem(MyItem):
+        age: int
+
+    # when
+    hydrate(MyItem, {"name": {"S": "Bob"}})
+    hydrator = MyItem.__dict__["__hydrator__"]
+    hydrate(MyItem, {"name": {"S": "Bobik"}})
+    child = hydrate(MyChildItem, {"name": {"S": "Bob"}, "age": {"N": "1"}})
+
+    # then
+    assert MyItem.__dict__["__hydrator__"] is hydrator
+    assert MyChildItem.__dict__["__hydrator__"] is not hydrator
+    assert child.age == 1
+
+
+def test_fail_to_hydrate_non_item_class() -> None:
+    # given
+    class NotItem:
+        name: str
+
+    # then
+    with pytest.raises(TypeError):
+        hydrate(NotItem, {"name": {"S": "Bob"}})  # type: ignore
+
+
+def test_can_decode_record_to_rows() -> None:
+    # given
+    class MyItem(Item, mapping=AttributeMapping.CAMEL_CASE):
+        user_name: str
+        age: int
+        created_at: datetime
+        tags: Set[str]
+
+    record = {
+        "userName": {"S": "Bobik"},
+        "age": {"N": "10"},
+        "createdAt": {"S": "2022-01-01T10:00:00"},
+        "tags": {"SS": ["a"]},
+    }
+
+    # when
+    decode_dict = row_decoder(MyItem)
+    decode_tuple = row_decoder(MyItem, ["age", MyItem.user_name], True)
+
+    # then
+    assert decode_dict(record) == {
+        "userName": "Bobik",
+        "age": 10,
+        "createdAt": datetime(2022, 1, 1, 10),
+        "tags": {"a"},
+    }
+    assert decode_dict({"age": {"N": "10"}}) == {"age": 10}
+    assert decode_tuple(record) == (10, "Bobik")
+    assert decode_tuple({"age": {"N": "10.5"}}) == (10, None)
+    assert row_decoder(MyItem) is decode_dict
+    with pytest.raises(ValueError):
+        row_decoder(MyItem, ["unknown"])
+
+
 def test_can_extract_item() -> None:
     # given
     class MyItem(Item):
@@ -167,6 +311,61 @@ def test_can_extract_item() -> None:
     }
 
 
+def test_extracted_item_matches_serialized_dict() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+        height: float
+        balance: Decimal
+        active: bool
+        created_at: datetime
+        tags: Set[str]
+        scores: List[int]
+        extra: Dict[str, str]
+        nickname: str = "Bob"
+
+    items = [
+        MyItem(
+            "Bobik",
+            10,
+            1.75,
+            Decimal("100.25"),
+            False,
+            datetime(2022, 1, 1, 10),
+            {"a", "b"},
+            [1, 2],
+            {"key": "value"},
+        ),
+        MyItem("Bobik", True, 2, 3, True, datetime(2022, 1, 1), {"a"}, [], {}),
+    ]
+    del items[0].nickname
+
+    # when
+    result = [extract(item) for item in items]
+
+    # then
+    assert result == [serialize_value(as_dict(item))["M"] for item in items]
+    assert result[0]["height"] == {"N": "1.75"}
+    assert result[0]["nickname"] == {"S": "Bob"}
+    assert result[1]["age"] == {"N": "1"}
+
+
+def test_extractor_is_built_once_per_item_class() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+
+    # when
+    extract(MyItem("Bob"))
+    extractor = MyItem.__dict__["__extractor__"]
+    value = extract(MyItem("Bobik"))
+
+    # then
+    assert MyItem.__dict__["__extractor__"] is extractor
+    assert value == {"name": {"S": "Bobik"}}
+
+
 def test_can_extract_item_with_mapping() -> None:
     # given
     field_mapping = {
@@ -350,6 +549,122 @@ def test_can_get_item_state() -> None:
     assert get_item_state(item) == ItemState.DIRTY
 
 
+def test_change_tracking_is_not_shared_between_items() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int = 10
+
+    loaded = hydrate(MyItem, {"name": {"S": "Bobik"}})
+    created = from_dict(MyItem, {"name": "Bob"})
+
+    # when
+    loaded.age = 11
+    commit(loaded)
+    item = MyItem("Bob")
+
+    # then
+    assert get_item_state(item) == ItemState.NEW
+    assert get_item_state(created) == ItemState.CLEAN
+    assert created.__log__ == [] and item.__log__ == []
+    assert "__log__" not in MyItem.__dict__
+    assert "__commits__" not in MyItem.__dict__
+
+
+def test_item_keeps_limited_commit_history() -> None:
+    # given
+    class MyItem(Item, history=2):
+        name: str
+
+    class MyUntrackedItem(Item, history=0):
+        name: str
+
+    items = [MyItem("Bob"), MyUntrackedItem("Bob")]
+
+    # when
+    for item in items:
+        for name in ("Bobik", "Bobek", "Bobo"):
+            item.name = name
+            commit(item)
+
+    # then
+    assert [commit.log[0].value for commit in items[0].__commits__] == [
+        "Bobek",
+        "Bobo",
+    ]
+    assert len(items[1].__commits__) == 0
+    assert all(item.__version__ == 3 for item in items)
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+
+
+def test_fail_to_create_item_with_negative_history() -> None:
+    with pytest.raises(ValueError):
+
+        class MyItem(Item, history=-1):
+            name: str
+
+
+def test_diff_has_single_action_per_changed_attribute() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+        tags: List[str]
+        nickname: str
+
+    item = hydrate(
+        MyItem,
+        {
+            "name": {"S": "Bob"},
+            "age": {"N": "10"},
+            "tags": {"L": [{"S": "a"}]},
+            "nickname": {"S": "Bobik"},
+        },
+    )
+
+    # when
+    for age in (11, 12, 13):
+        item.age = age
+    item.name = "Bobek"
+    item.name = "Bob"
+    item.tags.append("b")
+    item.tags = item.tags
+    del item.nickname
+
+    # then
+    assert diff(item) == (
+        "SET age = :age,tags = :tags REMOVE nickname ",
+        {":age": 13, ":tags": ["a", "b"]},
+    )
+
+
+def test_item_reverted_to_committed_values_is_clean() -> None:
+    # given
+    class MyItem(Item):
+        name: str
+        age: int
+
+    class MyCompactItem(Item, compact=True):
+        name: str
+        age: int
+
+    items = [
+        hydrate(item_class, {"name": {"S": "Bob"}, "age": {"N": "10"}})
+        for item_class in (MyItem, MyCompactItem)
+    ]
+
+    # when
+    for item in items:
+        item.age = 11
+        del item.name
+        item.age = 10
+        item.name = "Bob"
+
+    # then
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert all(diff(item) == ("", {}) for item in items)
+
+
 def test_can_init_item() -> None:
     # given
     class MyItem(Item):
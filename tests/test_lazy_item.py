@@ -0,0 +1,140 @@
+import pickle
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+import pytest
+
+from amano import Item, Table
+from amano.item import ItemState, commit, diff, extract, get_item_state, hydrate
+
+RECORD = {
+    "artist_name": {"S": "AC/DC"},
+    "track_name": {"S": "Let There Be Rock"},
+    "album_name": {"S": "Let There Be Rock"},
+    "year": {"N": "1977"},
+    "price": {"N": "1.99"},
+    "released_at": {"S": "1977-03-21T00:00:00"},
+    "tags": {"L": [{"S": "rock"}, {"S": "hard rock"}]},
+}
+
+
+class Track(Item, lazy=True):
+    artist_name: str
+    track_name: str
+    album_name: str
+    year: int
+    price: Decimal
+    released_at: datetime
+    tags: List[str]
+
+
+def test_lazy_item_decodes_only_accessed_attributes() -> None:
+    # when
+    item = hydrate(Track, RECORD)
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert "year" not in item.__dict__
+    assert item.year == 1977
+    assert item.price == Decimal("1.99")
+    assert item.released_at == datetime(1977, 3, 21)
+    assert item.tags == ["rock", "hard rock"]
+    assert "year" in item.__dict__
+    assert "album_name" not in item.__dict__
+    assert get_item_state(item) == ItemState.CLEAN
+
+
+def test_lazy_item_extracts_raw_values() -> None:
+    # given
+    item = hydrate(Track, RECORD)
+
+    # when
+    result = extract(item)
+
+    # then
+    assert result == RECORD
+    assert result["tags"] is RECORD["tags"]
+    assert "tags" not in item.__dict__
+
+
+def test_lazy_item_tracks_changes() -> None:
+    # given
+    item = hydrate(Track, RECORD)
+
+    # when
+    item.album_name = "Highway to Hell"
+    item.year = 1977
+    del item.tags
+
+    # then
+    assert get_item_state(item) == ItemState.DIRTY
+    assert diff(item) == (
+        "SET album_name = :album_name REMOVE tags ",
+        {":album_name": "Highway to Hell"},
+    )
+    assert "tags" in RECORD
+    with pytest.raises(AttributeError):
+        item.tags
+    commit(item)
+    assert get_item_state(item) == ItemState.CLEAN
+
+
+def test_lazy_item_is_inherited() -> None:
+    # given
+    class ChildTrack(Track):
+        artist_name: str
+        track_name: str
+
+    # when
+    item = hydrate(ChildTrack, RECORD)
+
+    # then
+    assert ChildTrack.__lazy__
+    assert "track_name" not in item.__dict__
+    assert item.track_name == "Let There Be Rock"
+
+
+def test_unpickled_lazy_item_decodes_attributes(monkeypatch) -> None:
+    # given
+    data = pickle.dumps(hydrate(Track, RECORD))
+    # as in a fresh process, where no item of the class was hydrated
+    monkeypatch.delattr(Track, "__decoders__", raising=False)
+
+    # when
+    result = pickle.loads(data)
+
+    # then
+    assert get_item_state(result) == ItemState.CLEAN
+    assert result.year == 1977
+    assert result.tags == ["rock", "hard rock"]
+    assert extract(result) == RECORD
+
+
+def test_fail_to_create_compact_lazy_item() -> None:
+    with pytest.raises(TypeError):
+
+        class Track(Item, compact=True, lazy=True):
+            artist_name: str
+
+
+def test_can_save_lazy_item(default_dynamodb_client, default_table) -> None:
+    # given
+    class Track(Item, lazy=True):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    my_table = Table[Track](default_dynamodb_client, default_table)
+    my_table.put(Track("Tool", "Reflection", "Lateralus"))
+    item = my_table.get("Tool", "Reflection")
+
+    # when
+    item.album_name = "Lateralus (Remastered)"
+    assert my_table.save(item)
+    result = my_table.get("Tool", "Reflection")
+
+    # then
+    assert get_item_state(item) == ItemState.CLEAN
+    assert result.album_name == "Lateralus (Remastered)"
+    assert get_item_state(result) == ItemState.CLEAN
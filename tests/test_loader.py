@@ -0,0 +1,161 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from amano import Item, Table
+from amano.errors import ItemNotFoundError
+from amano.item import ItemState, get_item_state
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+
+
+def test_can_coalesce_gets_issued_from_many_threads(
+    counting_client, readonly_table, tracks_with_artists_json
+) -> None:
+    # given
+    client = counting_client
+    tracks = Table[Track](
+        client, readonly_table, coalesce_gets=True, coalesce_window=0.05
+    )
+    keys = [
+        (item["artist_name"], item["track_name"])
+        for item in tracks_with_artists_json[:20]
+    ]
+
+    # when
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        result = list(executor.map(lambda key: tracks.get(*key), keys))
+
+    # then
+    assert [(item.artist_name, item.track_name) for item in result] == keys
+    assert client.calls["get_item"] == 0
+    assert client.calls["batch_get_item"] < len(keys)
+
+
+def test_coalesced_get_raises_not_found_per_key(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](
+        readonly_dynamodb_client,
+        readonly_table,
+        coalesce_gets=True,
+        coalesce_window=0.05,
+    )
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        found = executor.submit(tracks.get, "Accept", "Balls to the Wall")
+        missing = executor.submit(tracks.get, "Accept", "Unknown Track")
+
+    # then
+    assert found.result().track_name == "Balls to the Wall"
+    with pytest.raises(ItemNotFoundError) as e:
+        missing.result()
+    assert e.value.query == {
+        "artist_name": "Accept",
+        "track_name": "Unknown Track",
+    }
+
+
+def test_can_coalesce_gets_within_event_loop_iteration(
+    counting_client, readonly_table, tracks_with_artists_json
+) -> None:
+    # given
+    client = counting_client
+    tracks = Table[Track](client, readonly_table)
+    keys = [
+        (item["artist_name"], item["track_name"])
+        for item in tracks_with_artists_json[:20]
+    ]
+
+    async def load_all():
+        return await asyncio.gather(
+            *[tracks.loader.aload(*key) for key in keys + keys],
+            return_exceptions=True,
+        )
+
+    # when
+    result = asyncio.run(load_all())
+
+    # then
+    assert [(item.artist_name, item.track_name) for item in result] == (
+        keys + keys
+    )
+    assert client.calls["batch_get_item"] == 1
+
+
+def test_coalesced_gets_of_the_same_key_return_separate_items(
+    counting_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](
+        counting_client,
+        readonly_table,
+        coalesce_gets=True,
+        coalesce_window=0.05,
+    )
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first, second = [
+            future.result()
+            for future in [
+                executor.submit(tracks.get, "Accept", "Balls to the Wall")
+                for _ in range(2)
+            ]
+        ]
+    first.album_name = "Changed"
+
+    # then
+    assert first is not second
+    assert second.album_name == "Balls to the Wall"
+    assert get_item_state(second) == ItemState.CLEAN
+    assert counting_client.calls["batch_get_item"] == 1
+
+
+def test_async_gets_of_the_same_key_return_separate_items(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    async def load_all():
+        return await asyncio.gather(
+            tracks.loader.aload("Accept", "Balls to the Wall"),
+            tracks.loader.aload("Accept", "Balls to the Wall"),
+        )
+
+    # when
+    first, second = asyncio.run(load_all())
+    first.album_name = "Changed"
+
+    # then
+    assert first is not second
+    assert get_item_state(second) == ItemState.CLEAN
+
+
+def test_async_coalesced_get_raises_not_found_per_key(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    async def load_all():
+        return await asyncio.gather(
+            tracks.loader.aload("Accept", "Balls to the Wall"),
+            tracks.loader.aload("Accept", "Unknown Track"),
+            return_exceptions=True,
+        )
+
+    # when
+    found, missing = asyncio.run(load_all())
+
+    # then
+    assert found.track_name == "Balls to the Wall"
+    assert isinstance(missing, ItemNotFoundError)
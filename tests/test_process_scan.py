@@ -0,0 +1,82 @@
+import os
+from collections import Counter
+from typing import Iterable
+
+import boto3
+
+from amano import Item, Table
+from amano.item import ItemState, get_item_state
+from amano.parallel import process_scan
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def create_client():
+    session = boto3.Session(
+        aws_access_key_id=os.environ.get("AWS_ACCESS_KEY_ID", "test"),
+        aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY", "test"),
+        region_name=os.environ.get("AWS_REGION_NAME", "localhost"),
+    )
+    return session.client(
+        "dynamodb",
+        endpoint_url=os.environ.get("ENDPOINT_URL", "http://localhost:8000"),
+    )
+
+
+def count_genres(tracks: Iterable[Track]) -> Counter:
+    return Counter(track.genre_name for track in tracks)
+
+
+def test_can_scan_table_in_processes(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = list(tracks.process_scan(create_client, segments=3))
+
+    # then
+    assert len(result) == 200
+    assert all(isinstance(item, Track) for item in result)
+    assert len({(item.artist_name, item.track_name) for item in result}) == 200
+    assert all(get_item_state(item) == ItemState.CLEAN for item in result)
+
+
+def test_can_scan_segments_page_by_page_in_processes(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    query = tracks._build_scan_query(None, 10, None, False)
+
+    # when
+    result = list(
+        process_scan(Track, query, create_client, segments=2, max_workers=2)
+    )
+
+    # then
+    assert len({(item.artist_name, item.track_name) for item in result}) == 200
+
+
+def test_can_reduce_segments_in_processes(
+    readonly_dynamodb_client, readonly_table, tracks_with_artists_json
+) -> None:
+    # given
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = sum(
+        tracks.process_scan(create_client, segments=3, reducer=count_genres),
+        Counter(),
+    )
+
+    # then
+    assert result == Counter(
+        item["genre_name"] for item in tracks_with_artists_json
+    )
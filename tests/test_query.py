@@ -5,7 +5,7 @@ import pytest
 from mypy_boto3_dynamodb import DynamoDBClient
 
 from amano import Attribute, Item, Table
-from amano.errors import AmanoDBError, ReadError
+from amano.errors import AmanoDBError, QueryError, ReadError
 
 
 def test_can_query_item_by_pk_and_sk(
@@ -105,6 +105,41 @@ def test_query_table_with_pk_and_sk(
     assert len(all_items) == 2
 
 
+def test_query_table_when_placeholder_contains_operator(
+    readonly_dynamodb_client, readonly_table, monkeypatch
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+
+    monkeypatch.setattr("amano.condition._param_suffix", lambda: "_kORx1")
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = my_table.query(Track.artist_name == "AC/DC").fetch()
+
+    # then
+    assert len(result) == 18
+
+
+def test_fail_query_with_or_in_key_condition(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # then
+    with pytest.raises(QueryError):
+        my_table.query(
+            (Track.artist_name == "AC/DC") | (Track.artist_name == "Tool")
+        )
+
+
 def test_query_table_with_pk_and_filter(
     readonly_dynamodb_client, readonly_table
 ) -> None:
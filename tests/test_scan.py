@@ -1,7 +1,12 @@
+import time
 from dataclasses import dataclass
 from typing import Iterable
 
+import pytest
+
 from amano import Attribute, Item, Table
+from amano.constants import SEGMENT_THREAD_NAME_PREFIX
+from amano.errors import CursorError
 
 
 def test_scan_table(readonly_dynamodb_client, readonly_table) -> None:
@@ -136,3 +141,140 @@ def test_scan_table_with_index(
         assert isinstance(item, Track)
 
     assert len(all_items) == 200
+
+
+def test_parallel_scan_table(readonly_dynamodb_client, readonly_table) -> None:
+    # given
+    @dataclass
+    class Track(Item):
+        artist_name: Attribute[str]
+        track_name: Attribute[str]
+        album_name: Attribute[str]
+        genre_name: Attribute[str]
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = my_table.scan(limit=20, segments=4)
+
+    # then
+    assert isinstance(result, Iterable)
+    assert result.count() == 200
+
+    all_keys = set()
+    for item in result:
+        assert isinstance(item, Track)
+        all_keys.add((item.artist_name, item.track_name))
+
+    assert len(all_keys) == 200
+    assert result.consumed_capacity > 0
+
+
+def test_parallel_scan_table_with_filter(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    @dataclass
+    class Track(Item):
+        artist_name: Attribute[str]
+        track_name: Attribute[str]
+        album_name: Attribute[str]
+        genre_name: Attribute[str]
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    result = my_table.scan(
+        (Track.artist_name == "AC/DC") & (Track.genre_name.startswith("R")),
+        segments=3,
+        max_workers=2,
+    )
+
+    # then
+    assert result.count() == 18
+    assert len(list(result)) == 18
+
+
+def test_can_close_parallel_scan_early(counting_client, readonly_table) -> None:
+    # given
+    @dataclass
+    class Track(Item):
+        artist_name: Attribute[str]
+        track_name: Attribute[str]
+        album_name: Attribute[str]
+        genre_name: Attribute[str]
+
+    my_table = Table[Track](counting_client, readonly_table)
+    result = my_table.scan(limit=5, segments=4)
+
+    # when
+    fetched = result.fetch(7)
+    time.sleep(0.3)
+    scan_calls = counting_client.calls["scan"]
+    time.sleep(0.3)
+
+    # then
+    assert len(fetched) == 7
+    assert all(isinstance(item, Track) for item in fetched)
+    assert counting_client.calls["scan"] == scan_calls
+    assert scan_calls < 40
+
+
+def test_breaking_parallel_scan_loop_stops_segments(
+    readonly_dynamodb_client, readonly_table, running_threads
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+
+    # when
+    for _ in my_table.scan(limit=5, segments=8):
+        break
+
+    # then
+    assert running_threads(SEGMENT_THREAD_NAME_PREFIX) == []
+
+
+def test_raising_in_parallel_scan_loop_stops_segments(
+    readonly_dynamodb_client, readonly_table, running_threads
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+    cursor = my_table.scan(limit=5, segments=4)
+
+    # when
+    with pytest.raises(RuntimeError):
+        for _ in cursor:
+            raise RuntimeError()
+
+    # then
+    assert running_threads(SEGMENT_THREAD_NAME_PREFIX) == []
+
+
+def test_fetch_consumes_parallel_scan(
+    readonly_dynamodb_client, readonly_table
+) -> None:
+    # given
+    @dataclass
+    class Track(Item):
+        artist_name: Attribute[str]
+        track_name: Attribute[str]
+        album_name: Attribute[str]
+        genre_name: Attribute[str]
+
+    my_table = Table[Track](readonly_dynamodb_client, readonly_table)
+    result = my_table.scan(limit=5, segments=4)
+
+    # when
+    result.fetch(7)
+
+    # then
+    with pytest.raises(CursorError):
+        list(result)
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from amano import ClientPool, Item, Table
+
+THREADS = 8
+ITERATIONS = 10
+
+
+class Track(Item):
+    artist_name: str
+    track_name: str
+    album_name: str
+    genre_name: str
+
+
+def test_condition_placeholders_are_unique_across_threads() -> None:
+    # given
+    barrier = Barrier(THREADS)
+
+    def build_conditions(thread: int):
+        barrier.wait()
+        return [
+            name
+            for _ in range(1000)
+            for name in (Track.artist_name == f"Artist {thread}").parameters
+        ]
+
+    # when
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        names = [
+            name
+            for result in pool.map(build_conditions, range(THREADS))
+            for name in result
+        ]
+
+    # then
+    assert len(names) == len(set(names)) == THREADS * 1000
+
+
+def test_client_pool_spreads_requests_over_clients(
+    client_proxy, readonly_table
+) -> None:
+    # given
+    clients = []
+
+    def client_factory():
+        clients.append(client_proxy())
+        return clients[-1]
+
+    tracks = Table[Track](ClientPool(client_factory, 3), readonly_table)
+
+    # when
+    for _ in range(6):
+        tracks.get("AC/DC", "Let There Be Rock")
+
+    # then
+    assert len(clients) == 3
+    assert [client.calls["get_item"] for client in clients] == [2, 2, 2]
+
+
+def test_fail_to_create_empty_client_pool(readonly_dynamodb_client) -> None:
+    with pytest.raises(ValueError):
+        ClientPool(lambda: readonly_dynamodb_client, 0)
+
+
+def test_table_can_be_shared_by_many_threads(
+    default_client_proxy, default_table
+) -> None:
+    # given
+    clients = []
+
+    def client_factory():
+        clients.append(default_client_proxy())
+        return clients[-1]
+
+    tracks = Table[Track](ClientPool(client_factory, 4), default_table)
+    barrier = Barrier(THREADS)
+
+    def work(thread: int):
+        artist_name = f"Artist {thread}"
+        barrier.wait()
+        mismatches = []
+        for iteration in range(ITERATIONS):
+            track = Track(
+                artist_name, f"Track {iteration}", f"Album {thread}", "Rock"
+            )
+            tracks.put(track)
+            stored = tracks.get(artist_name, f"Track {iteration}")
+            if (stored.artist_name, stored.album_name) != (
+                artist_name,
+                f"Album {thread}",
+            ):
+                mismatches.append(stored)
+            result = tracks.query(
+                Track.artist_name == artist_name,
+                Track.album_name == f"Album {thread}",
+            ).fetch()
+            if len(result) != iteration + 1 or any(
+                item.artist_name != artist_name for item in result
+            ):
+                mismatches.append(result)
+        return mismatches
+
+    # when
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        mismatches = [
+            mismatch
+            for result in pool.map(work, range(THREADS))
+            for mismatch in result
+        ]
+
+    # then
+    assert mismatches == []
+    assert all(client.calls["put_item"] > 0 for client in clients)
+    assert sum(client.calls["put_item"] for client in clients) == (
+        THREADS * ITERATIONS
+    )
+    assert tracks.capacity.by_operation()["PutItem"].write > 0
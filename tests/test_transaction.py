@@ -0,0 +1,256 @@
+import pytest
+
+from amano import Item, MissingKey, Table, transact_get
+from amano.errors import TransactionCanceledError, TransactionError
+from amano.item import ItemState, get_item_state
+
+
+def test_can_save_items_in_transaction(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    items = [
+        Track("Tool", "Reflection", "Lateralus"),
+        Track("Tool", "Sober", "Undertow"),
+    ]
+
+    # when
+    with tracks.transaction() as tx:
+        for item in items:
+            tx.save(item)
+
+    # then
+    assert all(get_item_state(item) == ItemState.CLEAN for item in items)
+    assert (
+        len(tracks.batch_get([("Tool", "Reflection"), ("Tool", "Sober")])) == 2
+    )
+
+
+def test_can_update_and_delete_items_in_transaction(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    reflection = Track("Tool", "Reflection", "Lateralus")
+    sober = Track("Tool", "Sober", "Undertow")
+    tracks.put(reflection)
+    tracks.put(sober)
+
+    # when
+    reflection.album_name = "Lateralus (Remastered)"
+    with tracks.transaction() as tx:
+        tx.save(reflection)
+        tx.delete(sober)
+
+    # then
+    result = tracks.batch_get(
+        [("Tool", "Reflection"), ("Tool", "Sober")],
+        on_missing=MissingKey.RETURN_NONE,
+    )
+    assert result[0].album_name == "Lateralus (Remastered)"
+    assert result[1] is None
+
+
+def test_transaction_is_canceled_when_check_fails(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    reflection = Track("Tool", "Reflection", "Lateralus")
+    sober = Track("Tool", "Sober", "Undertow")
+    tracks.put(reflection)
+    tracks.put(sober)
+
+    # when
+    with pytest.raises(TransactionCanceledError) as e:
+        with tracks.transaction() as tx:
+            tx.check(reflection, Track.album_name == "Undertow")
+            tx.delete(sober)
+
+    # then
+    assert e.value.reasons[0]["Code"] == "ConditionalCheckFailed"
+    assert (
+        len(tracks.batch_get([("Tool", "Reflection"), ("Tool", "Sober")])) == 2
+    )
+
+
+def test_fail_transaction_with_too_many_actions(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+
+    # when
+    tx = tracks.transaction()
+    for i in range(101):
+        tx.delete(Track("Tool", f"Track {i}", "Lateralus"))
+
+    # then
+    with pytest.raises(TransactionError):
+        tx.execute()
+
+
+def test_transaction_retries_conflicts(
+    conflicting_client, default_table, no_backoff
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = conflicting_client()
+    tracks = Table[Track](client, default_table)
+    item = Track("Tool", "Reflection", "Lateralus")
+
+    # when
+    with tracks.transaction() as tx:
+        tx.save(item)
+
+    # then
+    assert client.calls["transact_write_items"] == 2
+    assert tracks.get("Tool", "Reflection")
+
+
+def test_fail_transaction_when_conflict_retries_are_exhausted(
+    conflicting_client, default_table, no_backoff
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = conflicting_client(conflicts=10)
+    tracks = Table[Track](client, default_table)
+    item = Track("Tool", "Reflection", "Lateralus")
+
+    # when
+    with pytest.raises(TransactionCanceledError):
+        with tracks.transaction(max_retries=2) as tx:
+            tx.save(item)
+
+    # then
+    assert client.calls["transact_write_items"] == 3
+    assert get_item_state(item) == ItemState.NEW
+
+
+def test_can_transact_get_items_from_many_tables(
+    readonly_dynamodb_client,
+    readonly_table,
+    default_dynamodb_client,
+    default_table,
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    class Favourite(Item):
+        artist_name: str
+        track_name: str
+        rating: int
+
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    favourites = Table[Favourite](default_dynamodb_client, default_table)
+    favourites.put(Favourite("Accept", "Balls to the Wall", 5))
+
+    # when
+    track_items, favourite_items = transact_get(
+        (tracks, [("Accept", "Balls to the Wall"), ("Accept", "Unknown")]),
+        (favourites, [("Accept", "Balls to the Wall")]),
+    )
+
+    # then
+    assert isinstance(track_items[0], Track)
+    assert track_items[0].album_name
+    assert track_items[1] is None
+    assert isinstance(favourite_items[0], Favourite)
+    assert favourite_items[0].rating == 5
+
+
+def test_can_transact_get_items_in_chunks(
+    readonly_dynamodb_client,
+    readonly_table,
+    tracks_with_artists_json,
+    monkeypatch,
+) -> None:
+    # given
+    monkeypatch.setattr("amano.transaction.TRANSACT_ITEMS_LIMIT", 25)
+
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    keys = [
+        (item["artist_name"], item["track_name"])
+        for item in tracks_with_artists_json[:60]
+    ]
+
+    # when
+    (result,) = transact_get((tracks, keys))
+
+    # then
+    assert [(item.artist_name, item.track_name) for item in result] == keys
+
+
+def test_fail_transaction_check_with_invalid_condition(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    item = Track("Tool", "Reflection", "Lateralus")
+
+    # then
+    with pytest.raises(ValueError):
+        tracks.transaction().check(item, "album_name = Lateralus")
+
+
+def test_fail_transact_get_from_tables_with_different_clients(
+    readonly_dynamodb_client, readonly_table, counting_client
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    tracks = Table[Track](readonly_dynamodb_client, readonly_table)
+    counted_tracks = Table[Track](counting_client, readonly_table)
+
+    # then
+    with pytest.raises(ValueError):
+        transact_get(
+            (tracks, [("Accept", "Balls to the Wall")]),
+            (counted_tracks, [("Accept", "Balls to the Wall")]),
+        )
+    assert counting_client.calls["transact_get_items"] == 0
@@ -105,3 +105,54 @@ def test_ignore_update_for_non_modified_item(
 
     # then
     assert get_item_state(track) == ItemState.CLEAN
+
+
+def test_can_remove_attribute_with_update(
+    default_dynamodb_client, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+        genre_name: str
+
+    tracks = Table[Track](default_dynamodb_client, default_table)
+    tracks.put(Track("AC/DC", "Let There Be Rock", "Let There Be Rock", "Rock"))
+    track = tracks.get("AC/DC", "Let There Be Rock")
+
+    # when
+    del track.genre_name
+    success = tracks.update(track)
+
+    # then
+    assert success
+    assert get_item_state(track) == ItemState.CLEAN
+    track = tracks.get("AC/DC", "Let There Be Rock")
+    assert "genre_name" not in track.__dict__
+
+
+def test_skip_update_when_values_are_not_changed(
+    default_client_proxy, default_table
+) -> None:
+    # given
+    class Track(Item):
+        artist_name: str
+        track_name: str
+        album_name: str
+
+    client = default_client_proxy()
+    tracks = Table[Track](client, default_table)
+    tracks.put(Track("AC/DC", "Let There Be Rock", "Let There Be Rock"))
+    track = tracks.get("AC/DC", "Let There Be Rock")
+
+    # when
+    track.album_name = "Highway to Hell"
+    track.album_name = "Let There Be Rock"
+    saved = tracks.save(track)
+    updated = tracks.update(track)
+
+    # then
+    assert not saved and not updated
+    assert get_item_state(track) == ItemState.CLEAN
+    assert client.calls["update_item"] == 0